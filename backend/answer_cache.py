@@ -0,0 +1,89 @@
+"""Cache of concise read-aloud answers, keyed by (command, execution result)."""
+
+import hashlib
+import sqlite3
+import time
+from typing import Dict, Optional
+
+from config import ANSWER_CACHE_ENABLED
+from execution_history import get_db_connection
+
+# Cached answers expire after 7 days
+ANSWER_CACHE_EXPIRY_SECONDS = 7 * 24 * 60 * 60
+
+# Keep at most this many answers; the oldest are dropped first
+ANSWER_CACHE_MAX_ENTRIES = 1000
+
+# Hit/miss counters for this process
+CACHE_STATS: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def init_answer_cache():
+    """Initialize the answer cache table."""
+    with get_db_connection() as conn:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS answer_cache (
+                key TEXT PRIMARY KEY,
+                answer TEXT NOT NULL,
+                created_at REAL NOT NULL
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_answer_cache_created
+            ON answer_cache(created_at)
+        """)
+
+
+def answer_cache_key(original_command: str, execution_result: str, model: str = "") -> str:
+    """Hash a command, its result and the answering model into a cache key."""
+    return hashlib.sha256(f"{model}\x00{original_command}\x00{execution_result}".encode("utf-8")).hexdigest()
+
+
+def get_cached_answer(key: str) -> Optional[str]:
+    """Return the cached answer for `key`, or None on a miss (or if caching is disabled)."""
+    if not ANSWER_CACHE_ENABLED:
+        return None
+
+    try:
+        with get_db_connection() as conn:
+            row = conn.execute(
+                "SELECT answer FROM answer_cache WHERE key = ? AND created_at > ?",
+                (key, time.time() - ANSWER_CACHE_EXPIRY_SECONDS)
+            ).fetchone()
+    except sqlite3.Error as e:
+        print(f"Error reading answer cache: {e}")
+        row = None
+
+    CACHE_STATS["hits" if row else "misses"] += 1
+    return row[0] if row else None
+
+
+def store_answer(key: str, answer: str) -> None:
+    """Cache an answer, evicting expired and excess entries."""
+    if not ANSWER_CACHE_ENABLED:
+        return
+
+    now = time.time()
+    try:
+        with get_db_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO answer_cache (key, answer, created_at) VALUES (?, ?, ?)",
+                (key, answer, now)
+            )
+            conn.execute(
+                "DELETE FROM answer_cache WHERE created_at <= ?",
+                (now - ANSWER_CACHE_EXPIRY_SECONDS,)
+            )
+            conn.execute("""
+                DELETE FROM answer_cache WHERE created_at <= (
+                    SELECT created_at FROM answer_cache
+                    ORDER BY created_at DESC
+                    LIMIT 1 OFFSET ?
+                )
+            """, (ANSWER_CACHE_MAX_ENTRIES,))
+    except sqlite3.Error as e:
+        print(f"Error writing answer cache: {e}")
+
+
+# Initialize the table on module import
+init_answer_cache()
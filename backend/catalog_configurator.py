@@ -59,8 +59,7 @@ class CatalogConfigurator:
         # Check for duplicate connections - prevent multiple connections to the same MCP server
         # unless we're updating an existing server (payload has an 'id')
         if not payload.get("id"):
-            existing_servers = self.manager.list_servers()
-            for server in existing_servers:
+            for server in self.manager.servers_view.values():
                 source = server.get("source", {})
                 if source.get("type") == "catalog" and source.get("catalogId") == entry_id:
                     raise MCPConfigError(
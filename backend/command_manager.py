@@ -1,14 +1,36 @@
 """Command management with CRUD operations and Claude tool conversion."""
 
-import json
+import atexit
 import os
 import re
+import threading
 import uuid
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+
 from config import COMMANDS_FILE
 from mcp_client import MCPConfigError, get_mcp_manager
 
+# Saves within this window (seconds) are coalesced into one disk write
+SAVE_DEBOUNCE_SECONDS = 0.25
+
+# Characters not allowed in Claude tool property keys / tool names
+_INVALID_PARAM_CHARS = re.compile(r'[^a-zA-Z0-9_.-]')
+_INVALID_TOOL_NAME_CHARS = re.compile(r'[^a-zA-Z0-9_-]')
+_UNDERSCORE_RUNS = re.compile(r'_+')
+
+# Command parameter type -> JSON schema type (unknown types map to 'string')
+_PARAM_TYPE_MAP = {
+    'string': 'string',
+    'number': 'number',
+    'integer': 'integer',
+    'boolean': 'boolean',
+    'email': 'string',
+    'url': 'string',
+    'options': 'string',
+}
+
 
 class CommandManager:
     """Manages user-defined commands with CRUD operations."""
@@ -17,16 +39,28 @@ class CommandManager:
         self.commands_file = commands_file
         self.commands: Dict[str, Dict] = {}
         self._tool_name_map: Dict[str, str] = {}
+        # Bumped whenever commands are loaded or changed, so callers can key
+        # caches derived from the tool list (e.g. parsed transcripts) on it
+        self.tools_version = 0
+        # (mcp tools_version, virtual commands, virtual commands by id)
+        self._virtual_cache: Optional[Tuple[int, List[Dict], Dict[str, Dict]]] = None
+        # (tools_version, virtual commands list it was built from, tools, tool name map)
+        self._tools_cache: Optional[Tuple[int, List[Dict], List[Dict], Dict[str, str]]] = None
+        # Pending debounced write (see save_commands)
+        self._save_lock = threading.Lock()
+        self._save_timer: Optional[threading.Timer] = None
+        atexit.register(self.flush)
         self.load_commands()
     
     def load_commands(self) -> None:
         """Load commands from JSON file."""
+        self.tools_version += 1
         if os.path.exists(self.commands_file):
             try:
-                with open(self.commands_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.commands_file, 'rb') as f:
+                    data = orjson.loads(f.read())
                     self.commands = data if isinstance(data, dict) else {}
-            except (json.JSONDecodeError, IOError) as e:
+            except (orjson.JSONDecodeError, IOError) as e:
                 print(f"Warning: Could not load commands file: {e}")
                 self.commands = {}
         else:
@@ -39,12 +73,37 @@ class CommandManager:
             self._add_default_command()
     
     def save_commands(self) -> None:
-        """Save commands to JSON file."""
-        try:
-            with open(self.commands_file, 'w') as f:
-                json.dump(self.commands, f, indent=2)
-        except IOError as e:
-            print(f"Error: Could not save commands file: {e}")
+        """
+        Save commands to JSON file.
+        
+        The write is debounced: a burst of edits from the web UI (e.g. several
+        toggles) results in a single write SAVE_DEBOUNCE_SECONDS after the last
+        one. Pending writes are flushed at exit.
+        """
+        self.tools_version += 1
+        with self._save_lock:
+            if self._save_timer is not None:
+                self._save_timer.cancel()
+            self._save_timer = threading.Timer(SAVE_DEBOUNCE_SECONDS, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+    
+    def flush(self) -> None:
+        """Write commands to disk now if a save is pending."""
+        with self._save_lock:
+            if self._save_timer is None:
+                return
+            self._save_timer.cancel()
+            self._save_timer = None
+            # Write to a temp file and swap it in, so a crash mid-write never
+            # leaves a truncated commands file
+            tmp_path = self.commands_file + ".tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(orjson.dumps(self.commands, option=orjson.OPT_INDENT_2))
+                os.replace(tmp_path, self.commands_file)
+            except (IOError, TypeError) as e:
+                print(f"Error: Could not save commands file: {e}")
     
     def get_all_commands(self, include_virtual: bool = False) -> List[Dict]:
         """Get all commands as a list."""
@@ -64,11 +123,13 @@ class CommandManager:
         """Get a specific command by ID."""
         if command_id in self.commands:
             return self.commands.get(command_id)
-        # Check virtual commands
-        for command in self._get_virtual_mcp_commands():
-            if command['id'] == command_id:
-                return command
-        return None
+        # Check virtual commands (indexed by id alongside the cached list)
+        virtual = self._get_virtual_mcp_commands()
+        cached = self._virtual_cache
+        if cached and cached[1] is virtual:
+            return cached[2].get(command_id)
+        # Another thread rebuilt the cache in between; search the list we got
+        return next((cmd for cmd in virtual if cmd['id'] == command_id), None)
     
     def add_command(self, command_data: Dict) -> Dict:
         """Add a new command."""
@@ -294,15 +355,26 @@ class CommandManager:
         Returns:
             List of tool definitions for Claude API
         """
+        virtual = self._get_virtual_mcp_commands()
+        cached = self._tools_cache
+        if cached and cached[0] == self.tools_version and cached[1] is virtual:
+            self._tool_name_map = cached[3]
+            return cached[2]
+        
+        version = self.tools_version
         tools: List[Dict] = []
-        self._tool_name_map = {}
+        tool_name_map: Dict[str, str] = {}
         
-        for command in self.get_enabled_commands(include_virtual=True):
-            tool_name = self._generate_tool_name(command['id'])
+        enabled = [cmd for cmd in self.commands.values() if cmd.get('enabled', True)]
+        enabled.extend(cmd for cmd in virtual if cmd.get('enabled', True))
+        for command in enabled:
+            tool_name = self._generate_tool_name(command['id'], tool_name_map)
             tool = self._command_to_tool(command, tool_name=tool_name)
-            self._tool_name_map[tool_name] = command['id']
+            tool_name_map[tool_name] = command['id']
             tools.append(tool)
         
+        self._tool_name_map = tool_name_map
+        self._tools_cache = (version, virtual, tools, tool_name_map)
         return tools
     
     def resolve_tool_command_id(self, tool_name: str) -> str:
@@ -324,11 +396,11 @@ class CommandManager:
             Sanitized parameter name
         """
         # Replace spaces and invalid characters with underscores
-        sanitized = re.sub(r'[^a-zA-Z0-9_.-]', '_', name)
+        sanitized = _INVALID_PARAM_CHARS.sub('_', name)
         # Remove leading/trailing underscores
         sanitized = sanitized.strip('_')
         # Collapse multiple underscores into one
-        sanitized = re.sub(r'_+', '_', sanitized)
+        sanitized = _UNDERSCORE_RUNS.sub('_', sanitized)
         # Limit to 64 characters
         sanitized = sanitized[:64]
         return sanitized if sanitized else 'param'
@@ -389,19 +461,20 @@ class CommandManager:
             "input_schema": input_schema
         }
     
-    def _generate_tool_name(self, command_id: str) -> str:
+    def _generate_tool_name(self, command_id: str, tool_name_map: Dict[str, str]) -> str:
         """
-        Sanitize a command ID for Claude's tool name requirements and ensure uniqueness.
+        Sanitize a command ID for Claude's tool name requirements and ensure
+        uniqueness against the names already in `tool_name_map`.
         """
-        base = re.sub(r'[^a-zA-Z0-9_-]', '_', command_id)
-        base = re.sub(r'_+', '_', base).strip('_')
+        base = _INVALID_TOOL_NAME_CHARS.sub('_', command_id)
+        base = _UNDERSCORE_RUNS.sub('_', base).strip('_')
         if not base:
             base = "tool"
         base = base[:120]
         
         candidate = base
         suffix = 1
-        while candidate in self._tool_name_map and self._tool_name_map[candidate] != command_id:
+        while candidate in tool_name_map and tool_name_map[candidate] != command_id:
             suffix_str = f"_{suffix}"
             available = 128 - len(suffix_str)
             trimmed = base[:max(1, available)]
@@ -411,24 +484,18 @@ class CommandManager:
     
     def _map_param_type(self, param_type: str) -> str:
         """Map parameter type to JSON schema type."""
-        type_mapping = {
-            'string': 'string',
-            'number': 'number',
-            'integer': 'integer',
-            'boolean': 'boolean',
-            'email': 'string',
-            'url': 'string',
-            'options': 'string',
-        }
-        return type_mapping.get(param_type, 'string')
+        return _PARAM_TYPE_MAP.get(param_type, 'string')
 
     # ------------------------------------------------------------------
     # MCP virtual commands
     # ------------------------------------------------------------------
     def _get_virtual_mcp_commands(self) -> List[Dict]:
         """Return command definitions for each discovered MCP tool."""
+        manager = get_mcp_manager()
+        # Read the version first: a refresh racing with us then just forces a rebuild
+        version = manager.tools_version
         try:
-            tool_entries = get_mcp_manager().list_tools()
+            tool_entries = manager.list_tools()
         except MCPConfigError as exc:
             print(f"Warning: Unable to load MCP tools: {exc}")
             return []
@@ -436,6 +503,10 @@ class CommandManager:
             print(f"Warning: Unexpected MCP error: {exc}")
             return []
 
+        cached = self._virtual_cache
+        if cached and cached[0] == manager.tools_version:
+            return cached[1]
+
         commands: List[Dict] = []
         for entry in tool_entries:
             tool = entry.get('tool') or {}
@@ -445,7 +516,7 @@ class CommandManager:
                 continue
 
             tool_name = tool['name']
-            safe_tool_name = re.sub(r'[^a-zA-Z0-9_.-]', '_', tool_name)
+            safe_tool_name = _INVALID_PARAM_CHARS.sub('_', tool_name)
             command_id = f"mcp.{server_id}.{safe_tool_name}"
             description = tool.get('description') or f"MCP tool '{tool_name}' from {server_name}"
 
@@ -466,6 +537,7 @@ class CommandManager:
                 "source": "mcp",
             }
             commands.append(command)
+        self._virtual_cache = (version, commands, {command['id']: command for command in commands})
         return commands
 
     def _build_parameters_from_schema(self, schema: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -531,11 +603,19 @@ class CommandManager:
 
 # Global instance
 _manager = None
+_manager_lock = threading.Lock()
 
 def get_command_manager() -> CommandManager:
-    """Get the global CommandManager instance."""
+    """
+    Get the global CommandManager instance.
+    
+    Created once, thread-safely: a second instance would load commands.json
+    separately and register its own atexit flush.
+    """
     global _manager
     if _manager is None:
-        _manager = CommandManager()
+        with _manager_lock:
+            if _manager is None:
+                _manager = CommandManager()
     return _manager
 
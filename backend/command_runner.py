@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from typing import Any, Dict, Optional, Tuple
-import threading
 import subprocess
 
 from command_manager import get_command_manager
@@ -45,6 +44,7 @@ def execute_with_logging(
     timeout: Optional[int] = None,
     confirm_mode: bool = False,
     original_transcript: Optional[str] = None,
+    log_id: Optional[int] = None,
 ) -> Tuple[ExecutionResult, int, Optional[Dict[str, Any]]]:
     """
     Execute a command and synchronize the execution_history table.
@@ -56,6 +56,7 @@ def execute_with_logging(
         timeout: Optional timeout override
         confirm_mode: Whether to request confirmation
         original_transcript: Original user command transcript for read-aloud feature
+        log_id: Existing 'running' log entry to fill in (one is created if omitted)
 
     Returns:
         (ExecutionResult, log_id, command dict)
@@ -70,7 +71,8 @@ def execute_with_logging(
     command_timeout = command_obj.get('timeout') if command_obj else None
     effective_timeout = timeout if timeout is not None else command_timeout
 
-    log_id = start_execution_log(command_id, command_name, parameters)
+    if log_id is None:
+        log_id = start_execution_log(command_id, command_name, parameters)
     result = execute(
         command_id=command_id,
         parameters=parameters,
@@ -86,19 +88,12 @@ def execute_with_logging(
 
     # Check if we should read results out loud
     if command_obj and command_obj.get('read_aloud', False) and original_transcript:
-        # Run text-to-speech in a background thread so it doesn't block
-        def speak_in_background():
-            try:
-                process_and_speak_result(
-                    original_command=original_transcript,
-                    execution_result=result.to_dict(),
-                    command_name=command_name
-                )
-            except Exception as e:
-                print(f"Error in read-aloud background thread: {e}")
-        
-        thread = threading.Thread(target=speak_in_background, daemon=True)
-        thread.start()
+        # Queued on the read-aloud worker; doesn't block
+        process_and_speak_result(
+            original_command=original_transcript,
+            execution_result=result.to_dict(),
+            command_name=command_name
+        )
 
     return result, log_id, command_obj
 
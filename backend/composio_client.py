@@ -97,6 +97,9 @@ class ComposioClient:
             "X-API-Key": api_key,
             "Content-Type": "application/json",
         }
+        # Reused across REST calls so keep-alive connections survive between requests
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
         
         try:
             # Initialize official Composio SDK
@@ -113,11 +116,9 @@ class ComposioClient:
         params: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         url = f"{COMPOSIO_API_BASE}{path}"
-        headers = dict(self._headers)
-        response = requests.request(
+        response = self._session.request(
             method,
             url,
-            headers=headers,
             params=params,
             timeout=self.timeout,
         )
@@ -80,6 +80,7 @@ def _refresh_config_values() -> None:
     global ACTIVATION_WORD
     global OPTIMIZE_ACTIVATION_WORD
     global OPTIMIZE_LLM_MODEL
+    global TTS_SUMMARIZER_MODEL
     global POLL_INTERVAL
     global WEB_PORT
     global CONFIRM_MODE
@@ -90,6 +91,9 @@ def _refresh_config_values() -> None:
     global COMMANDS_FILE
     global DB_PATH
     global MCP_SERVERS_FILE
+    global MONITOR_STATE_FILE
+    global MONITOR_RESUME_WINDOW
+    global STATIC_CACHE_DIR
     global MCP_REGISTRY_BASE_URL
     global MCP_CATALOG_CACHE_FILE
     global MCP_CATALOG_CACHE_TTL
@@ -97,11 +101,15 @@ def _refresh_config_values() -> None:
     global MCP_REGISTRY_TIMEOUT
     global KEYRING_SERVICE
     global MCP_TOOL_CACHE_TTL
+    global SECRET_CACHE_TTL
     global LOGS_DIR
     global TTS_PROVIDER
     global CARTESIA_API_KEY
     global CARTESIA_MODEL_ID
     global CARTESIA_VOICE_ID
+    global CARTESIA_OUTPUT_FORMAT
+    global ANSWER_CACHE_ENABLED
+    global READ_ALOUD_STREAMING
     global WISPR_LOG_PATH
     global AUTO_VOLUME_REDUCTION_ENABLED
     global DICTATION_VOLUME_LEVEL
@@ -124,6 +132,10 @@ def _refresh_config_values() -> None:
     # LLM model for prompt optimization (can be different from parsing model)
     OPTIMIZE_LLM_MODEL = os.getenv("OPTIMIZE_LLM_MODEL", "claude-sonnet-4-20250514")
 
+    # LLM model for condensing results into read-aloud answers (short output, so a
+    # small fast model keeps time-to-first-audio low; set to LLM_MODEL to compare)
+    TTS_SUMMARIZER_MODEL = os.getenv("TTS_SUMMARIZER_MODEL", "claude-haiku-4-5")
+
     # Polling interval in seconds
     POLL_INTERVAL = float(os.getenv("POLL_INTERVAL", "1.5"))
 
@@ -152,6 +164,15 @@ def _refresh_config_values() -> None:
     # Database file (execution history, MCP catalog cache, etc.)
     DB_PATH = os.path.join(PROJECT_ROOT, "wispr_act.db")
 
+    # Last transcript the monitor handled, so a quick restart picks up
+    # anything dictated in between instead of skipping it
+    MONITOR_STATE_FILE = os.path.expanduser("~/.wispr-action/state.json")
+    # Only resume from a position saved at most this many seconds ago (0 disables)
+    MONITOR_RESUME_WINDOW = float(os.getenv("MONITOR_RESUME_WINDOW", "300"))
+
+    # Copy of web/ with precompressed .br/.gz sidecars, served by the web UI
+    STATIC_CACHE_DIR = os.path.expanduser("~/.wispr-action/static")
+
     # MCP server config file (no plaintext secrets)
     MCP_SERVERS_FILE = os.path.join(PROJECT_ROOT, "mcp_servers.json")
 
@@ -170,6 +191,9 @@ def _refresh_config_values() -> None:
     # Caching for MCP tool discovery (seconds)
     MCP_TOOL_CACHE_TTL = int(os.getenv("MCP_TOOL_CACHE_TTL", "300"))
 
+    # Memoization of individual keychain reads (seconds, 0 disables)
+    SECRET_CACHE_TTL = int(os.getenv("WISPR_SECRET_CACHE_TTL", "60"))
+
     # Logs directory (in project root)
     LOGS_DIR = os.path.join(PROJECT_ROOT, "logs")
     os.makedirs(LOGS_DIR, exist_ok=True)
@@ -179,6 +203,14 @@ def _refresh_config_values() -> None:
     CARTESIA_API_KEY = os.getenv("CARTESIA_API_KEY", "")
     CARTESIA_MODEL_ID = os.getenv("CARTESIA_MODEL_ID", "sonic-3")
     CARTESIA_VOICE_ID = os.getenv("CARTESIA_VOICE_ID", "a0e99841-438c-4a64-b679-ae501e7d6091")
+    CARTESIA_OUTPUT_FORMAT = os.getenv("CARTESIA_OUTPUT_FORMAT", "mp3").lower()  # "mp3" or "wav"
+
+    # Reuse read-aloud answers for a repeated (command, result) pair; set to 0 to disable
+    ANSWER_CACHE_ENABLED = os.getenv("WISPR_ANSWER_CACHE", "true").lower() not in ("0", "false")
+
+    # Stream read-aloud answers from Claude and speak them sentence by sentence
+    # (set to false to wait for the full answer, e.g. when debugging)
+    READ_ALOUD_STREAMING = os.getenv("READ_ALOUD_STREAMING", "true").lower() == "true"
 
     # Wispr Flow log file (used to detect dictation start/end)
     WISPR_LOG_PATH = os.path.expanduser(
@@ -237,6 +269,9 @@ def validate_config():
     if MCP_TOOL_CACHE_TTL < 0:
         errors.append(f"MCP_TOOL_CACHE_TTL must be non-negative, got: {MCP_TOOL_CACHE_TTL}")
     
+    if SECRET_CACHE_TTL < 0:
+        errors.append(f"WISPR_SECRET_CACHE_TTL must be non-negative, got: {SECRET_CACHE_TTL}")
+    
     if MCP_CATALOG_CACHE_TTL < 0:
         errors.append(f"MCP_CATALOG_CACHE_TTL must be non-negative, got: {MCP_CATALOG_CACHE_TTL}")
     
@@ -248,6 +283,9 @@ def validate_config():
     if TTS_PROVIDER not in ('apple', 'cartesia'):
         errors.append(f"TTS_PROVIDER must be 'apple' or 'cartesia', got: {TTS_PROVIDER}")
     
+    if CARTESIA_OUTPUT_FORMAT not in ('mp3', 'wav'):
+        errors.append(f"CARTESIA_OUTPUT_FORMAT must be 'mp3' or 'wav', got: {CARTESIA_OUTPUT_FORMAT}")
+    
     # Warn about missing Cartesia config if provider is cartesia
     if TTS_PROVIDER == 'cartesia' and not CARTESIA_API_KEY:
         errors.append("TTS_PROVIDER is set to 'cartesia' but CARTESIA_API_KEY is not set")
@@ -268,6 +306,7 @@ def get_config_summary():
         "has_api_key": bool(ANTHROPIC_API_KEY),
         "llm_model": LLM_MODEL,
         "optimize_llm_model": OPTIMIZE_LLM_MODEL,
+        "tts_summarizer_model": TTS_SUMMARIZER_MODEL,
         "auto_volume_reduction": AUTO_VOLUME_REDUCTION_ENABLED,
         "dictation_volume_level": DICTATION_VOLUME_LEVEL,
     }
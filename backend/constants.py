@@ -63,6 +63,7 @@ class HTTPStatus:
     """HTTP status codes."""
     OK = 200
     CREATED = 201
+    ACCEPTED = 202
     BAD_REQUEST = 400
     NOT_FOUND = 404
     INTERNAL_ERROR = 500
@@ -1,12 +1,15 @@
 """Execution history database management using SQLite."""
 
+import atexit
 import sqlite3
 import json
+import threading
 from datetime import datetime
 from typing import List, Dict, Optional
 from contextlib import contextmanager
 
 from config import DB_PATH
+from constants import ExecutionStatus
 
 
 @contextmanager
@@ -14,6 +17,9 @@ def get_db_connection():
     """Context manager for database connections."""
     conn = sqlite3.connect(DB_PATH)
     conn.row_factory = sqlite3.Row  # Enable column access by name
+    # In WAL mode NORMAL only syncs at checkpoints; still durable across app crashes
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA temp_store = MEMORY")
     try:
         yield conn
         conn.commit()
@@ -24,39 +30,101 @@ def get_db_connection():
         conn.close()
 
 
+# Bump when the execution_history table layout changes (stored in PRAGMA user_version)
+SCHEMA_VERSION = 1
+
+# Status is stored as a small integer; index into this tuple to get the name back
+STATUS_NAMES = tuple(status.value for status in ExecutionStatus)
+STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+_RUNNING = STATUS_CODES[ExecutionStatus.RUNNING.value]
+_COMPLETED = STATUS_CODES[ExecutionStatus.COMPLETED.value]
+_FAILED = STATUS_CODES[ExecutionStatus.FAILED.value]
+
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS execution_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        command_id TEXT NOT NULL,
+        command_name TEXT NOT NULL,
+        parameters TEXT,
+        status INTEGER NOT NULL DEFAULT 0,
+        success INTEGER,
+        output TEXT,
+        error TEXT,
+        duration REAL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+def _migrate_legacy_table(cursor: sqlite3.Cursor) -> None:
+    """Rebuild a pre-versioned table so that status is stored as an integer code."""
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(execution_history)")}
+    if 'status' in columns:
+        status_expr = f"""CASE status
+            WHEN '{ExecutionStatus.COMPLETED.value}' THEN {_COMPLETED}
+            WHEN '{ExecutionStatus.FAILED.value}' THEN {_FAILED}
+            ELSE {_RUNNING} END"""
+    else:
+        # Oldest schema had no status column; derive it from the success flag
+        status_expr = f"""CASE success
+            WHEN 1 THEN {_COMPLETED}
+            WHEN 0 THEN {_FAILED}
+            ELSE {_RUNNING} END"""
+
+    cursor.execute("BEGIN")
+    cursor.execute("ALTER TABLE execution_history RENAME TO execution_history_legacy")
+    cursor.execute(_CREATE_TABLE_SQL)
+    cursor.execute(f"""
+        INSERT INTO execution_history
+        (id, timestamp, command_id, command_name, parameters, status, success, output, error, duration, created_at)
+        SELECT id, timestamp, command_id, command_name, parameters, {status_expr},
+               success, output, error, duration, created_at
+        FROM execution_history_legacy
+    """)
+    cursor.execute("DROP TABLE execution_history_legacy")
+    print("✓ Migrated execution history to integer status codes")
+
+
 def init_database():
     """Initialize the execution history database."""
     with get_db_connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS execution_history (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
-                command_id TEXT NOT NULL,
-                command_name TEXT NOT NULL,
-                parameters TEXT,
-                status TEXT NOT NULL DEFAULT 'running',
-                success INTEGER,
-                output TEXT,
-                error TEXT,
-                duration REAL,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        
-        # Add status column if it doesn't exist (for existing databases)
-        try:
-            cursor.execute("ALTER TABLE execution_history ADD COLUMN status TEXT NOT NULL DEFAULT 'running'")
-        except:
-            pass  # Column already exists
+        # Persistent setting: readers (the web UI) no longer block the
+        # start/update writes, and each commit appends to the WAL instead of
+        # rewriting a rollback journal
+        cursor.execute("PRAGMA journal_mode = WAL")
+        version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        table_exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'execution_history'"
+        ).fetchone()
+        if table_exists and version < SCHEMA_VERSION:
+            _migrate_legacy_table(cursor)
+
+        cursor.execute(_CREATE_TABLE_SQL)
         
         # Create index on timestamp for faster queries
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_timestamp 
             ON execution_history(timestamp DESC)
         """)
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
         
         print(f"✓ Execution history database initialized at: {DB_PATH}")
+    
+    # Refresh planner statistics if they're missing or stale (0x10002: also
+    # look at tables that have never been analyzed; a cheap no-op otherwise)
+    optimize_database("PRAGMA optimize=0x10002")
+    atexit.register(optimize_database)
+
+
+def optimize_database(pragma: str = "PRAGMA optimize") -> None:
+    """Run PRAGMA optimize, ignoring errors (e.g. the database is locked)."""
+    try:
+        with get_db_connection() as conn:
+            conn.execute(pragma)
+    except sqlite3.Error:
+        pass
 
 
 def add_execution_log(log_entry: Dict, status: str = 'completed') -> int:
@@ -88,14 +156,16 @@ def add_execution_log(log_entry: Dict, status: str = 'completed') -> int:
             log_entry['command_id'],
             result.get('command_name', ''),
             json.dumps(log_entry.get('parameters', {})),
-            status,
-            1 if result.get('success') else 0,
+            STATUS_CODES[status],
+            int(bool(result.get('success'))),
             result.get('output', ''),
             result.get('error', ''),
             result.get('duration', 0.0)
         ))
-        
-        return cursor.lastrowid
+        log_id = cursor.lastrowid
+    
+    _invalidate_execution_count()
+    return log_id
 
 
 def start_execution_log(command_id: str, command_name: str, parameters: Dict) -> int:
@@ -116,18 +186,21 @@ def start_execution_log(command_id: str, command_name: str, parameters: Dict) ->
         cursor.execute("""
             INSERT INTO execution_history 
             (timestamp, command_id, command_name, parameters, status, success, output, error, duration)
-            VALUES (?, ?, ?, ?, 'running', NULL, '', '', 0.0)
+            VALUES (?, ?, ?, ?, ?, NULL, '', '', 0.0)
         """, (
             datetime.now().isoformat(),
             command_id,
             command_name,
-            json.dumps(parameters)
+            json.dumps(parameters),
+            _RUNNING
         ))
-        
-        return cursor.lastrowid
+        log_id = cursor.lastrowid
+    
+    _invalidate_execution_count()
+    return log_id
 
 
-def update_execution_log(log_id: int, result: Dict, keep_running: bool = False) -> bool:
+def update_execution_log(log_id: int, result: Dict, keep_running: bool = False) -> None:
     """
     Update an execution log with the final result.
     
@@ -135,17 +208,15 @@ def update_execution_log(log_id: int, result: Dict, keep_running: bool = False)
         log_id: ID of the log entry to update
         result: ExecutionResult dict with success, output, error, duration
         keep_running: If True, keep status as 'running' (for async commands)
-    
-    Returns:
-        True if updated successfully
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
         
+        success = bool(result.get('success'))
         if keep_running:
-            status = 'running'
+            status = _RUNNING
         else:
-            status = 'completed' if result.get('success') else 'failed'
+            status = _COMPLETED if success else _FAILED
         
         cursor.execute("""
             UPDATE execution_history 
@@ -157,14 +228,34 @@ def update_execution_log(log_id: int, result: Dict, keep_running: bool = False)
             WHERE id = ?
         """, (
             status,
-            1 if result.get('success') else 0,
+            int(success),
             result.get('output', ''),
             result.get('error', ''),
             result.get('duration', 0.0),
             log_id
         ))
-        
-        return cursor.rowcount > 0
+
+
+def _row_to_log(row: tuple) -> Dict:
+    """Build a log entry dict from a positional execution_history row."""
+    (log_id, timestamp, command_id, command_name, parameters,
+     status, success, output, error, duration) = row
+    return {
+        'id': log_id,
+        'timestamp': timestamp,
+        'command_id': command_id,
+        'parameters': json.loads(parameters) if parameters else {},
+        'result': {
+            'command_id': command_id,
+            'command_name': command_name,
+            'status': STATUS_NAMES[status],
+            'success': bool(success) if success is not None else None,
+            'output': output or '',
+            'error': error or '',
+            'duration': duration or 0.0,
+            'timestamp': timestamp
+        }
+    }
 
 
 def get_execution_logs(limit: int = 20, offset: int = 0) -> List[Dict]:
@@ -179,6 +270,8 @@ def get_execution_logs(limit: int = 20, offset: int = 0) -> List[Dict]:
         List of log entries as dictionaries
     """
     with get_db_connection() as conn:
+        # Plain tuples: positional unpacking is cheaper than sqlite3.Row lookups
+        conn.row_factory = None
         cursor = conn.cursor()
         cursor.execute("""
             SELECT 
@@ -198,32 +291,14 @@ def get_execution_logs(limit: int = 20, offset: int = 0) -> List[Dict]:
         """, (limit, offset))
         
         rows = cursor.fetchall()
-        
-        logs = []
-        for row in rows:
-            logs.append({
-                'id': row['id'],
-                'timestamp': row['timestamp'],
-                'command_id': row['command_id'],
-                'parameters': json.loads(row['parameters']) if row['parameters'] else {},
-                'result': {
-                    'command_id': row['command_id'],
-                    'command_name': row['command_name'],
-                    'status': row['status'],
-                    'success': bool(row['success']) if row['success'] is not None else None,
-                    'output': row['output'] or '',
-                    'error': row['error'] or '',
-                    'duration': row['duration'] or 0.0,
-                    'timestamp': row['timestamp']
-                }
-            })
-        
-        return logs
+        return [_row_to_log(row) for row in rows]
 
 
 def get_execution_log_by_id(log_id: int) -> Optional[Dict]:
     """Get a single execution log by ID."""
     with get_db_connection() as conn:
+        # Plain tuples: positional unpacking is cheaper than sqlite3.Row lookups
+        conn.row_factory = None
         cursor = conn.cursor()
         cursor.execute("""
             SELECT 
@@ -241,33 +316,42 @@ def get_execution_log_by_id(log_id: int) -> Optional[Dict]:
             WHERE id = ?
         """, (log_id,))
         row = cursor.fetchone()
-        if not row:
-            return None
-        return {
-            'id': row['id'],
-            'timestamp': row['timestamp'],
-            'command_id': row['command_id'],
-            'parameters': json.loads(row['parameters']) if row['parameters'] else {},
-            'result': {
-                'command_id': row['command_id'],
-                'command_name': row['command_name'],
-                'status': row['status'],
-                'success': bool(row['success']) if row['success'] is not None else None,
-                'output': row['output'] or '',
-                'error': row['error'] or '',
-                'duration': row['duration'] or 0.0,
-                'timestamp': row['timestamp']
-            }
-        }
+        return _row_to_log(row) if row else None
+
+
+# Row count cached for /api/logs polling; dropped (and the version bumped)
+# after every committed insert or delete. The version lets a reader that raced
+# with a write skip storing a stale count.
+_count_lock = threading.Lock()
+_cached_count: Optional[int] = None
+_count_version = 0
+
+
+def _invalidate_execution_count() -> None:
+    global _cached_count, _count_version
+    with _count_lock:
+        _cached_count = None
+        _count_version += 1
 
 
 def get_execution_count() -> int:
-    """Get total count of execution logs."""
+    """Get total count of execution logs (cached until the next write)."""
+    global _cached_count
+    with _count_lock:
+        if _cached_count is not None:
+            return _cached_count
+        version = _count_version
+    
     with get_db_connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) as count FROM execution_history")
         row = cursor.fetchone()
-        return row['count'] if row else 0
+        count = row['count'] if row else 0
+    
+    with _count_lock:
+        if version == _count_version:
+            _cached_count = count
+    return count
 
 
 def clear_old_logs(keep_count: int = 1000):
@@ -279,18 +363,26 @@ def clear_old_logs(keep_count: int = 1000):
     """
     with get_db_connection() as conn:
         cursor = conn.cursor()
+        # Take the write lock up front so the threshold can't shift under us
+        cursor.execute("BEGIN IMMEDIATE")
+        # ids are assigned in insert order, so the newest rows have the highest
+        # ids; find the first id past the window via the rowid index (no sort)
         cursor.execute("""
-            DELETE FROM execution_history
-            WHERE id NOT IN (
-                SELECT id FROM execution_history
-                ORDER BY timestamp DESC
-                LIMIT ?
-            )
+            SELECT id FROM execution_history
+            ORDER BY id DESC
+            LIMIT 1 OFFSET ?
         """, (keep_count,))
+        threshold = cursor.fetchone()
+        if not threshold:
+            return
+        
+        cursor.execute("DELETE FROM execution_history WHERE id <= ?", (threshold[0],))
         
         deleted_count = cursor.rowcount
-        if deleted_count > 0:
-            print(f"Cleared {deleted_count} old execution logs")
+    
+    if deleted_count > 0:
+        _invalidate_execution_count()
+        print(f"Cleared {deleted_count} old execution logs")
 
 
 # Initialize database on module import
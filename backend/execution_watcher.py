@@ -1,11 +1,13 @@
-"""Background watchers to finalize async script executions and set accurate duration."""
+"""Background watcher to finalize async script executions and set accurate duration."""
 
+import heapq
+import itertools
 import threading
 import time
 import os
 import subprocess
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from execution_history import update_execution_log, get_db_connection
 
@@ -52,77 +54,213 @@ def _finalize_log(log_id: int, base_result: Dict, success: Optional[bool] = None
     update_execution_log(log_id, final, keep_running=False)
 
 
-def _wait_for_pid(log_id: int, base_result: Dict, pid: int):
-    """Wait for a given PID to exit; then finalize log with duration and success if known."""
-    # Try to wait using waitpid (works for child processes)
+# Polling cadence for the shared watcher thread
+_PID_POLL_INTERVAL = 0.5
+_TERMINAL_POLL_INTERVAL = 0.6
+# Safety: do not track a Terminal window forever (~100 minutes)
+_TERMINAL_MAX_CHECKS = 10000
+# Delay before retrying a watch whose poll or DB update raised
+_RETRY_INTERVAL = 2.0
+
+
+class _Watch:
+    """A single running execution tracked by the reactor."""
+
+    __slots__ = ("log_id", "result", "pid", "window_id", "checks", "outcome")
+
+    def __init__(self, log_id: int, result: Dict, pid: Optional[int] = None,
+                 window_id: Optional[str] = None):
+        self.log_id = log_id
+        self.result = result
+        self.pid = pid
+        self.window_id = window_id
+        self.checks = 0
+        # Set once the execution has finished; kept so a failed DB update can
+        # be retried without polling again (a reaped PID loses its exit status)
+        self.outcome: Optional[bool] = None
+
+
+def _poll_pid(pid: int) -> Optional[bool]:
+    """
+    Check a PID without blocking.
+
+    Returns None while the process is still running, otherwise whether it
+    exited successfully (True when the exit status cannot be determined).
+    """
+    # Try waitpid first (works for child processes and gives us the exit status)
     try:
-        pid_ret, status = os.waitpid(pid, 0)
+        pid_ret, status = os.waitpid(pid, os.WNOHANG)
+        if pid_ret == 0:
+            return None
         if pid_ret == pid:
-            # Determine success by exit status if available
-            exited_successfully = os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
-            _finalize_log(log_id, base_result, success=exited_successfully)
-            return
+            return os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
     except ChildProcessError:
-        # Not a direct child; fall back to polling
+        # Not a direct child (or already reaped); fall back to probing
         pass
     except Exception:
-        # Unknown error; fall back to polling
         pass
 
-    # Fallback: poll for process existence using os.kill(pid, 0)
-    # Note: This cannot determine success/failure; we assume success when it ends
-    while True:
-        try:
-            # Signal 0 just checks existence
-            os.kill(pid, 0)
-            time.sleep(0.5)
-        except ProcessLookupError:
-            # Process no longer exists
-            _finalize_log(log_id, base_result, success=True)
-            return
-        except PermissionError:
-            # We cannot signal it; assume it exists, keep polling
-            time.sleep(0.5)
-        except Exception:
-            # Unknown error, finalize optimistically
-            _finalize_log(log_id, base_result, success=True)
+    # Fallback: signal 0 just checks existence; success cannot be determined
+    try:
+        os.kill(pid, 0)
+        return None
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        # We cannot signal it; assume it still exists
+        return None
+    except Exception:
+        # Unknown error, finalize optimistically
+        return True
+
+
+def _query_terminal_windows(window_ids: List[str]) -> Optional[Dict[str, Optional[bool]]]:
+    """
+    Ask Terminal for the busy state of several windows in one osascript call.
+
+    Returns a mapping of window id -> busy flag, with None for windows that no
+    longer exist. Windows whose state could not be read are left out, and the
+    whole result is None if the query itself failed (timeout, non-zero exit).
+    """
+    # Window ids are interpolated into the script; anything non-numeric is treated as missing
+    states: Dict[str, Optional[bool]] = {win_id: None for win_id in window_ids if not win_id.isdigit()}
+    numeric_ids = [win_id for win_id in window_ids if win_id.isdigit()]
+    if not numeric_ids:
+        return states
+    id_list = ", ".join(numeric_ids)
+    script = f"""tell application "Terminal"
+    set out to ""
+    set wids to {{{id_list}}}
+    repeat with i from 1 to count of wids
+        set wid to item i of wids
+        try
+            set out to out & wid & ":" & (busy of selected tab of (window id wid)) & linefeed
+        on error
+            set out to out & wid & ":missing" & linefeed
+        end try
+    end repeat
+    return out
+end tell"""
+    try:
+        proc = subprocess.run(['osascript', '-e', script], capture_output=True, text=True, timeout=3)
+    except Exception:
+        return None
+    if proc.returncode != 0:
+        return None
+    for line in (proc.stdout or '').splitlines():
+        win_id, _, state = line.strip().partition(':')
+        state = state.lower()
+        if win_id not in numeric_ids:
+            continue
+        if state in ('true', 'false'):
+            states[win_id] = state == 'true'
+        elif state == 'missing':
+            states[win_id] = None
+    return states
+
+
+class _WatchReactor:
+    """
+    One background thread that tracks every running script execution.
+
+    Watches are kept in a heap ordered by their next poll time. PID watches
+    are checked with non-blocking syscalls; all due Terminal watches share a
+    single osascript invocation.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[float, int, _Watch]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_watch(self, watch: _Watch) -> None:
+        with self._cond:
+            heapq.heappush(self._heap, (time.monotonic(), next(self._seq), watch))
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def _schedule(self, watch: _Watch, delay: float) -> None:
+        with self._cond:
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), watch))
+
+    def _pop_due(self) -> List[_Watch]:
+        """Block until at least one watch is due, then pop all due watches."""
+        with self._cond:
+            while True:
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+                delay = self._heap[0][0] - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                due = []
+                now = time.monotonic()
+                while self._heap and self._heap[0][0] <= now:
+                    due.append(heapq.heappop(self._heap)[2])
+                return due
+
+    def _run(self) -> None:
+        while True:
+            self._poll(self._pop_due())
+
+    def _poll(self, due: List[_Watch]) -> None:
+        terminal_watches = []
+        for watch in due:
+            if watch.outcome is not None:
+                self._step(watch, self._finish, watch.outcome)
+            elif watch.pid is not None:
+                self._step(watch, self._check_pid)
+            else:
+                terminal_watches.append(watch)
+
+        if not terminal_watches:
             return
 
+        states = _query_terminal_windows([watch.window_id for watch in terminal_watches])
+        for watch in terminal_watches:
+            self._step(watch, self._check_terminal, states)
 
-def _wait_for_terminal_window(log_id: int, base_result: Dict, window_id: str):
-    """Poll Terminal window busy status via osascript; finalize when not busy or window missing."""
-    def is_window_busy(win_id: str) -> Optional[bool]:
+    def _step(self, watch: _Watch, func, *args) -> None:
+        """Run one watch's poll/finalize step, retrying it later if it raises."""
         try:
-            script = f'tell application "Terminal" to get busy of selected tab of (window id {win_id})'
-            proc = subprocess.run(['osascript', '-e', script], capture_output=True, text=True, timeout=3)
-            if proc.returncode != 0:
-                return None  # window not found or error
-            out = (proc.stdout or '').strip().lower()
-            if out in ('true', 'false'):
-                return out == 'true'
-            return None
-        except Exception:
-            return None
+            func(watch, *args)
+        except Exception as e:
+            # Keep the watch, or its history row would stay 'running' forever
+            print(f"Execution watcher error for log {watch.log_id}: {e}")
+            self._schedule(watch, _RETRY_INTERVAL)
 
-    # Poll
-    idle_checks = 0
-    while True:
-        busy = is_window_busy(window_id)
-        # If not busy or window missing, we consider it finished
-        if busy is False or busy is None:
-            _finalize_log(log_id, base_result, success=True)
-            return
-        time.sleep(0.6)
-        idle_checks += 1
-        # Safety: do not spin forever; after long periods finalize anyway
-        if idle_checks > 10000:  # ~100 minutes
-            _finalize_log(log_id, base_result, success=True)
-            return
+    def _finish(self, watch: _Watch, success: bool) -> None:
+        watch.outcome = success
+        _finalize_log(watch.log_id, watch.result, success=success)
+
+    def _check_pid(self, watch: _Watch) -> None:
+        success = _poll_pid(watch.pid)
+        if success is None:
+            self._schedule(watch, _PID_POLL_INTERVAL)
+        else:
+            self._finish(watch, success)
+
+    def _check_terminal(self, watch: _Watch, states: Optional[Dict[str, Optional[bool]]]) -> None:
+        watch.checks += 1
+        # Idle or missing windows are finished; if the query failed or this
+        # window's state couldn't be read, try again next time
+        finished = states is not None and watch.window_id in states and not states[watch.window_id]
+        if finished or watch.checks > _TERMINAL_MAX_CHECKS:
+            self._finish(watch, True)
+        else:
+            self._schedule(watch, _TERMINAL_POLL_INTERVAL)
+
+
+_reactor = _WatchReactor()
 
 
 def start_script_completion_watcher(log_id: int, result: Dict):
     """
-    Start a background watcher to finalize 'running' script executions.
+    Register a 'running' script execution with the shared watcher thread.
     - Background: waits for PID to exit
     - Foreground (Terminal): polls window busy state
     """
@@ -131,16 +269,12 @@ def start_script_completion_watcher(log_id: int, result: Dict):
     window_id = meta.get('terminal_window_id')
 
     if pid:
-        t = threading.Thread(target=_wait_for_pid, args=(log_id, result, int(pid)), daemon=True)
-        t.start()
+        _reactor.add_watch(_Watch(log_id, result, pid=int(pid)))
         return
 
     if window_id:
-        t = threading.Thread(target=_wait_for_terminal_window, args=(log_id, result, str(window_id)), daemon=True)
-        t.start()
+        _reactor.add_watch(_Watch(log_id, result, window_id=str(window_id)))
         return
 
     # If no meta to track, nothing to do
     return
-
-
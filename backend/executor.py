@@ -1,70 +1,99 @@
 """Action execution engine for script and HTTP commands."""
 
+import atexit
+import codecs
 import subprocess
 import json
 import os
 import re
-import requests
+import shlex
 import threading
-from typing import Dict, Any, Optional, Tuple
+import time
+from dataclasses import dataclass, field
+from http.cookiejar import DefaultCookiePolicy
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from command_manager import get_command_manager
 from config import CONFIRM_MODE
 from constants import ActionType, HTTPMethod
-from dotenv import dotenv_values
-from mcp_client import MCPConfigError, MCPExecutionError, get_mcp_manager
 from typing import Optional as TypingOptional, Dict as TypingDict
 
 # ===== Constants =====
 TERMINAL_LAUNCH_TIMEOUT = 10  # Seconds to wait for terminal launch
 RESPONSE_TEXT_LIMIT = 500     # Character limit for HTTP response text
+RESPONSE_CHUNK_SIZE = 1024    # Bytes per read while streaming an HTTP response
 MONITOR_DELAY = 0.5            # Seconds between terminal monitor checks
 TERMINAL_CLOSE_DELAY = 5       # Grace period before closing the terminal window
 
+SUPPORTED_HTTP_METHODS = frozenset({'GET', 'POST', 'PUT', 'DELETE'})
+BODY_HTTP_METHODS = frozenset({'POST', 'PUT'})
 
+# Shared session so repeat calls to the same host reuse pooled connections.
+# Created on first HTTP action so requests is only imported when needed.
+_HTTP_SESSION = None
+_HTTP_SESSION_LOCK = threading.Lock()
+
+# Execution log files stay open in append mode between log_execution calls
+_LOG_FILES: Dict[str, Any] = {}
+_LOG_FILES_LOCK = threading.Lock()
+
+# Single-pass escaping tables for escape_for_applescript
+_APPLESCRIPT_DQ_TRANS = str.maketrans({'\\': '\\\\', '"': '\\"'})
+_APPLESCRIPT_SQ_TRANS = str.maketrans({"'": "'\\''"})
+
+# Template patterns used by interpolate_parameters (compiled once)
+_BRACKET_RE = re.compile(r'\[([^\[\]]+)\]')  # Optional [...] section
+_PARAM_RE = re.compile(r'\{([^}]+)\}')        # {param} placeholder
+
+
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of command execution."""
     
-    def __init__(
-        self,
-        success: bool,
-        command_id: str,
-        command_name: str,
-        output: str = "",
-        error: str = "",
-        duration: float = 0.0,
-        meta: TypingOptional[TypingDict[str, Any]] = None
-    ):
-        self.success = success
-        self.command_id = command_id
-        self.command_name = command_name
-        self.output = output
-        self.error = error
-        self.duration = duration
-        self.timestamp = datetime.now().isoformat()
-        self.meta = meta or {}
+    success: bool
+    command_id: str
+    command_name: str
+    output: str = ""
+    error: str = ""
+    duration: float = 0.0
+    meta: TypingOptional[TypingDict[str, Any]] = None
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    # to_dict() is called for the history log, the watcher and read-aloud;
+    # build it once since results are not modified after creation
+    _dict: TypingOptional[Dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.meta is None:
+            self.meta = {}
     
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
-        return {
-            "success": self.success,
-            "command_id": self.command_id,
-            "command_name": self.command_name,
-            "output": self.output,
-            "error": self.error,
-            "duration": self.duration,
-            "timestamp": self.timestamp,
-            "meta": self.meta
-        }
+        if self._dict is None:
+            self._dict = {
+                "success": self.success,
+                "command_id": self.command_id,
+                "command_name": self.command_name,
+                "output": self.output,
+                "error": self.error,
+                "duration": self.duration,
+                "timestamp": self.timestamp,
+                "meta": self.meta
+            }
+        return self._dict
 
 
 # ===== Utility Functions =====
 
-def create_result(command: Dict, success: bool, start_time: datetime, 
+def create_result(command: Dict, success: bool, start_time: float, 
                   output: str = "", error: str = "", 
                   meta: TypingOptional[TypingDict[str, Any]] = None) -> ExecutionResult:
-    """Factory function to create ExecutionResult with calculated duration."""
-    duration = (datetime.now() - start_time).total_seconds()
+    """Factory function to create ExecutionResult with calculated duration.
+    
+    start_time is a time.perf_counter() reading, so durations are monotonic and
+    unaffected by wall-clock adjustments.
+    """
+    duration = time.perf_counter() - start_time
     return ExecutionResult(
         success=success,
         command_id=command['id'],
@@ -76,6 +105,12 @@ def create_result(command: Dict, success: bool, start_time: datetime,
     )
 
 
+@lru_cache(maxsize=512)
+def _expand_user(path: str) -> str:
+    """os.path.expanduser, memoized; command paths repeat and $HOME doesn't change."""
+    return os.path.expanduser(path)
+
+
 def resolve_path(path: str, working_directory: Optional[str] = None) -> str:
     """
     Resolve a path with tilde expansion and relative path handling.
@@ -87,29 +122,49 @@ def resolve_path(path: str, working_directory: Optional[str] = None) -> str:
     Returns:
         Resolved absolute path
     """
-    resolved = os.path.expanduser(path)
+    resolved = _expand_user(path)
     if not os.path.isabs(resolved) and working_directory:
         resolved = os.path.join(working_directory, resolved)
     return resolved
 
 
+# Parsed .env files keyed by expanded path -> (mtime_ns, size, values)
+_ENV_CACHE: Dict[str, Tuple[int, int, Dict[str, str]]] = {}
+_ENV_CACHE_LOCK = threading.Lock()
+
+
 def load_env_vars(env_file: str) -> Dict[str, str]:
     """
     Load environment variables from a .env file.
     
+    Parsed files are cached and only re-read when their mtime or size changes.
+    The returned dict is shared with the cache and must not be mutated.
+    
     Args:
         env_file: Path to .env file
         
     Returns:
         Dictionary of environment variables (empty if file not found)
     """
-    env_file_path = os.path.expanduser(env_file)
-    if os.path.exists(env_file_path):
-        print(f"Loaded environment from: {env_file_path}")
-        return dict(dotenv_values(env_file_path))
-    else:
+    env_file_path = _expand_user(env_file)
+    try:
+        stat = os.stat(env_file_path)
+    except OSError:
         print(f"Warning: Environment file not found: {env_file_path}")
         return {}
+    
+    with _ENV_CACHE_LOCK:
+        cached = _ENV_CACHE.get(env_file_path)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+    
+    from dotenv import dotenv_values
+    
+    values = dict(dotenv_values(env_file_path))
+    with _ENV_CACHE_LOCK:
+        _ENV_CACHE[env_file_path] = (stat.st_mtime_ns, stat.st_size, values)
+    print(f"Loaded environment from: {env_file_path}")
+    return values
 
 
 def request_confirmation() -> bool:
@@ -135,11 +190,19 @@ def escape_for_applescript(text: str, for_double_quotes: bool = False) -> str:
         Escaped text
     """
     if for_double_quotes:
-        # Escape backslashes first, then double quotes
-        return text.replace('\\', '\\\\').replace('"', '\\"')
+        # Escape backslashes and double quotes
+        return text.translate(_APPLESCRIPT_DQ_TRANS)
     else:
         # Escape single quotes for shell
-        return text.replace("'", "'\\''")
+        return text.translate(_APPLESCRIPT_SQ_TRANS)
+
+
+@lru_cache(maxsize=128)
+def _base_command(script_path: str, python_interpreter: str) -> str:
+    """Quote the interpreter/script prefix."""
+    if python_interpreter:
+        return f'"{python_interpreter}" "{script_path}"'
+    return f'"{script_path}"'
 
 
 def build_command_string(script_path: str, python_interpreter: str = "", 
@@ -156,16 +219,23 @@ def build_command_string(script_path: str, python_interpreter: str = "",
         Complete command string
     """
     if python_interpreter:
-        base_cmd = f'"{python_interpreter}" "{script_path}"'
         print(f"Using virtual environment: {python_interpreter}")
     else:
-        base_cmd = f'"{script_path}"'
         print(f"Using script directly (no virtualenv specified)")
-    
+    base_cmd = _base_command(script_path, python_interpreter)
     return f"{base_cmd} {args_str}" if args_str else base_cmd
 
 
-def prepare_execution_environment(action: Dict, parameters: Dict, command: Dict) -> Tuple[str, str, str, Dict, Dict]:
+def _exists_and_executable(path: str) -> Tuple[bool, bool]:
+    """Check existence and execute permission with a single stat call."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return False, False
+    return True, bool(st.st_mode & 0o111)
+
+
+def prepare_execution_environment(action: Dict, parameters: Dict, command: Dict) -> Tuple[str, str, str, Optional[Dict], Dict]:
     """
     Prepare all execution parameters (paths, command, environment).
     
@@ -175,12 +245,13 @@ def prepare_execution_environment(action: Dict, parameters: Dict, command: Dict)
         command: Full command definition
         
     Returns:
-        Tuple of (script_path, full_command, cwd, env_dict, env_vars_only)
+        Tuple of (script_path, full_command, cwd, env_dict, env_vars_only);
+        env_dict is None when the parent environment should be inherited as-is
     """
     # Get working directory first (needed for resolving relative paths)
     cwd = action.get('working_directory')
     if cwd:
-        cwd = os.path.expanduser(cwd)
+        cwd = _expand_user(cwd)
         if os.path.exists(cwd):
             print(f"Working directory: {cwd}")
         else:
@@ -201,10 +272,11 @@ def prepare_execution_environment(action: Dict, parameters: Dict, command: Dict)
         print(f"Resolved Python interpreter: {python_interpreter}")
         
         # Validate Python interpreter
-        if not os.path.exists(python_interpreter):
+        exists, executable = _exists_and_executable(python_interpreter)
+        if not exists:
             print(f"WARNING: Python interpreter not found at: {python_interpreter}")
             print(f"         Command may fail or use system Python instead!")
-        elif not os.access(python_interpreter, os.X_OK):
+        elif not executable:
             print(f"WARNING: Python interpreter not executable: {python_interpreter}")
     
     # Build arguments and command
@@ -214,13 +286,15 @@ def prepare_execution_environment(action: Dict, parameters: Dict, command: Dict)
     
     print(f"Executing: {full_command}")
     
-    # Load environment variables
-    env = os.environ.copy()
+    # Load environment variables; env stays None (inherit the parent
+    # environment) unless an env file adds overrides
+    env = None
     env_vars = {}
     env_file = action.get('env_file', '')
     if env_file:
         env_vars = load_env_vars(env_file)
-        env.update(env_vars)
+        if env_vars:
+            env = {**os.environ, **env_vars}
     
     return script_path, full_command, cwd, env, env_vars
 
@@ -245,58 +319,66 @@ def generate_terminal_applescript(full_command: str, cwd: Optional[str],
     cd_command = f"cd '{cwd}' && " if cwd else ""
     
     # Build export commands for environment variables
-    env_commands = ""
-    for key, value in env_vars.items():
-        escaped_value = escape_for_applescript(value) if value else ""
-        env_commands += f"export {key}='{escaped_value}'; "
+    env_commands = "".join(
+        f"export {key}='{escape_for_applescript(value) if value else ''}'; "
+        for key, value in env_vars.items()
+    )
     
     # Combine all commands
     terminal_command = f"{cd_command}{env_commands}{escaped_command}"
     terminal_command_escaped = escape_for_applescript(terminal_command, for_double_quotes=True)
     
-    # AppleScript that launches the terminal and returns the window ID
+    # The monitor runs as a detached osascript started from the launcher itself,
+    # so a foreground execution costs a single osascript spawn from Python
+    monitor_script_escaped = escape_for_applescript(generate_monitor_applescript(), for_double_quotes=True)
+    
+    # AppleScript that launches the terminal, starts the monitor and returns the window ID
     return f'''tell application "Terminal"
     activate
     set newTab to do script "{terminal_command_escaped}"
     set newWindow to first window whose tabs contains newTab
     set index of newWindow to 1
-    return id of newWindow
-end tell'''
+    set windowId to id of newWindow
+end tell
+do shell script "osascript -e " & quoted form of "{monitor_script_escaped}" & " " & windowId & " > /dev/null 2>&1 &"
+return windowId'''
 
 
-def generate_monitor_applescript(window_id: str) -> str:
+def generate_monitor_applescript() -> str:
     """
     Generate AppleScript to monitor and close terminal window.
     
-    Args:
-        window_id: Terminal window ID to monitor
+    The script takes the Terminal window ID to monitor as its first argument.
         
     Returns:
         AppleScript code as string
     """
-    return f'''tell application "Terminal"
-    repeat
-        try
-            set targetWindow to window id {window_id}
-            set isWindowBusy to busy of selected tab of targetWindow
-            if not isWindowBusy then
-                delay {TERMINAL_CLOSE_DELAY}
-                set stillBusy to busy of selected tab of targetWindow
-                if not stillBusy then
-                    close targetWindow
-                    exit repeat
+    return f'''on run argv
+    set windowId to (item 1 of argv) as integer
+    tell application "Terminal"
+        repeat
+            try
+                set targetWindow to window id windowId
+                set isWindowBusy to busy of selected tab of targetWindow
+                if not isWindowBusy then
+                    delay {TERMINAL_CLOSE_DELAY}
+                    set stillBusy to busy of selected tab of targetWindow
+                    if not stillBusy then
+                        close targetWindow
+                        exit repeat
+                    end if
                 end if
-            end if
-        on error
-            exit repeat
-        end try
-        delay {MONITOR_DELAY}
-    end repeat
-end tell'''
+            on error
+                exit repeat
+            end try
+            delay {MONITOR_DELAY}
+        end repeat
+    end tell
+end run'''
 
 
 def execute_in_foreground(full_command: str, cwd: Optional[str], env_vars: Dict,
-                         command: Dict, start_time: datetime) -> ExecutionResult:
+                         command: Dict, start_time: float) -> ExecutionResult:
     """
     Execute command in foreground (visible terminal window).
     
@@ -305,7 +387,7 @@ def execute_in_foreground(full_command: str, cwd: Optional[str], env_vars: Dict,
         cwd: Working directory
         env_vars: Environment variables to export in terminal
         command: Command definition
-        start_time: Execution start time
+        start_time: Execution start time (time.perf_counter())
         
     Returns:
         ExecutionResult
@@ -324,18 +406,8 @@ def execute_in_foreground(full_command: str, cwd: Optional[str], env_vars: Dict,
         )
 
         if result.returncode == 0:
-            # Get the window ID and start monitor
+            # The launcher already started the close monitor; just grab the window ID
             window_id = result.stdout.strip()
-            monitor_script = generate_monitor_applescript(window_id)
-            
-            # Run monitor script in background
-            subprocess.Popen(
-                ['osascript', '-e', monitor_script],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                stdin=subprocess.DEVNULL,
-                start_new_session=True
-            )
             
             return create_result(
                 command, True, start_time,
@@ -360,25 +432,47 @@ def execute_in_foreground(full_command: str, cwd: Optional[str], env_vars: Dict,
         )
 
 
-def execute_in_background(full_command: str, cwd: Optional[str], env: Dict,
-                         command: Dict, start_time: datetime) -> ExecutionResult:
+# Characters whose meaning depends on the shell (expansion, globbing, pipes,
+# redirection, control flow); commands containing any of them keep using sh -c
+_SHELL_SYNTAX_CHARS = frozenset('$`|&;<>()*?[]{}~#!\n')
+
+
+def command_argv(full_command: str) -> Optional[List[str]]:
+    """
+    Split a command string into an argv list when no shell is needed to run it.
+    
+    Returns None if the command uses shell syntax or cannot be tokenized, in
+    which case it should be run through the shell as before.
+    """
+    if not _SHELL_SYNTAX_CHARS.isdisjoint(full_command):
+        return None
+    try:
+        return shlex.split(full_command)
+    except ValueError:
+        return None
+
+
+def execute_in_background(full_command: str, cwd: Optional[str], env: Optional[Dict],
+                         command: Dict, start_time: float) -> ExecutionResult:
     """
     Execute command in background (fire and forget).
     
     Args:
         full_command: Complete command string
         cwd: Working directory
-        env: Environment variables
+        env: Environment variables (None to inherit the current environment)
         command: Command definition
-        start_time: Execution start time
+        start_time: Execution start time (time.perf_counter())
         
     Returns:
         ExecutionResult
     """
     try:
+        # Exec plain commands directly rather than through an intermediate sh -c
+        argv = command_argv(full_command)
         process = subprocess.Popen(
-            full_command,
-            shell=True,
+            argv if argv else full_command,
+            shell=not argv,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
             stdin=subprocess.DEVNULL,
@@ -400,6 +494,76 @@ def execute_in_background(full_command: str, cwd: Optional[str], env: Dict,
         )
 
 
+# Compact encoder for structured parameter values; keeps generated args short
+_JSON_ENCODE = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+
+
+def _stringify(value: Any) -> str:
+    """Convert a parameter value to its template string form."""
+    if isinstance(value, (int, float, bool)):
+        return str(value)
+    if isinstance(value, str):
+        return value
+    return _JSON_ENCODE(value)
+
+
+def _collapse_whitespace(text: str) -> str:
+    """Collapse whitespace runs to single spaces and strip the ends."""
+    # isprintable() rules out every whitespace character except ' ', so a
+    # printable string without doubled or edge spaces is already clean and the
+    # split/join (a full walk plus a list of words) can be skipped
+    if (text.isprintable() and '  ' not in text
+            and not text.startswith(' ') and not text.endswith(' ')):
+        return text
+    return ' '.join(text.split())
+
+
+# Segment kinds produced by _compile_template
+_LITERAL = 0   # value: literal text
+_PARAM = 1     # value: parameter name
+_SECTION = 2   # value: (parts, names) for an optional [...] section
+
+
+def _split_placeholders(text: str) -> List[Tuple[bool, str]]:
+    """Split text into (is_param, literal_or_name) parts around {param} placeholders."""
+    parts: List[Tuple[bool, str]] = []
+    pos = 0
+    for match in _PARAM_RE.finditer(text):
+        if match.start() > pos:
+            parts.append((False, text[pos:match.start()]))
+        parts.append((True, match.group(1)))
+        pos = match.end()
+    if pos < len(text):
+        parts.append((False, text[pos:]))
+    return parts
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> Tuple[Tuple[int, Any], ...]:
+    """
+    Tokenize a template once into literal, parameter and optional-section segments.
+    
+    Templates come from command definitions (URL, headers, body, args), so the
+    same strings are interpolated over and over; caching the tokenized form
+    keeps regex work out of the per-execution path.
+    """
+    segments: List[Tuple[int, Any]] = []
+    
+    def add_outside(text: str) -> None:
+        for is_param, value in _split_placeholders(text):
+            segments.append((_PARAM, value) if is_param else (_LITERAL, value))
+    
+    pos = 0
+    for match in _BRACKET_RE.finditer(template):
+        add_outside(template[pos:match.start()])
+        parts = tuple(_split_placeholders(match.group(1)))
+        names = tuple(value for is_param, value in parts if is_param)
+        segments.append((_SECTION, (parts, names)))
+        pos = match.end()
+    add_outside(template[pos:])
+    return tuple(segments)
+
+
 def interpolate_parameters(template: str, parameters: Dict[str, Any], command: Optional[Dict] = None) -> str:
     """
     Interpolate parameters into a template string with optional sections.
@@ -422,81 +586,54 @@ def interpolate_parameters(template: str, parameters: Dict[str, Any], command: O
     Returns:
         Interpolated string with optional sections processed
     """
-    result = template
+    # Constant templates don't need the parameter map at all
+    if not ('{' in template or '[' in template):
+        return _collapse_whitespace(template)
+    return interpolate_parameters_with_map(template, build_string_map(parameters, command))
+
+
+def build_string_map(parameters: Dict[str, Any], command: Optional[Dict] = None) -> Dict[str, str]:
+    """
+    Resolve parameters to their template string forms, once per execution.
     
-    # Build mapping from original names to sanitized parameter values
+    Maps original and sanitized names (when a command is given) to stringified
+    values; None values are left out so their placeholders are dropped.
+    """
     if command:
         manager = get_command_manager()
         param_map = manager.build_parameter_map(command, parameters)
     else:
         param_map = parameters
+    return {name: _stringify(value) for name, value in param_map.items() if value is not None}
+
+
+def interpolate_parameters_with_map(template: str, str_map: Dict[str, str]) -> str:
+    """
+    Interpolate a template using a map already produced by build_string_map.
     
-    # Process conditional sections first: [...] where content may contain {param} placeholders
-    def process_conditional(match):
-        """Process a single conditional section."""
-        content = match.group(1)
-        
-        # Find all {param} placeholders in this section
-        params_in_section = re.findall(r'\{([^}]+)\}', content)
-        
-        # Check if all parameters in this section are available and non-empty
-        all_present = True
-        for param_name in params_in_section:
-            value = param_map.get(param_name)
-            if value is None or value == '':
-                all_present = False
-                break
-        
-        # If all present, interpolate and return; otherwise return empty string
-        if all_present:
-            interpolated = content
-            for param_name in params_in_section:
-                value = param_map[param_name]
-                placeholder = "{" + param_name + "}"
-                
-                # Convert value to string
-                if isinstance(value, (int, float, bool)):
-                    str_value = str(value)
-                elif isinstance(value, str):
-                    str_value = value
-                else:
-                    str_value = json.dumps(value)
-                
-                interpolated = interpolated.replace(placeholder, str_value)
-            return interpolated
-        else:
-            return ''
-    
-    # Process all conditional sections (non-nested only)
-    result = re.sub(r'\[([^\[\]]+)\]', process_conditional, result)
-    
-    # Now interpolate remaining (required) parameters outside of brackets
-    for key, value in param_map.items():
-        if value is None:
-            continue
-        placeholder = "{" + key + "}"
-        
-        # Convert value to string appropriately
-        if isinstance(value, (int, float, bool)):
-            str_value = str(value)
-        elif isinstance(value, str):
-            str_value = value
+    Lets callers rendering several templates for one execution (URL, headers,
+    body) resolve and stringify parameters only once.
+    """
+    # Fast path: constant strings (fixed URLs, headers) only need whitespace cleanup
+    if not ('{' in template or '[' in template):
+        return _collapse_whitespace(template)
+    
+    out: List[str] = []
+    for kind, value in _compile_template(template):
+        if kind == _LITERAL:
+            out.append(value)
+        elif kind == _PARAM:
+            # Unreplaced placeholders (parameters that were None or not provided) are removed
+            out.append(str_map.get(value, ''))
         else:
-            str_value = json.dumps(value)
-        
-        result = result.replace(placeholder, str_value)
+            # Optional section: only included if all its parameters are available and non-empty
+            parts, names = value
+            if all(str_map.get(name) for name in names):
+                for is_param, text in parts:
+                    out.append(str_map[text] if is_param else text)
     
     # Clean up extra whitespace that may have been left by removed sections
-    result = ' '.join(result.split())
-    
-    # Remove any unreplaced placeholders (parameters that were None or not provided)
-    # This handles cases where optional parameters in non-bracketed sections weren't replaced
-    result = re.sub(r'\{[^}]+\}', '', result)
-    
-    # Clean up whitespace again after removing placeholders
-    result = ' '.join(result.split())
-    
-    return result
+    return _collapse_whitespace(''.join(out))
 
 
 def execute_script(
@@ -529,7 +666,7 @@ def execute_script(
         Scripts are launched asynchronously and return immediately without waiting
         for completion. This prevents timeout errors for long-running scripts.
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     action = command['action']
     run_foreground = command.get('run_foreground', False)
     
@@ -576,8 +713,11 @@ def prepare_http_request(action: Dict, parameters: Dict, command: Dict) -> Tuple
     Returns:
         Tuple of (url, method, headers, body)
     """
+    # Resolve parameters once for the URL, headers and body templates
+    str_map = build_string_map(parameters, command)
+    
     # Interpolate URL
-    url = interpolate_parameters(action['url'], parameters, command)
+    url = interpolate_parameters_with_map(action['url'], str_map)
     method = action.get('method', 'POST').upper()
     
     # Build headers
@@ -585,14 +725,14 @@ def prepare_http_request(action: Dict, parameters: Dict, command: Dict) -> Tuple
     if 'headers' in action:
         for header in action['headers']:
             key = header['key']
-            value = interpolate_parameters(header['value'], parameters, command)
+            value = interpolate_parameters_with_map(header['value'], str_map)
             headers[key] = value
     
     # Build body
     body = None
     if 'body_template' in action and action['body_template']:
         body_template = action['body_template']
-        body_str = interpolate_parameters(body_template, parameters, command)
+        body_str = interpolate_parameters_with_map(body_template, str_map)
         
         # Try to parse as JSON
         try:
@@ -608,6 +748,22 @@ def prepare_http_request(action: Dict, parameters: Dict, command: Dict) -> Tuple
     return url, method, headers, body
 
 
+def _get_http_session():
+    """Return the shared HTTP session, creating it on first use."""
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        with _HTTP_SESSION_LOCK:
+            if _HTTP_SESSION is None:
+                import requests
+                
+                session = requests.Session()
+                # Cookies are not persisted so one command's responses can't
+                # leak into another's requests
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
 def make_http_request(method: str, url: str, headers: Dict, body: Any, timeout: int):
     """
     Make HTTP request using appropriate method.
@@ -625,20 +781,51 @@ def make_http_request(method: str, url: str, headers: Dict, body: Any, timeout:
     Raises:
         ValueError: If method is unsupported
     """
-    request_timeout = None if timeout == 0 else timeout
-    
-    # HTTP method dispatch
-    http_methods = {
-        'GET': lambda: requests.get(url, headers=headers, timeout=request_timeout),
-        'POST': lambda: requests.post(url, headers=headers, json=body, timeout=request_timeout),
-        'PUT': lambda: requests.put(url, headers=headers, json=body, timeout=request_timeout),
-        'DELETE': lambda: requests.delete(url, headers=headers, timeout=request_timeout)
-    }
-    
-    if method not in http_methods:
+    if method not in SUPPORTED_HTTP_METHODS:
         raise ValueError(f"Unsupported HTTP method: {method}")
     
-    return http_methods[method]()
+    request_timeout = None if timeout == 0 else timeout
+    return _get_http_session().request(
+        method,
+        url,
+        headers=headers,
+        json=body if method in BODY_HTTP_METHODS else None,
+        timeout=request_timeout,
+        stream=True
+    )
+
+
+def read_response_text(response, limit: int = RESPONSE_TEXT_LIMIT) -> str:
+    """
+    Read at most `limit` characters from a streamed response, then close it.
+    
+    Only enough of the body to cover `limit` characters is pulled off the wire;
+    closing an unfinished response drops its connection instead of returning
+    it to the pool half-read.
+    """
+    # No charset in the headers means UTF-8; sniffing (apparent_encoding)
+    # would download the whole body
+    try:
+        decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+    except LookupError:
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    parts = []
+    chars = 0
+    # UTF-8 needs at most 4 bytes per character
+    byte_budget = limit * 4
+    try:
+        for chunk in response.iter_content(chunk_size=RESPONSE_CHUNK_SIZE):
+            text = decoder.decode(chunk)
+            parts.append(text)
+            chars += len(text)
+            byte_budget -= len(chunk)
+            if chars >= limit or byte_budget <= 0:
+                break
+        else:
+            parts.append(decoder.decode(b'', final=True))
+    finally:
+        response.close()
+    return ''.join(parts)[:limit]
 
 
 def execute_http(
@@ -659,7 +846,9 @@ def execute_http(
     Returns:
         ExecutionResult
     """
-    start_time = datetime.now()
+    import requests
+    
+    start_time = time.perf_counter()
     action = command['action']
     
     try:
@@ -676,16 +865,18 @@ def execute_http(
         # Make request
         response = make_http_request(method, url, headers, body, timeout)
         
+        response_text = read_response_text(response)
+        
         # Check response
         if response.status_code < 400:
             return create_result(
                 command, True, start_time,
-                output=f"Status: {response.status_code}\n{response.text[:RESPONSE_TEXT_LIMIT]}"
+                output=f"Status: {response.status_code}\n{response_text}"
             )
         else:
             return create_result(
                 command, False, start_time,
-                output=response.text[:RESPONSE_TEXT_LIMIT],
+                output=response_text,
                 error=f"HTTP error: {response.status_code}"
             )
     
@@ -773,7 +964,9 @@ def execute_mcp(
     original_transcript: Optional[str] = None
 ) -> ExecutionResult:
     """Execute an MCP tool call."""
-    start_time = datetime.now()
+    from mcp_client import MCPConfigError, MCPExecutionError, get_mcp_manager
+    
+    start_time = time.perf_counter()
     action = command['action']
     server_id = action['server_id']
     tool_name = action['tool']
@@ -863,22 +1056,15 @@ def try_speak_mcp_result(
         from result_speaker import process_and_speak_result
         
         mcp_manager = get_mcp_manager()
-        server = mcp_manager.get_server(server_id)
+        server = mcp_manager.servers_view.get(server_id)
         
         if server and server.get('read_aloud', False):
-            # Run text-to-speech in a background thread so it doesn't block
-            def speak_in_background():
-                try:
-                    process_and_speak_result(
-                        original_command=original_transcript,
-                        execution_result=result.to_dict(),
-                        command_name=command.get('name', 'MCP command')
-                    )
-                except Exception as e:
-                    print(f"Error in MCP read-aloud background thread: {e}")
-            
-            thread = threading.Thread(target=speak_in_background, daemon=True)
-            thread.start()
+            # Queued on the read-aloud worker; doesn't block
+            process_and_speak_result(
+                original_command=original_transcript,
+                execution_result=result.to_dict(),
+                command_name=command.get('name', 'MCP command')
+            )
     except Exception as e:
         print(f"Error checking MCP read_aloud setting: {e}")
 
@@ -892,9 +1078,32 @@ def log_execution(result: ExecutionResult, log_file: Optional[str] = None) -> No
         log_file: Optional log file path
     """
     if log_file:
-        try:
-            with open(log_file, 'a') as f:
-                f.write(json.dumps(result.to_dict()) + "\n")
-        except IOError as e:
-            print(f"Warning: Could not write to log file: {e}")
+        line = json.dumps(result.to_dict()) + "\n"
+        with _LOG_FILES_LOCK:
+            try:
+                f = _LOG_FILES.get(log_file)
+                if f is None:
+                    f = _LOG_FILES[log_file] = open(log_file, 'a')
+                f.write(line)
+                # Flushed per entry so the log is complete if the app is killed
+                f.flush()
+            except IOError as e:
+                print(f"Warning: Could not write to log file: {e}")
+                # Reopen on the next call (e.g. the logs dir was recreated)
+                stale = _LOG_FILES.pop(log_file, None)
+                if stale is not None:
+                    try:
+                        stale.close()
+                    except IOError:
+                        pass
+
+
+def _close_log_files() -> None:
+    with _LOG_FILES_LOCK:
+        for f in _LOG_FILES.values():
+            f.close()
+        _LOG_FILES.clear()
+
+
+atexit.register(_close_log_files)
 
@@ -1,7 +1,10 @@
 """Claude API client for command parsing with tool calling."""
 
+import threading
+
 import anthropic
-from typing import List, Dict, Optional, Any
+import httpx
+from typing import List, Dict, Iterator, Optional, Any
 from config import ANTHROPIC_API_KEY, LLM_MODEL
 
 
@@ -12,16 +15,37 @@ class ClaudeClient:
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY is required")
         
+        # Keep a few connections alive between calls so each request doesn't
+        # pay for a new TLS handshake
+        self._http_client = anthropic.DefaultHttpxClient(
+            limits=httpx.Limits(max_keepalive_connections=4, keepalive_expiry=60)
+        )
         # Configure client with a sane timeout to avoid hanging
-        self.client = anthropic.Anthropic(api_key=api_key).with_options(timeout=timeout_seconds)
+        self.client = anthropic.Anthropic(
+            api_key=api_key,
+            http_client=self._http_client,
+        ).with_options(timeout=timeout_seconds)
         self.model = model
     
+    def prewarm(self, timeout_seconds: float = 5.0) -> None:
+        """
+        Open a connection to the API ahead of the first real request.
+        
+        Any response will do; the point is to leave a kept-alive TLS
+        connection in the pool. Errors are ignored.
+        """
+        try:
+            self._http_client.head(str(self.client.base_url), timeout=timeout_seconds)
+        except httpx.HTTPError:
+            pass
+    
     def call_with_tools(
         self,
         user_message: str,
         tools: List[Dict],
         system_prompt: Optional[str] = None,
-        max_tokens: int = 1024
+        max_tokens: int = 1024,
+        model: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Call Claude API with tool definitions.
@@ -31,6 +55,7 @@ class ClaudeClient:
             tools: List of tool definitions
             system_prompt: Optional system prompt
             max_tokens: Maximum tokens in response
+            model: Model to use instead of the client's default
             
         Returns:
             Response dictionary with:
@@ -44,7 +69,7 @@ class ClaudeClient:
             
             # Build API call parameters
             params = {
-                "model": self.model,
+                "model": model or self.model,
                 "max_tokens": max_tokens,
                 "messages": messages,
             }
@@ -55,8 +80,19 @@ class ClaudeClient:
             if tools:
                 params["tools"] = tools
             
-            # Make API call
-            response = self.client.messages.create(**params)
+            if not tools:
+                # Nothing to exit early on; a plain request is simpler
+                response = self.client.messages.create(**params)
+                return self._parse_response(response)
+            
+            # Stream so we can act on the first complete tool call instead of
+            # waiting for the rest of the message; leaving the context manager
+            # closes the HTTP stream
+            with self.client.messages.stream(**params) as stream:
+                for event in stream:
+                    if event.type == "content_block_stop" and event.content_block.type == "tool_use":
+                        return self._parse_response(stream.current_message_snapshot)
+                response = stream.get_final_message()
             
             # Parse response
             return self._parse_response(response)
@@ -86,6 +122,40 @@ class ClaudeClient:
                 "error": f"Unexpected error: {str(e)}"
             }
     
+    def stream_text(
+        self,
+        user_message: str,
+        system_prompt: Optional[str] = None,
+        max_tokens: int = 1024,
+        model: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Stream a plain text response from Claude (no tools).
+        
+        Args:
+            user_message: The user's message
+            system_prompt: Optional system prompt
+            max_tokens: Maximum tokens in response
+            model: Model to use instead of the client's default
+            
+        Yields:
+            Text fragments as they arrive
+            
+        Raises:
+            anthropic.APIError: If the request fails (also mid-stream)
+        """
+        params = {
+            "model": model or self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": user_message}],
+        }
+        
+        if system_prompt:
+            params["system"] = system_prompt
+        
+        with self.client.messages.stream(**params) as stream:
+            yield from stream.text_stream
+    
     def _parse_response(self, response) -> Dict[str, Any]:
         """Parse Claude API response to extract tool use or text."""
         result = {
@@ -127,11 +197,30 @@ class ClaudeClient:
 
 # Global client instance
 _client = None
+_client_lock = threading.Lock()
 
 def get_claude_client() -> ClaudeClient:
-    """Get the global ClaudeClient instance."""
+    """
+    Get the global ClaudeClient instance.
+    
+    Always returns the same instance (created once, thread-safely), so every
+    caller shares one HTTP connection pool to the API.
+    """
     global _client
     if _client is None:
-        _client = ClaudeClient()
+        with _client_lock:
+            if _client is None:
+                _client = ClaudeClient()
     return _client
 
+
+def prewarm_claude_client_in_background() -> None:
+    """Create the global client and open its first connection on a daemon thread."""
+    def prewarm():
+        try:
+            get_claude_client().prewarm()
+        except Exception as e:
+            print(f"Claude client prewarm skipped: {e}")
+    
+    threading.Thread(target=prewarm, name="claude-prewarm", daemon=True).start()
+
@@ -0,0 +1,39 @@
+"""Logging setup for Wispr Action."""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(log_level: str = "INFO") -> None:
+    """
+    Route log records through a queue to a background writer thread.
+
+    Callers (e.g. the TTS playback loop) only enqueue records; formatting and
+    the write to stdout happen on the listener thread. Safe to call again to
+    change the level.
+
+    Args:
+        log_level: Name of the root log level (e.g. "INFO", "DEBUG")
+    """
+    global _listener
+
+    root = logging.getLogger()
+    root.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    if _listener is not None:
+        return
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    root.addHandler(QueueHandler(log_queue))
@@ -2,37 +2,49 @@
 
 from __future__ import annotations
 
-import copy
+import hashlib
 import json
 import os
-import re
 import threading
 import time
 import uuid
+from types import MappingProxyType
 from contextlib import asynccontextmanager
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
 from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
 
 import anyio
+from anyio import to_thread
+from anyio.abc import TaskGroup
+from anyio.from_thread import BlockingPortal
+from fastrlock.rlock import FastRLock
 from mcp.client.session import ClientSession
-from mcp.client.sse import sse_client
-from mcp.client.streamable_http import streamablehttp_client
-from mcp.client.stdio import StdioServerParameters, stdio_client
 from mcp.shared.exceptions import McpError
-from mcp.types import CallToolResult
 
-from composio_client import ComposioClient, ComposioError
 from config import MCP_SERVERS_FILE, MCP_TOOL_CACHE_TTL
 from constants import TEMPLATE_PATTERN, TransportType
 from secret_store import (
-    delete_secret,
+    delete_secrets,
     get_composio_api_key,
-    get_secret,
+    get_secrets,
     list_secret_flags,
     set_secret,
 )
 
+if TYPE_CHECKING:
+    from mcp.types import CallToolResult
+
+# Transport clients (and the Composio client) are imported where a session is
+# opened: each server only ever needs one of them, and they are slow to import.
+
+# How long a Composio connection's MCP endpoint is reused before re-checking it (seconds)
+COMPOSIO_ENDPOINT_TTL = 300
+
+# Pooled MCP sessions unused for this long are closed (seconds)
+MCP_SESSION_IDLE_TIMEOUT = 120
+
 
 class MCPConfigError(Exception):
     """Configuration errors for MCP servers."""
@@ -42,14 +54,32 @@ class MCPExecutionError(Exception):
     """Raised when a call to an MCP tool fails."""
 
 
-def _render_template(value: str, context: Dict[str, str]) -> str:
-    """Replace {{placeholders}} in the provided value with context values."""
+@lru_cache(maxsize=512)
+def _compile_template(value: str) -> Tuple[Tuple[bool, str], ...]:
+    """Split a value into (is_placeholder, literal_or_key) parts around {{placeholders}}."""
+    parts: List[Tuple[bool, str]] = []
+    pos = 0
+    for match in TEMPLATE_PATTERN.finditer(value):
+        if match.start() > pos:
+            parts.append((False, value[pos:match.start()]))
+        parts.append((True, match.group(1).strip()))
+        pos = match.end()
+    if pos < len(value):
+        parts.append((False, value[pos:]))
+    return tuple(parts)
 
-    def replace(match: re.Match[str]) -> str:
-        key = match.group(1).strip()
-        return context.get(key, "")
 
-    return TEMPLATE_PATTERN.sub(replace, value)
+def _render_template(value: str, context: Dict[str, str]) -> str:
+    """Replace {{placeholders}} in the provided value with context values."""
+    # Most values (e.g. "application/json") have no placeholders at all
+    if "{{" not in value:
+        return value
+    # Header/param/env values are rendered on every session open; the parsed
+    # form is cached so each render is just lookups and a join
+    return "".join(
+        context.get(text, "") if is_key else text
+        for is_key, text in _compile_template(value)
+    )
 
 
 def _secret_keys(server: Dict[str, Any]) -> List[str]:
@@ -62,15 +92,73 @@ def _secret_keys(server: Dict[str, Any]) -> List[str]:
     return keys
 
 
+class _PooledSession:
+    """A live, initialized MCP session kept open by its owner task on the event loop."""
+
+    __slots__ = (
+        "server", "version", "session", "ready", "closed", "error", "in_use", "last_used", "retired",
+    )
+
+    def __init__(self, server: Dict[str, Any], version: int) -> None:
+        self.server = server
+        self.version = version
+        self.session: Optional[ClientSession] = None
+        self.ready = anyio.Event()
+        self.closed = anyio.Event()
+        self.error: Optional[BaseException] = None
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        # Replaced in the pool while still borrowed; closed when in_use hits 0
+        self.retired = False
+
+
 class MCPClientManager:
     """Singleton manager for MCP server configs, tool discovery, and execution."""
 
     def __init__(self, config_path: str = MCP_SERVERS_FILE) -> None:
         self.config_path = config_path
+        # Copy-on-write: _servers is never mutated in place. Writers build a new
+        # dict under _lock and rebind it, so readers just take a snapshot of
+        # the attribute without locking.
         self._servers: Dict[str, Dict[str, Any]] = {}
+        self._servers_view: Mapping[str, Dict[str, Any]] = MappingProxyType(self._servers)
+        # Bumped when server configs or their secret flags change (see servers_version)
+        self._servers_version = 0
         self._tool_cache: Dict[str, Dict[str, Any]] = {}
-        self._lock = threading.RLock()
+        # Bumped whenever cached tool lists change, so callers can cache
+        # anything derived from list_tools() (e.g. Claude tool definitions)
+        self.tools_version = 0
+        # Writers of _servers and the tool cache are guarded separately; when
+        # both are needed, take _lock first. FastRLock is much cheaper than
+        # threading.RLock when uncontended.
+        self._lock = FastRLock()
+        self._cache_lock = FastRLock()
+        # Per-server secret key names (guarded by _cache_lock). They only change
+        # on upsert/delete/update_secrets/reload; the version lets a reader that
+        # raced with an invalidation skip storing a stale result. Secret values
+        # and flags are not cached here: secret_store memoizes keychain reads
+        # and drops an entry whenever it is set or deleted.
+        self._secret_keys_cache: Dict[str, Tuple[str, ...]] = {}
+        self._secrets_version = 0
+        # oauth_connection_id -> (checked_at, mcpEndpoint), guarded by _cache_lock
+        self._composio_endpoint_cache: Dict[str, Tuple[float, str]] = {}
+        # server_id -> (server config, SSE/HTTP URL with its query params applied).
+        # Only filled when no query param references a secret, so the URL is the
+        # same for every session; guarded by _cache_lock.
+        self._static_urls: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        # Event loop thread shared by all MCP calls, and the sessions kept open
+        # on it (server_id -> session; only touched from the loop thread)
+        self._loop_lock = threading.Lock()
+        self._portal: Optional[BlockingPortal] = None
+        self._session_tasks: Optional[TaskGroup] = None
+        self._sessions: Dict[str, _PooledSession] = {}
+        # mtime of the config file the in-memory servers were loaded from/written to
+        self._servers_mtime_ns: Optional[int] = None
+        # Digest of the last config we wrote, to skip rewriting identical content
+        self._last_persist_hash: Optional[bytes] = None
         self._load_servers()
+        # Bring the loop up now so the first tool call doesn't pay for it
+        self._ensure_loop()
 
     # ------------------------------------------------------------------
     # Config persistence
@@ -79,6 +167,8 @@ class MCPClientManager:
         if not os.path.exists(self.config_path):
             data = {"servers": []}
             self._write_servers(data)
+        # Stat before reading so an edit that lands mid-read triggers another reload
+        mtime_ns = self._config_mtime_ns()
         with open(self.config_path, "r", encoding="utf-8") as fh:
             try:
                 data = json.load(fh) if fh.readable() else {"servers": []}
@@ -86,14 +176,96 @@ class MCPClientManager:
                 data = {"servers": []}
 
         servers = data.get("servers", [])
-        self._servers = {srv["id"]: srv for srv in servers if "id" in srv}
+        self._set_servers({srv["id"]: srv for srv in servers if "id" in srv})
+        self._servers_mtime_ns = mtime_ns
+
+    def _set_servers(self, servers: Dict[str, Dict[str, Any]]) -> None:
+        # Publish the new dict and its read-only view together (caller holds _lock)
+        self._servers = servers
+        self._servers_view = MappingProxyType(servers)
+        with self._cache_lock:
+            self._servers_version += 1
+
+    @property
+    def servers_view(self) -> Mapping[str, Dict[str, Any]]:
+        """
+        Read-only server_id -> config mapping, without secret flags.
+        
+        Cheaper than list_servers() for callers that only read config fields:
+        no copies, no keychain lookups and no locking. Don't mutate the configs.
+        """
+        self._maybe_reload()
+        return self._servers_view
+
+    @property
+    def servers_version(self) -> int:
+        """Counter that changes whenever list_servers() output may have changed."""
+        self._maybe_reload()
+        return self._servers_version
 
     def _write_servers(self, data: Dict[str, Any]) -> None:
         directory = os.path.dirname(self.config_path)
         if directory and not os.path.exists(directory):
             os.makedirs(directory, exist_ok=True)
-        with open(self.config_path, "w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=2)
+        payload = json.dumps(data, indent=2).encode("utf-8")
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        # Unchanged content (e.g. a form re-saved as-is) and no edits on disk since
+        if digest == self._last_persist_hash and self._config_mtime_ns() == self._servers_mtime_ns:
+            return
+        # Write a sibling temp file and rename over the config so a crash
+        # mid-write can't leave a truncated file behind
+        tmp_path = f"{self.config_path}.tmp"
+        with open(tmp_path, "wb") as fh:
+            fh.write(payload)
+        os.replace(tmp_path, self.config_path)
+        self._last_persist_hash = digest
+        # Our own write shouldn't look like an external edit
+        self._servers_mtime_ns = self._config_mtime_ns()
+
+    def _config_mtime_ns(self) -> Optional[int]:
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _maybe_reload(self) -> None:
+        """Re-read the config file only if it changed on disk since it was last loaded."""
+        mtime_ns = self._config_mtime_ns()
+        if mtime_ns is None or mtime_ns == self._servers_mtime_ns:
+            return
+        with self._lock:
+            if mtime_ns == self._servers_mtime_ns:
+                return
+            previous = self._servers
+            self._load_servers()
+            # Drop cached data for servers whose config was edited or removed
+            with self._cache_lock:
+                for server_id, server in previous.items():
+                    if self._servers.get(server_id) != server:
+                        self._invalidate_server_caches(server_id)
+
+    def _invalidate_server_caches(self, server_id: str) -> None:
+        with self._cache_lock:
+            self._tool_cache.pop(server_id, None)
+            self.tools_version += 1
+            self._secret_keys_cache.pop(server_id, None)
+            self._static_urls.pop(server_id, None)
+            self._secrets_version += 1
+            self._servers_version += 1
+
+    def _cached_secret_keys(self, server: Dict[str, Any]) -> Tuple[str, ...]:
+        server_id = server["id"]
+        keys = self._secret_keys_cache.get(server_id)
+        if keys is None:
+            version = self._secrets_version
+            keys = tuple(_secret_keys(server))
+            with self._cache_lock:
+                if version == self._secrets_version and self._servers.get(server_id) is server:
+                    self._secret_keys_cache[server_id] = keys
+        return keys
+
+    def _secret_flags(self, server: Dict[str, Any]) -> Dict[str, bool]:
+        return list_secret_flags(server["id"], list(self._cached_secret_keys(server)))
 
     def _persist(self) -> None:
         with self._lock:
@@ -104,26 +276,24 @@ class MCPClientManager:
     # Public config helpers
     # ------------------------------------------------------------------
     def list_servers(self) -> List[Dict[str, Any]]:
-        with self._lock:
-            servers = []
-            for server in self._servers.values():
-                copy_server = copy.deepcopy(server)
-                secret_flags = list_secret_flags(copy_server["id"], _secret_keys(copy_server))
-                copy_server["secretsSet"] = secret_flags
-                servers.append(copy_server)
-            return servers
+        self._maybe_reload()
+        # Shallow views: callers only read/serialize them and the stored configs
+        # are replaced (never mutated) on write, so nested data can be shared
+        return [
+            {**server, "secretsSet": self._secret_flags(server)}
+            for server in self._servers.values()
+        ]
 
     def get_server(self, server_id: str) -> Optional[Dict[str, Any]]:
-        with self._lock:
-            server = self._servers.get(server_id)
-            if not server:
-                return None
-            copy_server = copy.deepcopy(server)
-            copy_server["secretsSet"] = list_secret_flags(server_id, _secret_keys(server))
-            # Add OAuth connection status if available
-            if copy_server.get("oauth_connection_id"):
-                copy_server["oauthConnected"] = True
-            return copy_server
+        self._maybe_reload()
+        server = self._servers.get(server_id)
+        if not server:
+            return None
+        copy_server = {**server, "secretsSet": self._secret_flags(server)}
+        # Add OAuth connection status if available
+        if copy_server.get("oauth_connection_id"):
+            copy_server["oauthConnected"] = True
+        return copy_server
 
     def upsert_server(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         if "name" not in payload:
@@ -135,91 +305,144 @@ class MCPClientManager:
         payload["id"] = server_id
 
         with self._lock:
-            self._servers[server_id] = payload
-            # Invalidate tool cache when server config changes
-            self._tool_cache.pop(server_id, None)
+            previous = self._servers.get(server_id)
+            if previous and previous.get("oauth_connection_id") != payload.get("oauth_connection_id"):
+                self._drop_composio_endpoint(previous.get("oauth_connection_id"))
+            servers = dict(self._servers)
+            servers[server_id] = payload
+            self._set_servers(servers)
+            # Invalidate cached tools and secret flags when server config changes
+            self._invalidate_server_caches(server_id)
             self._persist()
+            # Precompute the connection URL while we're here
+            self._static_url(payload)
 
         return self.get_server(server_id) or payload
 
     def delete_server(self, server_id: str) -> bool:
         with self._lock:
-            existed = server_id in self._servers
-            server = self._servers.pop(server_id, None)
-            if existed:
+            server = self._servers.get(server_id)
+            if server_id in self._servers:
+                servers = dict(self._servers)
+                del servers[server_id]
+                self._set_servers(servers)
                 self._persist()
 
         if server:
-            for key in _secret_keys(server):
-                delete_secret(server_id, key)
-            self._tool_cache.pop(server_id, None)
+            delete_secrets(server_id, self._cached_secret_keys(server))
+            self._invalidate_server_caches(server_id)
 
         return bool(server)
 
     def update_secrets(self, server_id: str, secrets: Dict[str, Optional[str]]) -> Dict[str, bool]:
-        with self._lock:
-            if server_id not in self._servers:
-                raise MCPConfigError(f"Server not found: {server_id}")
+        if server_id not in self._servers:
+            raise MCPConfigError(f"Server not found: {server_id}")
 
         for key, value in secrets.items():
             set_secret(server_id, key, value)
 
         # Invalidate tool cache when secrets change (new credentials may affect available tools)
-        with self._lock:
-            self._tool_cache.pop(server_id, None)
+        self._invalidate_server_caches(server_id)
 
         return list_secret_flags(server_id, list(secrets.keys()))
 
     def secret_status(self, server_id: str) -> Dict[str, bool]:
-        with self._lock:
-            server = self._servers.get(server_id)
+        server = self._servers.get(server_id)
         if not server:
             raise MCPConfigError(f"Server not found: {server_id}")
-        return list_secret_flags(server_id, _secret_keys(server))
+        return self._secret_flags(server)
 
     # ------------------------------------------------------------------
     # Tool discovery
     # ------------------------------------------------------------------
     def list_tools(self, server_id: Optional[str] = None, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        self._maybe_reload()
         if server_id:
             server = self._servers.get(server_id)
             if not server:
                 raise MCPConfigError(f"Server not found: {server_id}")
             return self._get_tools_for_server(server, force_refresh)
 
+        servers = [server for server in self._servers.values() if server.get("enabled", True)]
+        tools_by_server = self._get_tools_for_servers(servers, force_refresh)
         tools: List[Dict[str, Any]] = []
-        for server in self._servers.values():
-            if not server.get("enabled", True):
-                continue
-            tools.extend(self._get_tools_for_server(server, force_refresh))
+        for server in servers:
+            tools.extend(tools_by_server[server["id"]])
         return tools
 
-    def _get_tools_for_server(self, server: Dict[str, Any], force_refresh: bool) -> List[Dict[str, Any]]:
-        server_id = server["id"]
-        
-        # Check cache with lock
-        with self._lock:
+    def _cached_tools(self, server_id: str, force_refresh: bool) -> Optional[List[Dict[str, Any]]]:
+        if force_refresh:
+            return None
+        with self._cache_lock:
             cache_entry = self._tool_cache.get(server_id)
-            if (
-                cache_entry
-                and not force_refresh
-                and (time.time() - cache_entry["timestamp"] < MCP_TOOL_CACHE_TTL)
-            ):
+            if cache_entry and time.time() - cache_entry["timestamp"] < MCP_TOOL_CACHE_TTL:
                 return cache_entry["tools"]
+        return None
 
-        # Fetch tools outside the lock (can be slow)
-        tools = self._run(self._list_tools_async, server)
-        
-        # Update cache with lock
-        with self._lock:
+    def _store_tools(self, server_id: str, tools: List[Dict[str, Any]]) -> None:
+        with self._cache_lock:
             self._tool_cache[server_id] = {
                 "timestamp": time.time(),
                 "tools": tools,
             }
+            self.tools_version += 1
+
+    def _get_tools_for_server(self, server: Dict[str, Any], force_refresh: bool) -> List[Dict[str, Any]]:
+        server_id = server["id"]
+        tools = self._cached_tools(server_id, force_refresh)
+        if tools is None:
+            # Fetch tools outside the lock (can be slow)
+            tools = self._run(self._list_tools_async, server)
+            self._store_tools(server_id, tools)
         return tools
 
+    def _get_tools_for_servers(
+        self, servers: List[Dict[str, Any]], force_refresh: bool
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Tools per server id; servers needing discovery are queried concurrently."""
+        tools_by_server: Dict[str, List[Dict[str, Any]]] = {}
+        stale: List[Dict[str, Any]] = []
+        for server in servers:
+            tools = self._cached_tools(server["id"], force_refresh)
+            if tools is None:
+                stale.append(server)
+            else:
+                tools_by_server[server["id"]] = tools
+
+        if stale:
+            results = self._run(self._list_tools_all_async, stale)
+            errors = []
+            for server in stale:
+                result = results[server["id"]]
+                if isinstance(result, Exception):
+                    errors.append(result)
+                else:
+                    self._store_tools(server["id"], result)
+                    tools_by_server[server["id"]] = result
+            # Same outcome as the sequential loop: the first failing server's error
+            if errors:
+                raise errors[0]
+        return tools_by_server
+
+    async def _list_tools_all_async(
+        self, servers: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Discover tools on several servers at once; failures are returned, not raised."""
+        results: Dict[str, Any] = {}
+
+        async def list_one(server: Dict[str, Any]) -> None:
+            try:
+                results[server["id"]] = await self._list_tools_async(server)
+            except Exception as exc:
+                results[server["id"]] = exc
+
+        async with anyio.create_task_group() as tg:
+            for server in servers:
+                tg.start_soon(list_one, server)
+        return results
+
     async def _list_tools_async(self, server: Dict[str, Any]) -> List[Dict[str, Any]]:
-        async with self._open_session(server) as session:
+        async with self._pooled_session(server) as session:
             result = await session.list_tools()
             serialized = []
             for tool in result.tools:
@@ -242,6 +465,7 @@ class MCPClientManager:
         arguments: Optional[Dict[str, Any]] = None,
         timeout_seconds: Optional[int] = None,
     ) -> Dict[str, Any]:
+        self._maybe_reload()
         server = self._servers.get(server_id)
         if not server:
             raise MCPConfigError(f"Server not found: {server_id}")
@@ -254,7 +478,7 @@ class MCPClientManager:
         arguments: Dict[str, Any],
         timeout_seconds: Optional[int],
     ) -> Dict[str, Any]:
-        async with self._open_session(server) as session:
+        async with self._pooled_session(server) as session:
             timeout = timedelta(seconds=timeout_seconds) if timeout_seconds else None
             try:
                 result: CallToolResult = await session.call_tool(
@@ -269,18 +493,111 @@ class MCPClientManager:
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
-    def _run(self, func, *args, **kwargs):
-        return anyio.run(func, *args, **kwargs)
+    def _run(self, func, *args):
+        return self._ensure_loop().call(func, *args)
 
-    def _get_secret_values(self, server_id: str, server: Dict[str, Any]) -> Dict[str, str]:
-        values: Dict[str, str] = {}
-        missing_secrets = []
-        for key in _secret_keys(server):
-            secret = get_secret(server_id, key)
-            if secret:
-                values[key] = secret
+    # ------------------------------------------------------------------
+    # Event loop and session pool
+    # ------------------------------------------------------------------
+    def _ensure_loop(self) -> BlockingPortal:
+        """Return the portal of the shared event loop thread, starting it if needed."""
+        if self._portal is None:
+            with self._loop_lock:
+                if self._portal is None:
+                    ready = threading.Event()
+                    thread = threading.Thread(
+                        target=self._loop_main, args=(ready,), name="mcp-event-loop", daemon=True
+                    )
+                    thread.start()
+                    ready.wait()
+                    if self._portal is None:
+                        raise MCPExecutionError("Failed to start the MCP event loop")
+        return self._portal
+
+    def _loop_main(self, ready: threading.Event) -> None:
+        async def main() -> None:
+            async with BlockingPortal() as portal, anyio.create_task_group() as tasks:
+                self._session_tasks = tasks
+                self._portal = portal
+                ready.set()
+                await portal.sleep_until_stopped()
+                tasks.cancel_scope.cancel()
+
+        try:
+            anyio.run(main)
+        finally:
+            ready.set()
+
+    async def _acquire_session(self, server: Dict[str, Any]) -> _PooledSession:
+        server_id = server["id"]
+        entry = self._sessions.get(server_id)
+        # Config, secret or Composio changes bump _secrets_version; reconnect then
+        if entry and (
+            entry.closed.is_set()
+            or entry.server is not server
+            or entry.version != self._secrets_version
+        ):
+            # Don't pull the session out from under calls still using it
+            entry.retired = True
+            if entry.in_use == 0:
+                entry.closed.set()
+            entry = None
+        if entry is None:
+            entry = _PooledSession(server, self._secrets_version)
+            self._sessions[server_id] = entry
+            self._session_tasks.start_soon(self._own_session, entry)
+        await entry.ready.wait()
+        if entry.error is not None:
+            raise entry.error
+        return entry
+
+    async def _own_session(self, entry: _PooledSession) -> None:
+        """Open a session, keep it alive until closed or idle, then tear it down."""
+        try:
+            async with self._open_session(entry.server) as session:
+                entry.session = session
+                entry.ready.set()
+                while not entry.closed.is_set():
+                    with anyio.move_on_after(MCP_SESSION_IDLE_TIMEOUT):
+                        await entry.closed.wait()
+                    idle_for = time.monotonic() - entry.last_used
+                    if entry.in_use == 0 and idle_for >= MCP_SESSION_IDLE_TIMEOUT:
+                        break
+        except Exception as exc:
+            if not entry.ready.is_set():
+                entry.error = exc
             else:
-                missing_secrets.append(key)
+                print(f"MCP session for '{entry.server.get('name', entry.server['id'])}' closed: {exc}")
+        finally:
+            entry.closed.set()
+            entry.ready.set()
+            if self._sessions.get(entry.server["id"]) is entry:
+                del self._sessions[entry.server["id"]]
+
+    @asynccontextmanager
+    async def _pooled_session(self, server: Dict[str, Any]):
+        """Borrow the server's live session, opening one if needed."""
+        entry = await self._acquire_session(server)
+        entry.in_use += 1
+        try:
+            yield entry.session
+        except (McpError, MCPExecutionError):
+            # Protocol-level errors leave the session usable
+            raise
+        except Exception:
+            # Anything else may mean a broken transport; reconnect next time
+            entry.closed.set()
+            raise
+        finally:
+            entry.in_use -= 1
+            entry.last_used = time.monotonic()
+            if entry.retired and entry.in_use == 0:
+                entry.closed.set()
+
+    def _get_secret_values(self, server_id: str, server: Dict[str, Any]) -> Dict[str, str]:
+        keys = self._cached_secret_keys(server)
+        values = get_secrets(server_id, list(keys))
+        missing_secrets = [key for key in keys if key not in values]
         
         if missing_secrets:
             print(f"Warning: Missing secrets for server '{server.get('name', server_id)}': {', '.join(missing_secrets)}")
@@ -337,6 +654,31 @@ class MCPClientManager:
             params[key] = _render_template(value, secrets)
         return params
 
+    def _static_url(self, server: Dict[str, Any]) -> Optional[str]:
+        """
+        Return the SSE/HTTP URL with query params applied, if it doesn't depend on secrets.
+        
+        Returns:
+            The cached URL, or None when the server has no URL or a query
+            param value is a template that must be rendered per session
+        """
+        server_id = server["id"]
+        entry = self._static_urls.get(server_id)
+        if entry and entry[0] is server:
+            return entry[1]
+
+        transport_config = server.get("sse" if server.get("transport") == TransportType.SSE else "http") or {}
+        url = transport_config.get("url")
+        param_entries = transport_config.get("query_params")
+        if not url or any("{{" in str(param.get("value", "")) for param in param_entries or []):
+            return None
+
+        url = self._apply_query_params(url, self._build_query_params(param_entries, {}))
+        with self._cache_lock:
+            if self._servers.get(server_id) is server:
+                self._static_urls[server_id] = (server, url)
+        return url
+
     def _apply_query_params(self, url: str, params: Dict[str, str]) -> str:
         if not params:
             return url
@@ -375,10 +717,17 @@ class MCPClientManager:
         if not oauth_connection_id:
             return None
         
+        # The endpoint is stable; avoid a Composio round-trip on every session open
+        cache_entry = self._composio_endpoint_cache.get(oauth_connection_id)
+        if cache_entry and time.time() - cache_entry[0] < COMPOSIO_ENDPOINT_TTL:
+            return cache_entry[1]
+        
         composio_api_key = get_composio_api_key()
         if not composio_api_key:
             raise MCPConfigError("Composio API key not configured")
         
+        from composio_client import ComposioClient, ComposioError
+        
         try:
             client = ComposioClient(composio_api_key)
             connection = client.get_connection(oauth_connection_id)
@@ -386,11 +735,29 @@ class MCPClientManager:
             # Status can be "active", "ACTIVE", etc. - compare case-insensitively
             status = str(connection.get("status", "")).lower()
             if status != "active":
+                self._drop_composio_endpoint(oauth_connection_id)
                 raise MCPConfigError(f"OAuth connection not active: {connection['status']}")
             
-            return connection["mcpEndpoint"]
+            endpoint = connection["mcpEndpoint"]
         except ComposioError as exc:
+            self._drop_composio_endpoint(oauth_connection_id)
             raise MCPConfigError(f"Failed to get Composio connection: {exc}") from exc
+        
+        with self._cache_lock:
+            self._composio_endpoint_cache[oauth_connection_id] = (time.time(), endpoint)
+        return endpoint
+
+    def _drop_composio_endpoint(self, oauth_connection_id: Optional[str]) -> None:
+        if oauth_connection_id:
+            with self._cache_lock:
+                self._composio_endpoint_cache.pop(oauth_connection_id, None)
+
+    def clear_composio_cache(self) -> None:
+        """Forget cached Composio endpoints (e.g. after the Composio API key changes)."""
+        with self._cache_lock:
+            self._composio_endpoint_cache.clear()
+            # Pooled Composio sessions carry the old key; have them reconnect
+            self._secrets_version += 1
 
     @asynccontextmanager
     async def _open_session(self, server: Dict[str, Any]):
@@ -402,22 +769,26 @@ class MCPClientManager:
         # Check if this is an OAuth-based server using Composio
         oauth_connection_id = server.get("oauth_connection_id")
         if oauth_connection_id:
-            # Override URL and headers with Composio MCP endpoint
-            composio_url = self._get_composio_mcp_url(server)
-            composio_headers = self._get_composio_headers(server)
+            # Override URL and headers with Composio MCP endpoint. Both may hit
+            # the keychain or Composio's API, so keep them off the shared loop.
+            composio_url = await to_thread.run_sync(self._get_composio_mcp_url, server)
+            composio_headers = await to_thread.run_sync(self._get_composio_headers, server)
             
             if not composio_url or not composio_headers:
                 raise MCPConfigError(f"Failed to get Composio MCP endpoint for '{server['name']}'")
             
             # Use HTTP transport with Composio endpoint
+            from mcp.client.streamable_http import streamablehttp_client
+
             async with streamablehttp_client(url=composio_url, headers=composio_headers) as (read_stream, write_stream, _):
                 async with ClientSession(read_stream, write_stream) as session:
                     await session.initialize()
                     yield session
             return
         
-        # Standard flow for non-OAuth servers
-        secrets = self._get_secret_values(server["id"], server)
+        # Standard flow for non-OAuth servers (keychain reads block; run them
+        # in a worker thread so other pooled sessions keep going)
+        secrets = await to_thread.run_sync(self._get_secret_values, server["id"], server)
 
         if transport == TransportType.SSE:
             sse_config = server.get("sse") or {}
@@ -426,8 +797,14 @@ class MCPClientManager:
                 raise MCPConfigError(f"SSE server '{server['name']}' is missing a URL")
 
             headers = self._build_sse_headers(server, secrets) or None
-            query_params = self._build_sse_query_params(server, secrets)
-            url = self._apply_query_params(url, query_params)
+            static_url = self._static_url(server)
+            if static_url:
+                url = static_url
+            else:
+                query_params = self._build_sse_query_params(server, secrets)
+                url = self._apply_query_params(url, query_params)
+            from mcp.client.sse import sse_client
+
             async with sse_client(url=url, headers=headers) as (read_stream, write_stream):
                 async with ClientSession(read_stream, write_stream) as session:
                     await session.initialize()
@@ -439,8 +816,14 @@ class MCPClientManager:
                 raise MCPConfigError(f"HTTP server '{server['name']}' is missing a URL")
 
             headers = self._build_http_headers(server, secrets) or None
-            query_params = self._build_http_query_params(server, secrets)
-            url = self._apply_query_params(url, query_params)
+            static_url = self._static_url(server)
+            if static_url:
+                url = static_url
+            else:
+                query_params = self._build_http_query_params(server, secrets)
+                url = self._apply_query_params(url, query_params)
+            from mcp.client.streamable_http import streamablehttp_client
+
             async with streamablehttp_client(url=url, headers=headers) as (read_stream, write_stream, _):
                 async with ClientSession(read_stream, write_stream) as session:
                     await session.initialize()
@@ -451,6 +834,8 @@ class MCPClientManager:
             if not command:
                 raise MCPConfigError(f"STDIO server '{server['name']}' is missing a command")
 
+            from mcp.client.stdio import StdioServerParameters, stdio_client
+
             parameters = StdioServerParameters(
                 command=command,
                 args=stdio_config.get("args", []),
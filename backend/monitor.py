@@ -4,10 +4,15 @@ import time
 import sqlite3
 import os
 import json
+import logging
 import re
 import subprocess
-from typing import Optional, Dict
+from collections import deque
+from typing import Deque, List, Optional, Dict, Tuple
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 
 from config import (
     WISPR_DB_PATH,
@@ -17,6 +22,8 @@ from config import (
     POLL_INTERVAL,
     WEB_PORT,
     LOGS_DIR,
+    MONITOR_RESUME_WINDOW,
+    MONITOR_STATE_FILE,
     ACTIVATION_SOUND_ENABLED,
     ACTIVATION_SOUND_PATH,
     AUTO_VOLUME_REDUCTION_ENABLED,
@@ -27,36 +34,91 @@ from executor import log_execution, ExecutionResult
 from command_manager import get_command_manager
 from command_runner import execute_with_logging
 from prompt_optimizer import process_optimize
-from bounded_set import BoundedSet
 from volume_controller import VolumeController
 from contextlib import contextmanager
 
+logger = logging.getLogger(__name__)
+
 _LOG_START_RE = re.compile(r"updateDictationStatus: listening")
 _LOG_END_RE = re.compile(r"updateDictationStatus: idle")
 _LOG_DISMISSED_RE = re.compile(r"updateDictationStatus: dismissed")
+# Anything str.isalnum() rejects (\w also matches '_')
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
 
 _DB_SETTLE_DELAY = 0.15
 _DB_FLUSH_TIMEOUT = 2.0
 _DB_FLUSH_POLL_INTERVAL = 0.25
 _WISPR_APP_PATH = "/Applications/Wispr Flow.app"
 
+# History columns read for a transcript; the rest (status, url,
+# personalizationStyleSettings, ...) are never used
+_TRANSCRIPT_COLUMNS = "transcriptEntityId, timestamp, asrText, formattedText, editedText, app"
+# Transcript dict keys, in _TRANSCRIPT_COLUMNS order (rows are plain tuples)
+_TRANSCRIPT_KEYS = ("id", "timestamp", "asrText", "formattedText", "editedText", "app")
+
+# Queries are module constants so every poll reuses sqlite3's cached prepared
+# statement. last_timestamp is always a value read back from the timestamp
+# column, so comparisons happen in the column's own storage type.
+# New rows are returned oldest first, so a burst of dictations (or a poll that
+# fell behind) is processed in order instead of keeping only the newest. They
+# are read in pages until a page comes back short.
+_TRANSCRIPT_PAGE_SIZE = 16
+_SQL_TRANSCRIPTS_AFTER = (
+    f"SELECT {_TRANSCRIPT_COLUMNS} FROM History WHERE timestamp > ?"
+    f" ORDER BY timestamp LIMIT {_TRANSCRIPT_PAGE_SIZE}"
+)
+_SQL_LATEST_TRANSCRIPT = f"SELECT {_TRANSCRIPT_COLUMNS} FROM History ORDER BY timestamp DESC LIMIT 1"
+
+# Wispr's schema isn't ours to change. Without an index led by timestamp the
+# queries above scan the whole table, so check MAX(rowid) first (History is
+# append-only, so a new transcript always raises it).
+_SQL_HAS_TIMESTAMP_INDEX = (
+    "SELECT 1 FROM pragma_index_list('History') AS il, pragma_index_info(il.name) AS ii"
+    " WHERE ii.seqno = 0 AND ii.name = 'timestamp' LIMIT 1"
+)
+_SQL_MAX_ROWID = "SELECT MAX(rowid) FROM History"
+
 
 class WisprMonitor:
     """Monitor Wispr Flow via log-file tailing for dictation events."""
 
-    def __init__(self, db_path: str = WISPR_DB_PATH, log_path: str = WISPR_LOG_PATH):
+    def __init__(
+        self,
+        db_path: str = WISPR_DB_PATH,
+        log_path: str = WISPR_LOG_PATH,
+        state_file: str = MONITOR_STATE_FILE,
+    ):
         self.db_path = os.path.expanduser(db_path)
         self.log_path = os.path.expanduser(log_path)
+        self.state_file = state_file
+        # (timestamp, id) of the newest transcript handled; saved on stop()
+        self._last_processed: Optional[Tuple[float, str]] = None
+        # start() resumed from a saved position; catch up once the loop runs
+        self._resumed = False
         self.activation_word = ACTIVATION_WORD.lower()
         self.optimize_activation_word = OPTIMIZE_ACTIVATION_WORD.lower()
         self.poll_interval = POLL_INTERVAL
         self.is_running = False
         self.monitor_thread: Optional[threading.Thread] = None
         self.last_timestamp: Optional[float] = None
-        self.processed_ids: BoundedSet[str] = BoundedSet(max_size=1000)
+        # Queries only return rows newer than last_timestamp, so ids are only
+        # needed to de-duplicate rows at that boundary; a few recent ones suffice
+        self.processed_ids: Deque[str] = deque(maxlen=16)
+        self.processed_count = 0
         self._stop_event = threading.Event()
+        self.activation_sound_path = os.path.expanduser(ACTIVATION_SOUND_PATH)
         self._activation_sound_warned = False
         self._dictation_active = False
+        # Shared read-only connection to Wispr's DB (see get_db_connection)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_inode: Optional[int] = None
+        self._conn_lock = threading.RLock()
+        # Set per connection: probe by rowid when History.timestamp is unindexed
+        self._probe_by_rowid = False
+        self._last_rowid: Optional[int] = None
+        # Transcripts are fetched and processed here, one at a time, so the
+        # log-tailing / DB-polling loops keep running meanwhile
+        self._transcript_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='transcript')
 
         self._volume_controller: Optional[VolumeController] = None
         if AUTO_VOLUME_REDUCTION_ENABLED:
@@ -66,65 +128,102 @@ class WisprMonitor:
     # Database helpers (still needed to fetch transcript content)
     # ------------------------------------------------------------------
 
+    def _open_db_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False
+        )
+        # query_only backs up mode=ro: this is Wispr Flow's database, never ours
+        # to write. journal_mode/synchronous are left alone for the same reason.
+        conn.executescript(
+            "PRAGMA mmap_size=268435456; PRAGMA cache_size=-20000; PRAGMA temp_store=MEMORY;"
+            " PRAGMA query_only=1;"
+        )
+        self._probe_by_rowid = conn.execute(_SQL_HAS_TIMESTAMP_INDEX).fetchone() is None
+        self._last_rowid = None
+        return conn
+
     @contextmanager
     def get_db_connection(self):
-        conn = None
-        try:
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row
-            yield conn
-        except sqlite3.Error as e:
-            print(f"Error connecting to database: {e}")
-            raise
-        finally:
-            if conn:
-                conn.close()
+        """
+        Yield the shared read-only connection, opening it on first use.
 
-    def get_latest_transcript(self, conn, last_timestamp: Optional[float] = None) -> Optional[Dict]:
-        """Get the latest transcript from the History table."""
-        try:
-            cursor = conn.cursor()
-
-            if last_timestamp:
-                query = """
-                    SELECT transcriptEntityId, timestamp, asrText, formattedText, editedText, 
-                           status, app, url, personalizationStyleSettings
-                    FROM History 
-                    WHERE timestamp > ? 
-                    ORDER BY timestamp DESC 
-                    LIMIT 1
-                """
-                cursor.execute(query, (last_timestamp,))
-            else:
-                query = """
-                    SELECT transcriptEntityId, timestamp, asrText, formattedText, editedText,
-                           status, app, url, personalizationStyleSettings
-                    FROM History 
-                    ORDER BY timestamp DESC 
-                    LIMIT 1
-                """
-                cursor.execute(query)
-
-            row = cursor.fetchone()
-
-            if row:
-                return {
-                    'id': row['transcriptEntityId'],
-                    'timestamp': row['timestamp'],
-                    'asrText': row['asrText'],
-                    'formattedText': row['formattedText'],
-                    'editedText': row['editedText'],
-                    'status': row['status'],
-                    'app': row['app'],
-                    'url': row['url'],
-                    'personalizationStyleSettings': row['personalizationStyleSettings']
-                }
+        The connection is kept across polls. It is reopened when the database
+        file is replaced (e.g. by a Wispr Flow reinstall) and after an error.
+        """
+        with self._conn_lock:
+            try:
+                inode = self._get_file_inode(self.db_path)
+                if self._conn is not None and inode != self._conn_inode:
+                    self.close_db_connection()
+                if self._conn is None:
+                    self._conn = self._open_db_connection()
+                    self._conn_inode = inode
+                yield self._conn
+            except sqlite3.Error as e:
+                print(f"Error connecting to database: {e}")
+                self.close_db_connection()
+                raise
 
+    def close_db_connection(self) -> None:
+        with self._conn_lock:
+            if self._conn is not None:
+                try:
+                    self._conn.close()
+                except sqlite3.Error:
+                    pass
+                self._conn = None
+
+    def _max_rowid(self, conn) -> Optional[int]:
+        """History's largest rowid (None if the table is empty or has no rowid)."""
+        try:
+            return conn.execute(_SQL_MAX_ROWID).fetchone()[0]
+        except sqlite3.OperationalError:
+            # WITHOUT ROWID table: always run the timestamp query
+            self._probe_by_rowid = False
             return None
 
+    def get_latest_transcript(self, conn) -> Optional[Dict]:
+        """Get the latest transcript from the History table."""
+        try:
+            row = conn.execute(_SQL_LATEST_TRANSCRIPT).fetchone()
         except sqlite3.Error as e:
             print(f"Error querying database: {e}")
             return None
+        return dict(zip(_TRANSCRIPT_KEYS, row)) if row else None
+
+    def get_new_transcripts(self, conn, last_timestamp: Optional[float]) -> List[Dict]:
+        """
+        Transcripts newer than `last_timestamp`, oldest first.
+
+        Without a watermark yet, only the latest transcript is returned. When
+        timestamp is unindexed, a MAX(rowid) probe runs first so the common
+        no-new-row case never scans the table.
+        """
+        if last_timestamp is None:
+            latest = self.get_latest_transcript(conn)
+            return [latest] if latest else []
+
+        newest = None
+        transcripts = []
+        try:
+            if self._probe_by_rowid:
+                newest = self._max_rowid(conn)
+                if self._probe_by_rowid and (newest is None or newest == self._last_rowid):
+                    return []
+            while True:
+                rows = conn.execute(_SQL_TRANSCRIPTS_AFTER, (last_timestamp,)).fetchall()
+                transcripts.extend(dict(zip(_TRANSCRIPT_KEYS, row)) for row in rows)
+                if len(rows) < _TRANSCRIPT_PAGE_SIZE:
+                    break
+                # Full page: there may be newer rows after its last one
+                last_timestamp = rows[-1][1]
+        except sqlite3.Error as e:
+            print(f"Error querying database: {e}")
+            return []
+        # Only skip this rowid from now on, once everything up to it was read
+        if newest is not None:
+            self._last_rowid = newest
+        return transcripts
 
     # ------------------------------------------------------------------
     # Text helpers
@@ -134,23 +233,23 @@ class WisprMonitor:
         text = transcript.get('editedText') or transcript.get('formattedText') or ""
         return text.strip()
 
+    @staticmethod
+    def _first_word_normalized(text: str) -> str:
+        """Lowercased alphanumerics of the first word (only the first word is split off)."""
+        words = text.split(None, 1)
+        if not words:
+            return ''
+        return _NON_ALNUM_RE.sub('', words[0]).lower()
+
     def contains_activation_word(self, text: str) -> bool:
         if not text:
             return False
-        words = text.split()
-        if not words:
-            return False
-        first_word_normalized = ''.join(c for c in words[0].lower() if c.isalnum())
-        return first_word_normalized == self.activation_word
+        return self._first_word_normalized(text) == self.activation_word
 
     def contains_optimize_activation_word(self, text: str) -> bool:
         if not text:
             return False
-        words = text.split()
-        if not words:
-            return False
-        first_word_normalized = ''.join(c for c in words[0].lower() if c.isalnum())
-        return first_word_normalized == self.optimize_activation_word
+        return self._first_word_normalized(text) == self.optimize_activation_word
 
     def remove_activation_word(self, text: str, activation_word: str) -> str:
         if not text:
@@ -171,7 +270,7 @@ class WisprMonitor:
         if not ACTIVATION_SOUND_ENABLED:
             return
 
-        sound_path = os.path.expanduser(ACTIVATION_SOUND_PATH)
+        sound_path = self.activation_sound_path
         if not os.path.exists(sound_path):
             if not self._activation_sound_warned:
                 print(f"Warning: Activation sound file not found: {sound_path}")
@@ -202,50 +301,70 @@ class WisprMonitor:
     def _on_dictation_start(self) -> None:
         """Called when the user begins dictating."""
         self._dictation_active = True
-        print("\n🎙️  Dictation started")
+        logger.info("\n🎙️  Dictation started")
         if self._volume_controller:
             self._volume_controller.on_dictation_start()
 
     def _on_dictation_dismissed(self) -> None:
         """Called when the user cancels dictation (e.g. presses Esc)."""
         self._dictation_active = False
-        print("⏹️  Dictation cancelled")
+        logger.info("⏹️  Dictation cancelled")
         if self._volume_controller:
             self._volume_controller.on_dictation_end()
 
     def _on_dictation_end(self) -> None:
-        """Called when dictation finishes — fetch transcript and process."""
+        """Called when dictation finishes — queue the transcript for processing."""
         self._dictation_active = False
-        print("✅  Dictation ended")
+        logger.info("✅  Dictation ended")
 
         if self._volume_controller:
             self._volume_controller.on_dictation_end()
 
+        self._transcript_executor.submit(self._run_transcript_task, self._fetch_and_process_transcript)
+
+    def _run_transcript_task(self, task, *args) -> None:
+        """Run `task` on the transcript worker, reporting errors instead of dropping them."""
+        try:
+            task(*args)
+        except Exception as e:
+            print(f"\nError processing transcript: {e}")
+            import traceback
+            traceback.print_exc()
+
+    def _fetch_and_process_transcript(self) -> None:
         # Wait for the transcript to appear in the DB, retrying over
         # _DB_FLUSH_TIMEOUT seconds.  Wispr occasionally fails to flush
         # the record; when that happens we restart the app to recover.
-        time.sleep(_DB_SETTLE_DELAY)
+        if self._stop_event.wait(_DB_SETTLE_DELAY):
+            return
 
-        transcript = self._wait_for_transcript()
-        if transcript:
+        transcripts = self._wait_for_transcripts()
+        for transcript in transcripts:
             self._process_transcript(transcript)
-        else:
+        if not transcripts and not self._stop_event.is_set():
             print(f"⚠️  No new transcript found in DB after {_DB_FLUSH_TIMEOUT}s — Wispr may be stuck")
             self._restart_wispr()
 
-    def _wait_for_transcript(self) -> Optional[Dict]:
-        """Poll the DB for a new transcript, returning it or None on timeout."""
+    def _wait_for_transcripts(self) -> List[Dict]:
+        """Poll the DB for new transcripts, returning them oldest first ([] on timeout)."""
         deadline = time.monotonic() + _DB_FLUSH_TIMEOUT
+        last_signature = None
         while time.monotonic() < deadline:
-            try:
-                with self.get_db_connection() as conn:
-                    new = self.get_latest_transcript(conn, self.last_timestamp)
-                if new and new['id'] not in self.processed_ids:
-                    return new
-            except sqlite3.Error as e:
-                print(f"Database error while waiting for transcript: {e}")
-            time.sleep(_DB_FLUSH_POLL_INTERVAL)
-        return None
+            # Re-query only after Wispr has written to the database files
+            signature = self._db_signature()
+            if signature != last_signature:
+                try:
+                    with self.get_db_connection() as conn:
+                        new = self.get_new_transcripts(conn, self.last_timestamp)
+                    new = [t for t in new if t['id'] not in self.processed_ids]
+                    if new:
+                        return new
+                    last_signature = signature
+                except sqlite3.Error as e:
+                    print(f"Database error while waiting for transcript: {e}")
+            if self._stop_event.wait(_DB_FLUSH_POLL_INTERVAL):
+                break
+        return []
 
     # ------------------------------------------------------------------
     # Wispr Flow restart
@@ -289,11 +408,9 @@ class WisprMonitor:
         asr_text_raw = new_transcript.get('asrText')
         asr_text = asr_text_raw.strip() if asr_text_raw and isinstance(asr_text_raw, str) else ''
 
+        handled = True
         if self.contains_optimize_activation_word(asr_text):
-            print(f"\nNew optimize request detected!")
-            print(f"   ID: {new_transcript['id']}")
-            print(f"   Timestamp: {new_transcript['timestamp']}")
-            print(f"   App: {new_transcript.get('app', 'N/A')}")
+            self._log_transcript("New optimize request detected!", new_transcript)
 
             transcript_without_activation = self.remove_activation_word(
                 text, self.optimize_activation_word
@@ -301,37 +418,100 @@ class WisprMonitor:
             process_optimize(transcript_without_activation)
 
         elif self.contains_activation_word(asr_text):
-            print(f"\nNew command transcript detected!")
-            print(f"   ID: {new_transcript['id']}")
-            print(f"   Timestamp: {new_transcript['timestamp']}")
-            print(f"   App: {new_transcript.get('app', 'N/A')}")
+            self._log_transcript("New command transcript detected!", new_transcript)
 
             self.play_activation_sound()
             self.process_command(text)
 
-        elif text:
-            print(f"New transcript (no activation word): {text[:50]}...")
+        else:
+            if text:
+                logger.debug("New transcript (no activation word): %.50s...", text)
+            handled = False
+
+        self.processed_ids.append(new_transcript['id'])
+        self.processed_count += 1
+        # The polling loop may already have advanced past this (older) row
+        if self.last_timestamp is None or new_transcript['timestamp'] > self.last_timestamp:
+            self.last_timestamp = new_transcript['timestamp']
+        self._last_processed = (new_transcript['timestamp'], new_transcript['id'])
+        # Only commands are worth a write here; re-reading plain dictations
+        # after a crash just logs them again. stop() saves the rest.
+        if handled:
+            self._save_state()
+
+    # ------------------------------------------------------------------
+    # Saved position
+    # ------------------------------------------------------------------
+
+    def _save_state(self) -> None:
+        """Atomically record the newest handled transcript and when it was saved."""
+        if self._last_processed is None:
+            return
+        last_timestamp, last_id = self._last_processed
+        state = {"last_timestamp": last_timestamp, "last_id": last_id, "saved_at": time.time()}
+        tmp_path = f"{self.state_file}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.state_file), exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                f.write(orjson.dumps(state))
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            print(f"Warning: Could not save monitor state: {e}")
+
+    def _load_state(self) -> Optional[Dict]:
+        """
+        Return the saved position, or None if it is missing or too old.
+
+        Only a position saved within MONITOR_RESUME_WINDOW seconds is reused,
+        so a quick restart processes what was dictated in between, while
+        commands dictated long ago (e.g. before a reboot) are never run late.
+        """
+        try:
+            with open(self.state_file, 'rb') as f:
+                state = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return None
 
-        self.processed_ids.add(new_transcript['id'])
-        self.last_timestamp = new_transcript['timestamp']
+        if not isinstance(state, dict) or not {"last_timestamp", "last_id", "saved_at"} <= state.keys():
+            return None
+        if time.time() - state["saved_at"] > MONITOR_RESUME_WINDOW:
+            return None
+        return state
+
+    def _catch_up(self) -> None:
+        """Process transcripts written while the monitor was down (after a resume)."""
+        with self.get_db_connection() as conn:
+            pending = self.get_new_transcripts(conn, self.last_timestamp)
+        for transcript in pending:
+            if transcript['id'] not in self.processed_ids:
+                self._process_transcript(transcript)
+
+    @staticmethod
+    def _log_transcript(headline: str, transcript: Dict) -> None:
+        logger.info(
+            "\n%s\n   ID: %s\n   Timestamp: %s\n   App: %s",
+            headline, transcript['id'], transcript['timestamp'], transcript.get('app', 'N/A'),
+        )
 
     def process_command(self, text: str) -> Optional[ExecutionResult]:
-        print(f"\n{'='*60}")
-        print(f"Detected command: {text}")
-        print(f"{'='*60}\n")
+        # Each block below is a single log record (one write on the logging
+        # thread) rather than a run of print() calls
+        rule = '=' * 60
+        logger.info("\n%s\nDetected command: %s\n%s\n", rule, text, rule)
 
         parse_result = parse_command(text)
 
         if not parse_result.get('success'):
-            print(f"Unable to parse command: {parse_result.get('error', 'Unknown error')}")
+            lines = [f"Unable to parse command: {parse_result.get('error', 'Unknown error')}"]
             if parse_result.get('response_text'):
-                print(f"Claude says: {parse_result['response_text']}")
+                lines.append(f"Claude says: {parse_result['response_text']}")
+            logger.warning("\n".join(lines))
             return None
 
-        print(f"Matched command: {parse_result['command_name']}")
-        print(f"Parameters: {json.dumps(parse_result['parameters'], indent=2)}")
-
-        print("\nExecuting action...")
+        logger.info("Matched command: %s", parse_result['command_name'])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Parameters: %s", json.dumps(parse_result['parameters'], indent=2))
+        logger.info("\nExecuting action...")
 
         manager = get_command_manager()
         command = manager.get_command(parse_result['command_id'])
@@ -343,15 +523,13 @@ class WisprMonitor:
         )
 
         if result.success:
-            print(f"Execution successful ({result.duration:.2f}s)")
-            if result.output:
-                print(f"Output: {result.output[:200]}")
+            lines = [f"Execution successful ({result.duration:.2f}s)"]
         else:
-            print(f"Execution failed: {result.error}")
-            if result.output:
-                print(f"Output: {result.output[:200]}")
-
-        print(f"\n{'='*60}\n")
+            lines = [f"Execution failed: {result.error}"]
+        if result.output:
+            lines.append(f"Output: {result.output[:200]}")
+        lines.append(f"\n{rule}\n")
+        logger.log(logging.INFO if result.success else logging.WARNING, "\n".join(lines))
 
         log_execution(result, os.path.join(LOGS_DIR, 'executions.log'))
 
@@ -377,6 +555,10 @@ class WisprMonitor:
             self._monitor_loop_db_fallback()
             return
 
+        if self._resumed:
+            # The DB fallback loop catches up on its first tick by itself
+            self._transcript_executor.submit(self._run_transcript_task, self._catch_up)
+
         try:
             f.seek(0, 2)
             current_inode = self._get_file_inode(self.log_path)
@@ -408,28 +590,62 @@ class WisprMonitor:
         finally:
             f.close()
 
+    def _db_signature(self) -> tuple:
+        """
+        (mtime, size) of the database and its WAL file.
+
+        Wispr Flow's inserts land in the -wal file first (or the main file when
+        not in WAL mode), so an unchanged signature means no new transcript.
+        """
+        signature = []
+        for path in (self.db_path, self.db_path + "-wal"):
+            try:
+                st = os.stat(path)
+                signature.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
     def _monitor_loop_db_fallback(self):
         """Legacy DB-polling fallback in case the log file is unavailable."""
+        last_signature = None
+        next_tick = time.monotonic()
         while not self._stop_event.is_set():
             try:
-                try:
-                    with self.get_db_connection() as conn:
-                        new_transcript = self.get_latest_transcript(conn, self.last_timestamp)
-                except sqlite3.Error as e:
-                    print(f"Database error in monitor loop: {e}")
-                    self._stop_event.wait(self.poll_interval)
-                    continue
-
-                if new_transcript and new_transcript['id'] not in self.processed_ids:
-                    self._process_transcript(new_transcript)
-
-                self._stop_event.wait(self.poll_interval)
+                # Two stat() calls per tick; only connect and query when the
+                # database files actually changed
+                signature = self._db_signature()
+                if signature != last_signature:
+                    try:
+                        with self.get_db_connection() as conn:
+                            new_transcripts = self.get_new_transcripts(conn, self.last_timestamp)
+                    except sqlite3.Error as e:
+                        print(f"Database error in monitor loop: {e}")
+                    else:
+                        last_signature = signature
+                        for new_transcript in new_transcripts:
+                            if new_transcript['id'] in self.processed_ids:
+                                continue
+                            # Process on the transcript worker so polling isn't
+                            # held up by Claude and the command. Advance the
+                            # watermark now so later ticks don't queue it again.
+                            self.last_timestamp = new_transcript['timestamp']
+                            self._transcript_executor.submit(
+                                self._run_transcript_task, self._process_transcript, new_transcript
+                            )
 
             except Exception as e:
                 print(f"\nMonitor error: {e}")
                 import traceback
                 traceback.print_exc()
-                self._stop_event.wait(self.poll_interval)
+
+            # Fixed-rate ticks: time spent working comes out of the wait. After
+            # a long command, restart the schedule instead of polling in a burst.
+            next_tick += self.poll_interval
+            now = time.monotonic()
+            if next_tick <= now:
+                next_tick = now + self.poll_interval
+            self._stop_event.wait(next_tick - now)
 
     # ------------------------------------------------------------------
     # Start / stop / status
@@ -478,21 +694,31 @@ How to use:
             for cmd in enabled:
                 print(f"   - {cmd['name']}")
 
-        try:
-            with self.get_db_connection() as conn:
-                latest = self.get_latest_transcript(conn)
-                self.last_timestamp = latest['timestamp'] if latest else None
-
-                if latest:
-                    self.processed_ids.add(latest['id'])
-                    print(f"\nConnected to database")
-                    print(f"Starting from timestamp: {self.last_timestamp}\n")
-                else:
-                    print("\nConnected to database")
-                    print("Waiting for first transcript...\n")
-        except sqlite3.Error as e:
-            print(f"Error connecting to database: {e}")
-            return
+        state = self._load_state()
+        self._resumed = state is not None
+        if state:
+            # Recent restart: pick up from the last handled transcript so
+            # anything dictated in between is still processed
+            self.last_timestamp = state['last_timestamp']
+            self.processed_ids.append(state['last_id'])
+            print("\nResuming from saved position")
+            print(f"Starting from timestamp: {self.last_timestamp}\n")
+        else:
+            try:
+                with self.get_db_connection() as conn:
+                    latest = self.get_latest_transcript(conn)
+                    self.last_timestamp = latest['timestamp'] if latest else None
+
+                    if latest:
+                        self.processed_ids.append(latest['id'])
+                        print(f"\nConnected to database")
+                        print(f"Starting from timestamp: {self.last_timestamp}\n")
+                    else:
+                        print("\nConnected to database")
+                        print("Waiting for first transcript...\n")
+            except sqlite3.Error as e:
+                print(f"Error connecting to database: {e}")
+                return
 
         self.is_running = True
         self._stop_event.clear()
@@ -513,6 +739,8 @@ How to use:
 
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
+        self.close_db_connection()
+        self._save_state()
 
         print("Monitor stopped\n")
 
@@ -525,7 +753,7 @@ How to use:
             "activation_word": self.activation_word,
             "poll_interval": self.poll_interval,
             "last_timestamp": self.last_timestamp,
-            "processed_count": len(self.processed_ids),
+            "processed_count": self.processed_count,
             "dictation_active": self._dictation_active,
             "volume_reduction": AUTO_VOLUME_REDUCTION_ENABLED,
         }
@@ -1,8 +1,54 @@
 """Command parser using Claude's tool calling to route commands."""
 
-from typing import Dict, Optional, Any
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Any, Tuple
 from llm_client import get_claude_client
 from command_manager import get_command_manager
+from mcp_client import get_mcp_manager
+
+
+# Recent parse results keyed by (normalized transcript, command tools_version,
+# MCP tools_version), so a repeated command skips the Claude round-trip. A
+# server can change its tools before its list is refetched, hence the TTL.
+PARSE_CACHE_MAXSIZE = 256
+PARSE_CACHE_TTL = 300  # seconds
+_parse_cache: "OrderedDict[Tuple[str, int, int], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
+
+
+def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a cached result so callers can't mutate the cached parameters."""
+    return {**result, "parameters": dict(result.get("parameters") or {})}
+
+
+def _parse_cache_key(transcript_text: str, manager) -> Tuple[str, int, int]:
+    return (
+        " ".join(transcript_text.split()),
+        manager.tools_version,
+        get_mcp_manager().tools_version,
+    )
+
+
+def _get_cached_parse(key: Tuple[str, int, int]) -> Optional[Dict[str, Any]]:
+    with _parse_cache_lock:
+        entry = _parse_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= PARSE_CACHE_TTL:
+            del _parse_cache[key]
+            return None
+        _parse_cache.move_to_end(key)
+        return _copy_result(entry[1])
+
+
+def _store_parse(key: Tuple[str, int, int], result: Dict[str, Any]) -> None:
+    with _parse_cache_lock:
+        _parse_cache[key] = (time.monotonic(), _copy_result(result))
+        _parse_cache.move_to_end(key)
+        while len(_parse_cache) > PARSE_CACHE_MAXSIZE:
+            _parse_cache.popitem(last=False)
 
 
 def parse_command(transcript_text: str) -> Dict[str, Any]:
@@ -30,8 +76,16 @@ def parse_command(transcript_text: str) -> Dict[str, Any]:
         client = get_claude_client()
         manager = get_command_manager()
         
+        # Only whitespace is normalized: case can matter for extracted parameters
+        cache_key = _parse_cache_key(transcript_text, manager)
+        cached = _get_cached_parse(cache_key)
+        if cached is not None:
+            return cached
+        
         # Get all enabled commands as tools
         tools = manager.get_claude_tools()
+        # Building the tools may have refreshed MCP tool lists
+        cache_key = _parse_cache_key(transcript_text, manager)
         
         if not tools:
             return {
@@ -89,22 +143,26 @@ def parse_command(transcript_text: str) -> Dict[str, Any]:
                     "parameters": parameters
                 }
             
-            return {
+            result = {
                 "success": True,
                 "command_id": command_id,
                 "command_name": command.get("name", "Unknown"),
                 "parameters": parameters,
                 "error": None
             }
+            _store_parse(cache_key, result)
+            return result
         
-        # No tool was used - command not matched
-        return {
+        # No tool was used - command not matched (cached too, so repeats are cheap)
+        result = {
             "success": False,
             "error": "No matching command found",
             "command_id": None,
             "parameters": {},
             "response_text": response.get("text", "")
         }
+        _store_parse(cache_key, result)
+        return result
         
     except Exception as e:
         return {
@@ -1,13 +1,159 @@
 """Module for extracting concise answers from execution results and speaking them."""
 
+import atexit
+import logging
 import subprocess
 import json
 import os
+import queue
+import re
+import shutil
 import tempfile
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional
-from llm_client import get_claude_client
-from config import TTS_PROVIDER, CARTESIA_API_KEY, CARTESIA_MODEL_ID, CARTESIA_VOICE_ID
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from functools import lru_cache
+from typing import Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
+from urllib3.util.retry import Retry
+from answer_cache import answer_cache_key, get_cached_answer, store_answer
+from llm_client import get_claude_client, prewarm_claude_client_in_background
+from config import (
+    TTS_PROVIDER,
+    CARTESIA_API_KEY,
+    CARTESIA_MODEL_ID,
+    CARTESIA_VOICE_ID,
+    CARTESIA_OUTPUT_FORMAT,
+    READ_ALOUD_STREAMING,
+    TTS_SUMMARIZER_MODEL,
+)
+
+logger = logging.getLogger(__name__)
+
+CARTESIA_TTS_URL = "https://api.cartesia.ai/tts/bytes"
+
+# Cartesia output formats by CARTESIA_OUTPUT_FORMAT. Compressed mp3 is roughly a
+# tenth of the bytes of 44.1kHz PCM, which matters because playback waits on it.
+CARTESIA_OUTPUT_FORMATS = {
+    "mp3": {"container": "mp3", "sample_rate": 22050, "bit_rate": 32000},
+    "wav": {"container": "wav", "encoding": "pcm_s16le", "sample_rate": 44100},
+}
+
+# Read-aloud jobs run here, one at a time so utterances never overlap
+_TTS_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tts')
+atexit.register(_TTS_EXECUTOR.shutdown, wait=False)
+
+# Texts longer than this (characters) are split into sentences synthesized in parallel
+CARTESIA_SPLIT_LENGTH = 200
+
+# Shared Cartesia session so repeated TTS calls reuse a kept-alive TLS connection
+_CARTESIA_SESSION: Optional[requests.Session] = None
+_CARTESIA_SESSION_LOCK = threading.Lock()
+
+
+def _get_cartesia_session() -> requests.Session:
+    """Return the shared Cartesia HTTP session, creating it on first use."""
+    global _CARTESIA_SESSION
+    if _CARTESIA_SESSION is None:
+        with _CARTESIA_SESSION_LOCK:
+            if _CARTESIA_SESSION is None:
+                session = requests.Session()
+                # TTS requests have no side effects, so POST is safe to retry
+                retry = Retry(
+                    total=2,
+                    backoff_factor=0.2,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset({"POST"}),
+                    raise_on_status=False,
+                )
+                session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry))
+                session.headers.update({
+                    "Cartesia-Version": "2024-06-10",
+                    "X-API-Key": CARTESIA_API_KEY,
+                })
+                _CARTESIA_SESSION = session
+    return _CARTESIA_SESSION
+
+
+ANSWER_SYSTEM_PROMPT = (
+    "You are a helpful assistant that extracts concise, speakable answers from command execution results. "
+    "Keep responses very brief and conversational - suitable for reading out loud. "
+    "Maximum 2-3 sentences unless absolutely necessary."
+)
+ANSWER_MAX_TOKENS = 120  # 2-3 spoken sentences; fewer tokens means earlier audio
+NO_ANSWER_TEXT = "I couldn't extract a clear answer from the result."
+ANSWER_ERROR_TEXT = "I encountered an error while processing the result."
+
+# Successful output at most this long (and this many line breaks) that doesn't
+# look like structured data is spoken as-is, without asking Claude to condense it
+PLAIN_ANSWER_MAX_LENGTH = 200
+PLAIN_ANSWER_MAX_NEWLINES = 2
+
+# Result text sent to Claude is condensed to roughly this many tokens
+# (estimated at ~4 characters per token), keeping the start and end of long output
+ANSWER_INPUT_MAX_TOKENS = 800
+CONDENSE_KEEP_LINES = 20
+
+_ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*[A-Za-z]')
+_BLANK_LINE_RUNS = re.compile(r'\n{3,}')
+# executor.execute_http prefixes the response body with this line
+_HTTP_STATUS_LINE = re.compile(r'Status: \d{3}\n')
+
+# A sentence ends at . ! or ? followed by whitespace
+_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+
+def _build_answer_prompt(original_command: str, execution_result: str) -> str:
+    return f"""Original command: "{original_command}"
+
+Execution result:
+{execution_result}
+
+Please extract the concise answer to the original command. Keep it brief and conversational, suitable for text-to-speech. 
+Focus only on the key information that answers the user's query. If there's an error, explain it briefly.
+Do not include any formatting, code blocks, or special characters - just plain text.
+Also, if there are numbers involved, make sure you understand what they mean and read them accordingly."""
+
+
+def _condense(result_text: str) -> str:
+    """
+    Shrink command output before it goes to Claude.
+    
+    Strips ANSI color codes and trailing whitespace, collapses runs of blank
+    lines, keeps only the first and last CONDENSE_KEEP_LINES lines of long
+    output, and finally caps the text at ANSWER_INPUT_MAX_TOKENS.
+    """
+    text = _ANSI_ESCAPE.sub('', result_text)
+    lines = [line.rstrip() for line in text.strip().splitlines()]
+    if len(lines) > 2 * CONDENSE_KEEP_LINES:
+        elided = len(lines) - 2 * CONDENSE_KEEP_LINES
+        lines = lines[:CONDENSE_KEEP_LINES] + [f"... (elided {elided} lines) ..."] + lines[-CONDENSE_KEEP_LINES:]
+    text = _BLANK_LINE_RUNS.sub('\n\n', '\n'.join(lines))
+    
+    max_chars = ANSWER_INPUT_MAX_TOKENS * 4
+    if len(text) > max_chars:
+        text = text[:max_chars] + "... (truncated)"
+    return text
+
+
+def _as_plain_answer(execution_result: Dict[str, Any], result_text: str) -> Optional[str]:
+    """Return the result text if it can be read aloud directly, else None."""
+    if not execution_result.get("success"):
+        return None
+    stripped = result_text.strip()
+    # Judge (and speak) the HTTP body, not the status line in front of it
+    status_line = _HTTP_STATUS_LINE.match(stripped)
+    if status_line:
+        stripped = stripped[status_line.end():].strip()
+    if (
+        not stripped
+        or len(stripped) > PLAIN_ANSWER_MAX_LENGTH
+        or stripped.count("\n") > PLAIN_ANSWER_MAX_NEWLINES
+        or stripped.startswith(("{", "[", "<"))
+    ):
+        return None
+    return stripped
 
 
 def extract_concise_answer(original_command: str, execution_result: str) -> str:
@@ -21,114 +167,279 @@ def extract_concise_answer(original_command: str, execution_result: str) -> str:
     Returns:
         A concise answer suitable for text-to-speech
     """
-    client = get_claude_client()
+    cache_key = answer_cache_key(original_command, execution_result, TTS_SUMMARIZER_MODEL)
+    cached = get_cached_answer(cache_key)
+    if cached:
+        return cached
     
-    # Build the prompt for Claude
-    user_message = f"""Original command: "{original_command}"
-
-Execution result:
-{execution_result}
-
-Please extract the concise answer to the original command. Keep it brief and conversational, suitable for text-to-speech. 
-Focus only on the key information that answers the user's query. If there's an error, explain it briefly.
-Do not include any formatting, code blocks, or special characters - just plain text.
-Also, if there are numbers involved, make sure you understand what they mean and read them accordingly."""
-
-    system_prompt = (
-        "You are a helpful assistant that extracts concise, speakable answers from command execution results. "
-        "Keep responses very brief and conversational - suitable for reading out loud. "
-        "Maximum 2-3 sentences unless absolutely necessary."
-    )
+    client = get_claude_client()
     
     try:
         response = client.call_with_tools(
-            user_message=user_message,
+            user_message=_build_answer_prompt(original_command, execution_result),
             tools=[],  # No tools needed, we just want text response
-            system_prompt=system_prompt,
-            max_tokens=300  # Keep responses concise
+            system_prompt=ANSWER_SYSTEM_PROMPT,
+            max_tokens=ANSWER_MAX_TOKENS,
+            model=TTS_SUMMARIZER_MODEL
         )
         
         if response.get("success") and response.get("text"):
-            return response["text"].strip()
+            answer = response["text"].strip()
+            store_answer(cache_key, answer)
+            return answer
         else:
-            return "I couldn't extract a clear answer from the result."
+            return NO_ANSWER_TEXT
     except Exception as e:
-        print(f"Error extracting concise answer: {e}")
-        return "I encountered an error while processing the result."
+        logger.error("Error extracting concise answer: %s", e)
+        return ANSWER_ERROR_TEXT
 
 
-def speak_with_cartesia(text: str) -> bool:
+def stream_concise_answer(original_command: str, execution_result: str) -> Iterator[str]:
     """
-    Speak the given text using Cartesia AI TTS.
+    Like extract_concise_answer, but yield the answer sentence by sentence as
+    Claude streams it, so speech can start before the whole answer exists.
     
     Args:
-        text: The text to speak
+        original_command: The original user command/query
+        execution_result: The result from executing the command
         
-    Returns:
-        True if successful, False otherwise
+    Yields:
+        Sentences of the answer (or a fallback message on failure)
+    """
+    cache_key = answer_cache_key(original_command, execution_result, TTS_SUMMARIZER_MODEL)
+    cached = get_cached_answer(cache_key)
+    if cached:
+        for sentence in _SENTENCE_END.split(cached):
+            if sentence.strip():
+                yield sentence.strip()
+        return
+    
+    pending = ""
+    spoken_any = False
+    answer = []
+    try:
+        fragments = get_claude_client().stream_text(
+            user_message=_build_answer_prompt(original_command, execution_result),
+            system_prompt=ANSWER_SYSTEM_PROMPT,
+            max_tokens=ANSWER_MAX_TOKENS,
+            model=TTS_SUMMARIZER_MODEL
+        )
+        for fragment in fragments:
+            answer.append(fragment)
+            pending += fragment
+            *sentences, pending = _SENTENCE_END.split(pending)
+            for sentence in sentences:
+                if sentence.strip():
+                    spoken_any = True
+                    yield sentence.strip()
+    except Exception as e:
+        logger.error("Error extracting concise answer: %s", e)
+        if not spoken_any:
+            yield ANSWER_ERROR_TEXT
+        return
+    
+    if pending.strip():
+        yield pending.strip()
+    elif not spoken_any:
+        yield NO_ANSWER_TEXT
+        return
+    
+    store_answer(cache_key, "".join(answer).strip())
+
+
+AUDIO_CHUNK_SIZE = 8192
+PLAYBACK_TIMEOUT = 60
+
+
+@lru_cache(maxsize=1)
+def _find_stream_player() -> Optional[str]:
+    """Return the path to ffplay if installed (it can play audio from stdin)."""
+    return shutil.which("ffplay")
+
+
+def _play_audio_chunks(chunks: Iterable[bytes], suffix: str) -> None:
     """
+    Play audio (any format the player detects) as it arrives.
+    
+    With ffplay available the chunks are piped straight into the player, so
+    playback starts with the first chunk. afplay can't read a pipe (it needs a
+    seekable file), so otherwise the audio is spooled to a temp file first;
+    `suffix` gives that file the extension afplay uses to pick a decoder.
+    
+    Raises:
+        subprocess.CalledProcessError: If the player exits with an error
+        subprocess.TimeoutExpired: If playback takes too long
+    """
+    player = _find_stream_player()
+    if player:
+        args = [player, "-nodisp", "-autoexit", "-loglevel", "error", "-i", "pipe:0"]
+        process = subprocess.Popen(args, stdin=subprocess.PIPE)
+        try:
+            for chunk in chunks:
+                process.stdin.write(chunk)
+            process.stdin.close()
+            returncode = process.wait(timeout=PLAYBACK_TIMEOUT)
+        except BaseException:
+            # Don't leave the player running on a failed download or timeout
+            process.kill()
+            process.wait()
+            raise
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, args)
+        return
+
+    with tempfile.NamedTemporaryFile(mode='wb', suffix=suffix, delete=False) as f:
+        temp_file = f.name
+        for chunk in chunks:
+            f.write(chunk)
+
+    # Play audio using afplay (macOS audio player)
+    try:
+        subprocess.run(['afplay', temp_file], check=True, timeout=PLAYBACK_TIMEOUT)
+    finally:
+        # Clean up temporary file
+        try:
+            os.unlink(temp_file)
+        except:
+            pass
+
+
+def _cartesia_output_format() -> Dict[str, Any]:
+    return CARTESIA_OUTPUT_FORMATS.get(CARTESIA_OUTPUT_FORMAT, CARTESIA_OUTPUT_FORMATS["wav"])
+
+
+def _cartesia_request(text: str) -> Dict[str, Any]:
+    """Build the Cartesia TTS request body for `text`."""
+    return {
+        "transcript": text,
+        "model_id": CARTESIA_MODEL_ID,
+        "voice": {
+            "mode": "id",
+            "id": CARTESIA_VOICE_ID
+        },
+        "output_format": _cartesia_output_format()
+    }
+
+
+def _raise_for_cartesia_status(response: requests.Response) -> None:
+    if response.status_code != 200:
+        raise requests.HTTPError(
+            f"Cartesia API returned status {response.status_code}: {response.text}",
+            response=response
+        )
+
+
+def _fetch_cartesia_audio(text: str) -> bytes:
+    """
+    Download the synthesized audio for `text` in full.
+    
+    Raises:
+        requests.RequestException: If the request fails or Cartesia returns an error
+    """
+    response = _get_cartesia_session().post(CARTESIA_TTS_URL, json=_cartesia_request(text), timeout=30)
+    _raise_for_cartesia_status(response)
+    return response.content
+
+
+def _stream_cartesia_audio(text: str) -> None:
+    """Synthesize `text` with Cartesia and play it while it downloads."""
+    data = _cartesia_request(text)
+    container = data["output_format"]["container"]
+    stats = {"bytes": 0, "first_byte": None}
+    start_time = time.perf_counter()
+    
+    def counted(chunks: Iterable[bytes]) -> Iterable[bytes]:
+        for chunk in chunks:
+            if stats["first_byte"] is None:
+                stats["first_byte"] = time.perf_counter() - start_time
+            stats["bytes"] += len(chunk)
+            yield chunk
+    
+    # Stream the body so playback can overlap the download
+    with _get_cartesia_session().post(CARTESIA_TTS_URL, json=data, timeout=30, stream=True) as response:
+        _raise_for_cartesia_status(response)
+        _play_audio_chunks(counted(response.iter_content(chunk_size=AUDIO_CHUNK_SIZE)), f".{container}")
+    
+    logger.debug(
+        "[TTS] Cartesia %s: %d bytes, first byte after %.2fs",
+        container, stats["bytes"], stats["first_byte"] or 0.0
+    )
+
+
+def _run_cartesia(play: Callable[[], None]) -> bool:
+    """Run a Cartesia fetch-and-play step, reporting any failure."""
     if not CARTESIA_API_KEY:
-        print("Error: CARTESIA_API_KEY not configured")
+        logger.error("CARTESIA_API_KEY not configured")
         return False
     
     try:
-        # Make request to Cartesia API
-        url = "https://api.cartesia.ai/tts/bytes"
-        headers = {
-            "Cartesia-Version": "2024-06-10",
-            "X-API-Key": CARTESIA_API_KEY,
-            "Content-Type": "application/json"
-        }
-        data = {
-            "transcript": text,
-            "model_id": CARTESIA_MODEL_ID,
-            "voice": {
-                "mode": "id",
-                "id": CARTESIA_VOICE_ID
-            },
-            "output_format": {
-                "container": "wav",
-                "encoding": "pcm_s16le",
-                "sample_rate": 44100
-            }
-        }
-        
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        
-        if response.status_code != 200:
-            print(f"Error: Cartesia API returned status {response.status_code}: {response.text}")
-            return False
-        
-        # Save audio to temporary file
-        with tempfile.NamedTemporaryFile(mode='wb', suffix='.wav', delete=False) as f:
-            temp_file = f.name
-            f.write(response.content)
-        
-        # Play audio using afplay (macOS audio player)
-        try:
-            subprocess.run(['afplay', temp_file], check=True, timeout=60)
-            return True
-        finally:
-            # Clean up temporary file
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
-                
+        play()
+        return True
     except requests.Timeout:
-        print("Error: Cartesia API request timed out")
+        logger.error("Cartesia API request timed out")
         return False
     except requests.RequestException as e:
-        print(f"Error: Cartesia API request failed: {e}")
+        logger.error("Cartesia API request failed: %s", e)
         return False
     except subprocess.TimeoutExpired:
-        print("Error: Audio playback timed out")
+        logger.error("Audio playback timed out")
         return False
     except Exception as e:
-        print(f"Error: Unexpected error in Cartesia TTS: {e}")
+        logger.error("Unexpected error in Cartesia TTS: %s", e)
         return False
 
 
+def speak_with_cartesia(text: str) -> bool:
+    """
+    Speak the given text using Cartesia AI TTS.
+    
+    Args:
+        text: The text to speak
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if len(text) > CARTESIA_SPLIT_LENGTH and CARTESIA_API_KEY:
+        # Long text: synthesize sentences concurrently and play them in order,
+        # so the first one starts while the rest are still being generated
+        sentences = [sentence for sentence in _SENTENCE_END.split(text.strip()) if sentence]
+        if len(sentences) > 1:
+            return _speak_in_order(sentences, use_cartesia=True, announce=False, max_fetchers=3)
+    
+    return _run_cartesia(lambda: _stream_cartesia_audio(text))
+
+
+# Serializes use of the shared synthesizer (a new utterance would cut off the current one)
+_SPEECH_LOCK = threading.Lock()
+SPEECH_POLL_INTERVAL = 0.05
+
+
+@lru_cache(maxsize=1)
+def _get_speech_synthesizer():
+    """Return a shared NSSpeechSynthesizer, or None if PyObjC's AppKit isn't available."""
+    try:
+        from AppKit import NSSpeechSynthesizer
+    except ImportError:
+        return None
+    return NSSpeechSynthesizer.alloc().init()
+
+
+def _speak_with_synthesizer(synthesizer, text: str) -> bool:
+    """Speak text on an already-loaded NSSpeechSynthesizer and wait for it to finish."""
+    with _SPEECH_LOCK:
+        if not synthesizer.startSpeakingString_(text):
+            logger.error("Failed to speak text")
+            return False
+        deadline = time.monotonic() + PLAYBACK_TIMEOUT
+        while synthesizer.isSpeaking():
+            if time.monotonic() > deadline:
+                synthesizer.stopSpeaking()
+                logger.error("Text-to-speech timed out")
+                return False
+            time.sleep(SPEECH_POLL_INTERVAL)
+    return True
+
+
 def speak_with_apple(text: str) -> bool:
     """
     Speak the given text using macOS built-in text-to-speech.
@@ -140,20 +451,25 @@ def speak_with_apple(text: str) -> bool:
         True if successful, False otherwise
     """
     try:
+        # Reuse the in-process speech engine rather than spawning 'say' each time
+        synthesizer = _get_speech_synthesizer()
+        if synthesizer is not None:
+            return _speak_with_synthesizer(synthesizer, text)
+        
         # Use native macOS 'say' command
-        subprocess.run(['say', text], check=True, timeout=60)
+        subprocess.run(['say', text], check=True, timeout=PLAYBACK_TIMEOUT)
         return True
     except subprocess.TimeoutExpired:
-        print("Error: Text-to-speech timed out")
+        logger.error("Text-to-speech timed out")
         return False
     except subprocess.CalledProcessError as e:
-        print(f"Error: Failed to speak text: {e}")
+        logger.error("Failed to speak text: %s", e)
         return False
     except FileNotFoundError:
-        print("Error: 'say' command not found. This requires macOS.")
+        logger.error("'say' command not found. This requires macOS.")
         return False
     except Exception as e:
-        print(f"Error: Unexpected error in text-to-speech: {e}")
+        logger.error("Unexpected error in text-to-speech: %s", e)
         return False
 
 
@@ -168,26 +484,84 @@ def speak_result(text: str) -> bool:
         True if successful, False otherwise
     """
     if TTS_PROVIDER == "cartesia":
-        print(f"[TTS] Using Cartesia AI (model: {CARTESIA_MODEL_ID})")
+        logger.info("[TTS] Using Cartesia AI (model: %s)", CARTESIA_MODEL_ID)
         return speak_with_cartesia(text)
     else:
-        print("[TTS] Using Apple built-in TTS")
+        logger.info("[TTS] Using Apple built-in TTS")
         return speak_with_apple(text)
 
 
-def process_and_speak_result(
-    original_command: str,
-    execution_result: Dict[str, Any],
-    command_name: str = "command"
-) -> None:
+def speak_sentences(sentences: Iterable[str]) -> bool:
     """
-    Extract a concise answer from execution result and speak it out loud.
+    Speak sentences in order as they are produced.
+    
+    A single playback thread speaks them one after another while the caller
+    keeps producing the next ones. With Cartesia, each sentence's audio is
+    also requested as soon as the sentence is known, so synthesis of the next
+    sentence overlaps playback of the current one.
     
     Args:
-        original_command: The original user command/query
-        execution_result: The execution result dictionary
-        command_name: Name of the command that was executed
+        sentences: Sentences to speak (may be a lazily produced stream)
+        
+    Returns:
+        True if every sentence was spoken, False otherwise
     """
+    use_cartesia = TTS_PROVIDER == "cartesia"
+    if use_cartesia:
+        if not CARTESIA_API_KEY:
+            logger.error("CARTESIA_API_KEY not configured")
+            return False
+        logger.info("[TTS] Using Cartesia AI (model: %s)", CARTESIA_MODEL_ID)
+    else:
+        logger.info("[TTS] Using Apple built-in TTS")
+    
+    return _speak_in_order(sentences, use_cartesia)
+
+
+def _speak_in_order(
+    sentences: Iterable[str],
+    use_cartesia: bool,
+    announce: bool = True,
+    max_fetchers: int = 2
+) -> bool:
+    """Pipeline behind speak_sentences (see there); Cartesia fetches use max_fetchers threads."""
+    suffix = f".{_cartesia_output_format()['container']}"
+    playback_queue: "queue.Queue[Optional[Tuple[str, Optional[Future]]]]" = queue.Queue()
+    results = []
+    
+    def playback_worker() -> None:
+        while True:
+            item = playback_queue.get()
+            if item is None:
+                return
+            sentence, audio = item
+            if announce:
+                logger.info("[Read Aloud] Speaking: %s", sentence)
+            if audio is None:
+                results.append(speak_with_apple(sentence))
+            else:
+                results.append(_run_cartesia(lambda: _play_audio_chunks([audio.result()], suffix)))
+    
+    player = threading.Thread(target=playback_worker, daemon=True)
+    player.start()
+    try:
+        with ThreadPoolExecutor(max_workers=max_fetchers) as pool:
+            for sentence in sentences:
+                audio = pool.submit(_fetch_cartesia_audio, sentence) if use_cartesia else None
+                playback_queue.put((sentence, audio))
+    finally:
+        playback_queue.put(None)
+        player.join()
+    
+    return bool(results) and all(results)
+
+
+def _do_process_and_speak_result(
+    original_command: str,
+    execution_result: Dict[str, Any],
+    command_name: str = "command"
+) -> None:
+    """Synchronous body of process_and_speak_result."""
     # Build the result text from execution result
     result_text = ""
     
@@ -200,21 +574,60 @@ def process_and_speak_result(
         if output:
             result_text += f"\nOutput: {output}"
     
-    # Limit the result text to avoid overwhelming Claude
-    max_length = 2000
-    if len(result_text) > max_length:
-        result_text = result_text[:max_length] + "... (truncated)"
+    # Drop noise and limit the size to keep Claude's input small
+    result_text = _condense(result_text)
     
-    print(f"[Read Aloud] Extracting answer from result for command: {command_name}")
+    plain_answer = _as_plain_answer(execution_result, result_text)
+    if plain_answer:
+        # Already short and readable; skip the Claude round-trip
+        logger.info("[Read Aloud] fast-path: speaking output of command: %s", command_name)
+        sentences = [sentence for sentence in _SENTENCE_END.split(plain_answer) if sentence]
+        success = speak_sentences(sentences)
+    elif READ_ALOUD_STREAMING:
+        logger.info("[Read Aloud] Extracting answer from result for command: %s", command_name)
+        
+        # Speak the concise answer sentence by sentence while Claude is still writing it
+        success = speak_sentences(stream_concise_answer(original_command, result_text))
+    else:
+        logger.info("[Read Aloud] Extracting answer from result for command: %s", command_name)
+        
+        concise_answer = extract_concise_answer(original_command, result_text)
+        logger.info("[Read Aloud] Speaking: %s", concise_answer)
+        success = speak_result(concise_answer)
     
-    # Extract concise answer
-    concise_answer = extract_concise_answer(original_command, result_text)
+    if not success:
+        logger.warning("[Read Aloud] Failed to speak the result")
+
+
+def process_and_speak_result(
+    original_command: str,
+    execution_result: Dict[str, Any],
+    command_name: str = "command"
+) -> Future:
+    """
+    Extract a concise answer from execution result and speak it out loud.
     
-    print(f"[Read Aloud] Speaking: {concise_answer}")
+    Runs on the read-aloud worker thread and returns immediately. There is a
+    single worker, so results queued back to back are spoken in order.
     
-    # Speak the answer
-    success = speak_result(concise_answer)
+    Args:
+        original_command: The original user command/query
+        execution_result: The execution result dictionary
+        command_name: Name of the command that was executed
+        
+    Returns:
+        Future that completes once the answer has been spoken (call
+        .result() to wait for it)
+    """
+    def run() -> None:
+        try:
+            _do_process_and_speak_result(original_command, execution_result, command_name)
+        except Exception as e:
+            logger.exception("Error in read-aloud: %s", e)
     
-    if not success:
-        print("[Read Aloud] Failed to speak the result")
+    return _TTS_EXECUTOR.submit(run)
+
 
+# Warm up the Claude connection while the app starts, so the first answer
+# extraction doesn't pay for the TLS handshake
+prewarm_claude_client_in_background()
@@ -1,18 +1,69 @@
 """Secure secret storage using the OS keychain via keyring."""
 
-from typing import Dict, List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
 
 import keyring
 from keyring.errors import KeyringError, PasswordDeleteError
 
-from config import KEYRING_SERVICE
+from config import KEYRING_SERVICE, SECRET_CACHE_TTL
 from constants import COMPOSIO_API_KEY_USERNAME
 
 
+T = TypeVar("T")
+
+# keyring username -> (value or None if absent, expires_at). Every write goes
+# through this module, drops its entry and bumps the version, so a read that
+# raced with a write skips storing what may be the old value. Only changes
+# made outside the app can be up to SECRET_CACHE_TTL seconds stale.
+_secret_cache: Dict[str, Tuple[Optional[str], float]] = {}
+_secret_cache_lock = threading.Lock()
+_secret_cache_version = 0
+
+
 def _username(server_id: str, key_name: str) -> str:
     return f"{server_id}:{key_name}"
 
 
+def _read_password(username: str) -> Optional[str]:
+    """Read a keychain entry for our service, memoized for SECRET_CACHE_TTL seconds."""
+    if SECRET_CACHE_TTL > 0:
+        with _secret_cache_lock:
+            entry = _secret_cache.get(username)
+            version = _secret_cache_version
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+
+    value = keyring.get_password(KEYRING_SERVICE, username)
+    if SECRET_CACHE_TTL > 0:
+        with _secret_cache_lock:
+            if version == _secret_cache_version:
+                _secret_cache[username] = (value, time.monotonic() + SECRET_CACHE_TTL)
+    return value
+
+
+def _forget_password(username: str) -> None:
+    global _secret_cache_version
+    with _secret_cache_lock:
+        _secret_cache.pop(username, None)
+        _secret_cache_version += 1
+
+
+def _map_keys(func: Callable[[str], T], keys: Sequence[str]) -> List[T]:
+    """
+    Apply func to each key, concurrently when there are several.
+    
+    keyring has no bulk operations, and each call is a round-trip to the OS
+    keychain service, so running them in parallel hides most of the latency.
+    """
+    if len(keys) <= 1:
+        return [func(key) for key in keys]
+    with ThreadPoolExecutor(max_workers=min(len(keys), 8)) as pool:
+        return list(pool.map(func, keys))
+
+
 def set_secret(server_id: str, key_name: str, value: Optional[str]) -> None:
     """
     Store a secret value in the keychain.
@@ -29,6 +80,8 @@ def set_secret(server_id: str, key_name: str, value: Optional[str]) -> None:
         keyring.set_password(KEYRING_SERVICE, _username(server_id, key_name), value)
     except KeyringError as exc:
         raise RuntimeError(f"Failed to store secret for {server_id}:{key_name}: {exc}") from exc
+    finally:
+        _forget_password(_username(server_id, key_name))
 
 
 def get_secret(server_id: str, key_name: str) -> Optional[str]:
@@ -37,11 +90,17 @@ def get_secret(server_id: str, key_name: str) -> Optional[str]:
         raise ValueError("server_id and key_name are required and cannot be empty")
     
     try:
-        return keyring.get_password(KEYRING_SERVICE, _username(server_id, key_name))
+        return _read_password(_username(server_id, key_name))
     except KeyringError as exc:
         raise RuntimeError(f"Failed to read secret for {server_id}:{key_name}: {exc}") from exc
 
 
+def get_secrets(server_id: str, keys: List[str]) -> Dict[str, str]:
+    """Retrieve several secrets for a server (concurrently), returning only the ones that are set."""
+    values = _map_keys(lambda key: get_secret(server_id, key), keys)
+    return {key: value for key, value in zip(keys, values) if value}
+
+
 def delete_secret(server_id: str, key_name: str) -> None:
     """Delete a stored secret. Missing secrets are ignored."""
     if not server_id or not key_name:
@@ -54,17 +113,24 @@ def delete_secret(server_id: str, key_name: str) -> None:
         return
     except KeyringError as exc:
         raise RuntimeError(f"Failed to delete secret for {server_id}:{key_name}: {exc}") from exc
+    finally:
+        _forget_password(_username(server_id, key_name))
+
+
+def delete_secrets(server_id: str, keys: Sequence[str]) -> None:
+    """Delete several secrets for a server (concurrently). Missing secrets are ignored."""
+    _map_keys(lambda key: delete_secret(server_id, key), keys)
 
 
 def list_secret_flags(server_id: str, keys: List[str]) -> Dict[str, bool]:
     """Return a mapping of key -> bool indicating if a secret is stored."""
-    flags: Dict[str, bool] = {}
-    for key in keys:
+    def is_set(key: str) -> bool:
         try:
-            flags[key] = get_secret(server_id, key) is not None
+            return get_secret(server_id, key) is not None
         except RuntimeError:
-            flags[key] = False
-    return flags
+            return False
+
+    return dict(zip(keys, _map_keys(is_set, keys)))
 
 
 # ============================================================================
@@ -85,6 +151,8 @@ def set_composio_api_key(api_key: str) -> None:
         keyring.set_password(KEYRING_SERVICE, COMPOSIO_API_KEY_USERNAME, api_key)
     except KeyringError as exc:
         raise RuntimeError(f"Failed to store Composio API key: {exc}") from exc
+    finally:
+        _forget_password(COMPOSIO_API_KEY_USERNAME)
 
 
 def get_composio_api_key() -> Optional[str]:
@@ -95,7 +163,7 @@ def get_composio_api_key() -> Optional[str]:
         Composio API key or None if not set
     """
     try:
-        return keyring.get_password(KEYRING_SERVICE, COMPOSIO_API_KEY_USERNAME)
+        return _read_password(COMPOSIO_API_KEY_USERNAME)
     except KeyringError as exc:
         raise RuntimeError(f"Failed to read Composio API key: {exc}") from exc
 
@@ -109,6 +177,8 @@ def delete_composio_api_key() -> None:
         return
     except KeyringError as exc:
         raise RuntimeError(f"Failed to delete Composio API key: {exc}") from exc
+    finally:
+        _forget_password(COMPOSIO_API_KEY_USERNAME)
 
 
 def is_composio_configured() -> bool:
@@ -5,7 +5,6 @@ Simple script to speak a phrase out loud using macOS text-to-speech.
 import sys
 import subprocess
 import argparse
-import time
 
 
 def speak(phrase: str):
@@ -26,32 +25,34 @@ def speak(phrase: str):
         sys.exit(1)
 
 
+# Built once at module level; main() only parses
+_PARSER = argparse.ArgumentParser(
+    description="Speak a phrase out loud using macOS text-to-speech"
+)
+_PARSER.add_argument(
+    "phrase",
+    type=str,
+    nargs="+",
+    help="The phrase to speak out loud"
+)
+_PARSER.add_argument(
+    "--sleep",
+    type=int,
+    required=False,
+    help="Optional sleep period in seconds after speaking before saying 'finished talking'"
+)
+
+
 def main():
-    parser = argparse.ArgumentParser(
-        description="Speak a phrase out loud using macOS text-to-speech"
-    )
-    parser.add_argument(
-        "phrase",
-        type=str,
-        nargs="+",
-        help="The phrase to speak out loud"
-    )
-    parser.add_argument(
-        "--sleep",
-        type=int,
-        required=False,
-        help="Optional sleep period in seconds after speaking before saying 'finished talking'"
-    )
-    
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
     phrase = " ".join(args.phrase)
     
-    speak(phrase)
-    
-    # If sleep period is specified, sleep and then say "finished talking"
+    # If sleep period is specified, pause and then say "finished talking". The
+    # pause is say's embedded [[slnc ms]] command, so it's all one utterance.
     if args.sleep is not None:
-        time.sleep(args.sleep)
-        speak("finished talking")
+        phrase = f"{phrase} [[slnc {args.sleep * 1000}]] finished talking"
+    
+    speak(phrase)
 
 
 if __name__ == "__main__":
@@ -1,13 +1,27 @@
 """System tray application for Wispr Action."""
 
-import webbrowser
+import base64
+import io
+import os
 import threading
-from PIL import Image, ImageDraw
-import pystray
-from pystray import MenuItem as item
+
+# pystray, PIL and webbrowser are imported where they're used, so importing
+# this module (main.py does at startup) doesn't load the GUI stack before the
+# web server and monitor are up
 
 from monitor import get_monitor
 from config import WEB_PORT
+from logger_config import setup_logging
+
+# 64x64 tray icon: white microphone on the primary colour (79, 70, 229).
+# Pre-rendered PNG so startup doesn't draw it with ImageDraw.
+_ICON_PNG_B64 = (
+    "iVBORw0KGgoAAAANSUhEUgAAAEAAAABACAIAAAAlC+aJAAAAqklEQVR42u3asQ2DMBAAQGxl"
+    "igxEShg1bQYKc9AHGvw2keG+RMj88eaFDWkav0PPkYfOAwAAAAAAAAAAoON4NBr3/XluD86v"
+    "pfqFUt31wG7eTSX5/OwPnXlSBYoTipci/zH7KqW4fRuN38LgCPeuQK1mEhnHqwQAAAAAAAAA"
+    "AAAAQLeR2n3o/llntdiWM4UAAACu0EaD21vB9moKAXiI/fQHAAAAAAAAUBwrMCkkcXTjsAUA"
+    "AAAASUVORK5CYII="
+)
 
 
 class TrayApp:
@@ -19,27 +33,13 @@ class TrayApp:
         self.web_url = f"http://localhost:{WEB_PORT}"
     
     def create_icon_image(self):
-        """Create a simple icon image for the system tray."""
-        # Create a 64x64 image with a microphone icon
-        width = 64
-        height = 64
-        image = Image.new('RGB', (width, height), color=(79, 70, 229))  # Primary color
-        
-        dc = ImageDraw.Draw(image)
-        
-        # Draw a simple microphone shape
-        # Microphone body (rounded rectangle)
-        dc.ellipse([20, 15, 44, 35], fill='white')
-        dc.rectangle([20, 25, 44, 40], fill='white')
-        
-        # Microphone stand
-        dc.rectangle([30, 40, 34, 50], fill='white')
-        dc.rectangle([22, 48, 42, 52], fill='white')
-        
-        return image
+        """Load the pre-rendered tray icon."""
+        from PIL import Image
+        return Image.open(io.BytesIO(base64.b64decode(_ICON_PNG_B64)))
     
     def open_dashboard(self, icon=None, item=None):
         """Open the web dashboard in browser."""
+        import webbrowser
         webbrowser.open(self.web_url)
     
     def start_monitor(self, icon=None, item=None):
@@ -79,6 +79,9 @@ class TrayApp:
     
     def create_menu(self):
         """Create the system tray menu."""
+        import pystray
+        from pystray import MenuItem as item
+
         return pystray.Menu(
             item(
                 'Open Dashboard',
@@ -109,6 +112,8 @@ class TrayApp:
     
     def run(self):
         """Run the system tray application."""
+        import pystray
+
         # Create icon image
         icon_image = self.create_icon_image()
         
@@ -148,5 +153,6 @@ def run_tray_app():
 
 
 if __name__ == '__main__':
+    setup_logging(os.getenv('LOG_LEVEL', 'INFO'))
     run_tray_app()
 
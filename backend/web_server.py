@@ -1,14 +1,25 @@
 """Flask web server for command management UI."""
 
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, request, jsonify, send_from_directory
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from functools import wraps
+from functools import lru_cache, wraps
 import os
 import json
+import shutil
+import atexit
 import logging
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Iterable, Optional, Tuple
 from flask_compress import Compress
+import msgspec
+import orjson
+from whitenoise import WhiteNoise
+from whitenoise.compress import Compressor
 
 from catalog_configurator import get_catalog_configurator
 from catalog_service import get_catalog_service
@@ -18,10 +29,17 @@ from constants import HTTPStatus
 from parser import parse_command
 from executor import execute
 from monitor import get_monitor
-from config import WEB_PORT
+from config import STATIC_CACHE_DIR, WEB_PORT
 from mcp_client import MCPConfigError, get_mcp_manager
-from execution_history import get_execution_logs, get_execution_count
+from execution_history import (
+    get_execution_count,
+    get_execution_log_by_id,
+    get_execution_logs,
+    start_execution_log,
+    update_execution_log,
+)
 from command_runner import execute_with_logging
+from logger_config import setup_logging
 from secret_store import (
     delete_composio_api_key,
     get_composio_api_key,
@@ -30,7 +48,29 @@ from secret_store import (
 )
 
 
-app = Flask(__name__, static_folder='../web', static_url_path='')
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, so jsonify and request.json skip the stdlib encoder."""
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        # Dates go through default() so they keep Flask's HTTP-date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        # DefaultJSONProvider.default handles dates, decimals, UUIDs and dataclasses
+        return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode()
+    
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
+# Web UI assets (index.html, js/, style.css, icons)
+WEB_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'web'))
+
+# Static files are served by WhiteNoise in front of Flask (see below)
+app = Flask(__name__, static_folder=None)
+app.json = ORJSONProvider(app)
+# Match "/api/x/" like "/api/x" instead of answering with a redirect
+app.url_map.strict_slashes = False
 CORS(app)
 
 # ===== Performance & Compression =====
@@ -38,19 +78,170 @@ CORS(app)
 app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
 # Encourage browser caching for static files; index is handled separately
 app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 60 * 60 * 24 * 30  # 30 days
-# Enable gzip compression for responses (including static assets)
+# Enable gzip compression for API responses. Level 6 (the default) costs
+# noticeably more CPU than 4 for little gain on small JSON bodies, and bodies
+# under 1 KB aren't worth compressing at all.
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 1024
 Compress(app)
 
+STATIC_MAX_AGE = 60 * 60 * 24 * 7  # 7 days
+STATIC_IMMUTABLE_SUFFIXES = ('.js', '.css', '.png', '.ico', '.svg', '.jpg', '.jpeg', '.webp')
+
+# Response headers, picked per endpoint rather than by inspecting the path
+_DEFAULT_HEADERS = {'X-Content-Type-Options': 'nosniff'}
+# Do not cache the main HTML shell, so UI updates are picked up
+_INDEX_HEADERS = {
+    **_DEFAULT_HEADERS,
+    'Cache-Control': 'no-cache, no-store, must-revalidate',
+    'Pragma': 'no-cache',
+    'Expires': '0',
+}
+_HEADER_POLICY = {'index': _INDEX_HEADERS}
+
+
+def _add_static_headers(headers, path: str, url: str) -> None:
+    """Match the API's caching policy for files served by WhiteNoise."""
+    if url == '/' or url.endswith('/index.html'):
+        for name, value in _INDEX_HEADERS.items():
+            headers[name] = value
+        return
+    if url.endswith(STATIC_IMMUTABLE_SUFFIXES):
+        # WhiteNoise's own immutable handling assumes hashed names (10-year max-age)
+        headers['Cache-Control'] = f'public, max-age={STATIC_MAX_AGE}, immutable'
+    headers['X-Content-Type-Options'] = 'nosniff'
+
+
+def build_static_cache(source: str, cache_dir: str) -> str:
+    """
+    Mirror `source` into `cache_dir` with .br/.gz sidecars next to each compressible file.
+    
+    WhiteNoise serves a sidecar whenever the client accepts that encoding, so
+    static files are compressed once (at maximum level) instead of per response.
+    The copies live outside web/ so the source tree is never written to; a file
+    is only recopied and recompressed when its size or mtime changes.
+    
+    Args:
+        source: Directory of static assets
+        cache_dir: Directory to mirror them into
+        
+    Returns:
+        The directory to serve: `cache_dir`, or `source` if the cache could not be written
+    """
+    compressor = Compressor(quiet=True)
+    sidecars = ('.br', '.gz')
+    try:
+        for dirpath, _, filenames in os.walk(source):
+            target_dir = os.path.join(cache_dir, os.path.relpath(dirpath, source))
+            os.makedirs(target_dir, exist_ok=True)
+            for name in filenames:
+                if name.endswith(sidecars):
+                    continue
+                src = os.path.join(dirpath, name)
+                dst = os.path.join(target_dir, name)
+                src_stat = os.stat(src)
+                try:
+                    dst_stat = os.stat(dst)
+                    if (dst_stat.st_size, dst_stat.st_mtime) == (src_stat.st_size, src_stat.st_mtime):
+                        continue
+                except FileNotFoundError:
+                    pass
+                shutil.copy2(src, dst)
+                # Drop outdated sidecars first; compress() skips files that don't shrink
+                for ext in sidecars:
+                    if os.path.exists(dst + ext):
+                        os.remove(dst + ext)
+                if compressor.should_compress(name):
+                    for _ in compressor.compress(dst):
+                        pass
+        
+        # Drop copies of files that were removed from source
+        for dirpath, _, filenames in os.walk(cache_dir):
+            rel_dir = os.path.relpath(dirpath, cache_dir)
+            for name in filenames:
+                original = name[:-3] if name.endswith(sidecars) else name
+                if not os.path.exists(os.path.join(source, rel_dir, original)):
+                    os.remove(os.path.join(dirpath, name))
+    except OSError as e:
+        app.logger.warning("Could not build static cache in %s, serving %s uncompressed: %s", cache_dir, source, e)
+        return source
+    return cache_dir
+
+
+STATIC_ROOT = build_static_cache(WEB_DIR, STATIC_CACHE_DIR)
+
+# Serve web/ straight from the WSGI layer: WhiteNoise scans the files once at
+# startup (precomputing ETags and lengths) and streams them with the server's
+# file wrapper, so static requests never reach Flask routing or Compress.
+app.wsgi_app = WhiteNoise(
+    app.wsgi_app,
+    root=STATIC_ROOT,
+    prefix='/',
+    index_file=True,
+    autorefresh=False,
+    max_age=STATIC_MAX_AGE,
+    add_headers_function=_add_static_headers,
+)
+
+# Request-handling threads for the production server (see run_server)
+WEB_SERVER_THREADS = 8
+
+# Commands run from the UI execute here, off the request threads
+_EXECUTE_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='cmd-exec')
+atexit.register(_EXECUTE_POOL.shutdown, wait=False)
+
+# Singletons used by the routes, bound once instead of looked up per request
+command_manager = get_command_manager()
+mcp_manager = get_mcp_manager()
+catalog_service = get_catalog_service()
+catalog_configurator = get_catalog_configurator()
+monitor = get_monitor()
+
 # ===== Constants (using shared HTTPStatus class) =====
 HTTP_OK = HTTPStatus.OK
 HTTP_CREATED = HTTPStatus.CREATED
+HTTP_ACCEPTED = HTTPStatus.ACCEPTED
 HTTP_BAD_REQUEST = HTTPStatus.BAD_REQUEST
 HTTP_NOT_FOUND = HTTPStatus.NOT_FOUND
 HTTP_INTERNAL_ERROR = HTTPStatus.INTERNAL_ERROR
 
 
+# ===== Request Bodies =====
+# Decoded straight from the raw body (one pass, type-checked); malformed or
+# mistyped bodies raise msgspec.DecodeError, which handle_errors maps to 400.
+# Every field is Optional: clients send null for unset values, which should
+# mean the default rather than a 400.
+
+class ExecuteCommandRequest(msgspec.Struct):
+    command_id: Optional[str] = None
+    parameters: Optional[Dict[str, Any]] = None
+    timeout: Optional[float] = None  # seconds
+    original_transcript: Optional[str] = None  # user's command, for read-aloud
+    sync: Optional[bool] = None
+
+
+class OAuthInitiateRequest(msgspec.Struct, rename="camel"):
+    app_name: Optional[str] = None
+    entity_id: Optional[str] = None
+    auth_config: Optional[Dict[str, Any]] = None
+    connection_name: Optional[str] = None
+
+
+class ValidatePathsRequest(msgspec.Struct):
+    paths: Optional[Dict[str, Optional[str]]] = None
+
+
+def decode_body(body_type: type):
+    """Decode the request body into a msgspec Struct."""
+    return msgspec.json.decode(request.get_data(cache=False), type=body_type)
+
+
 # ===== Response Utilities =====
 
+# Body of a success response that carries no data
+_SUCCESS_BODY = {"success": True}
+
+
 def success_response(data: Optional[Dict[str, Any]] = None, status_code: int = HTTP_OK) -> Tuple[Dict, int]:
     """
     Create a standardized success response.
@@ -62,10 +253,56 @@ def success_response(data: Optional[Dict[str, Any]] = None, status_code: int = H
     Returns:
         Tuple of (response_dict, status_code)
     """
-    response = {"success": True}
-    if data:
-        response.update(data)
-    return jsonify(response), status_code
+    if not data:
+        return jsonify(_SUCCESS_BODY), status_code
+    return jsonify({"success": True, **data}), status_code
+
+
+def fast_success_response(data: Dict[str, Any], status_code: int = HTTP_OK) -> Response:
+    """
+    Like success_response, but encodes with orjson directly.
+    
+    For large payloads; skips jsonify and the JSON provider entirely.
+    """
+    return Response(
+        orjson.dumps({"success": True, **data}, option=orjson.OPT_NON_STR_KEYS),
+        status=status_code,
+        mimetype='application/json'
+    )
+
+
+# Distinguishes this process's version-based ETags from those of a previous run
+_ETAG_BOOT_ID = uuid.uuid4().hex[:8]
+
+
+def version_etag(kind: str, version: int) -> str:
+    """Build an ETag for data identified by a manager's change counter."""
+    return f"{kind}-{_ETAG_BOOT_ID}-{version}"
+
+
+def not_modified_response(etag: str) -> Optional[Response]:
+    """Return a 304 response if the client already has this ETag, else None."""
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = Response(status=304)
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def with_etag(response: Response, etag: Optional[str] = None) -> Response:
+    """
+    Tag a GET response and turn it into a 304 if the client's copy is current.
+    
+    Without an explicit etag one is derived from the response body.
+    """
+    if etag:
+        response.set_etag(etag, weak=True)
+    else:
+        response.add_etag(weak=True)
+    # Let the browser keep the body but revalidate it on every request
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
 
 
 def error_response(error: str, status_code: int = HTTP_INTERNAL_ERROR) -> Tuple[Dict, int]:
@@ -85,6 +322,37 @@ def error_response(error: str, status_code: int = HTTP_INTERNAL_ERROR) -> Tuple[
     }), status_code
 
 
+# Query-arg values treated as true by parse_bool_arg
+_TRUE_SET = frozenset(('true', '1', 'yes', 'on'))
+
+
+def parse_bool_arg(value: str) -> bool:
+    """Query-arg converter for booleans (true/1/yes/on, case-insensitive)."""
+    return value.lower() in _TRUE_SET
+
+
+class _RateLimiter:
+    """Allows one event per interval; used to sample error tracebacks."""
+    
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self._next_allowed = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_allowed:
+                return False
+            self._next_allowed = now + self.interval
+            return True
+
+
+# Full tracebacks are costly to format; log at most one per second and a
+# one-line error for the rest (e.g. a client looping on a failing request)
+_traceback_sampler = _RateLimiter(1.0)
+
+
 def handle_errors(f):
     """
     Decorator to handle exceptions in route handlers.
@@ -97,12 +365,18 @@ def handle_errors(f):
             return f(*args, **kwargs)
         except MCPConfigError as e:
             return error_response(str(e), HTTP_BAD_REQUEST)
+        except msgspec.DecodeError as e:
+            return error_response(f"Invalid request body: {e}", HTTP_BAD_REQUEST)
         except ValueError as e:
             return error_response(str(e), HTTP_BAD_REQUEST)
         except Exception as e:
-            app.logger.exception("Unhandled error in route %s", f.__name__)
+            if _traceback_sampler.allow():
+                app.logger.exception("Unhandled error in route %s", f.__name__)
+            else:
+                app.logger.error("Unhandled error in route %s: %s", f.__name__, e)
             root_error = e
-            if isinstance(e, BaseExceptionGroup) and getattr(e, "exceptions", None):
+            if isinstance(e, BaseExceptionGroup):
+                # Exception groups always hold at least one exception
                 root_error = e.exceptions[0]
                 app.logger.error(
                     "ExceptionGroup encountered in %s with %d sub-exceptions; returning first: %s",
@@ -114,53 +388,50 @@ def handle_errors(f):
     return decorated_function
 
 
+HEALTH_CHECK_PATH = '/api/monitor/status'
+
+
 class HealthCheckFilter(logging.Filter):
     """Filter out health check requests from logs."""
     
     def filter(self, record):
-        # Filter out GET requests to /api/monitor/status
-        return not (hasattr(record, 'getMessage') and 
-                   '/api/monitor/status' in record.getMessage())
+        # Werkzeug access logs pass the request line ("GET /path HTTP/1.1") as
+        # the first arg, so check it without formatting the whole message
+        args = record.args
+        if isinstance(args, tuple) and args and isinstance(args[0], str):
+            return HEALTH_CHECK_PATH not in args[0]
+        return True
 
 @app.after_request
 def add_security_and_cache_headers(response):
     """
     Add basic security and caching headers.
-    - Cache static assets aggressively
     - Avoid caching index (so UI updates are picked up)
+    
+    Static assets never get here; WhiteNoise sets their headers.
     """
-    try:
-        path = request.path or ""
-        # Do not cache the main HTML shell
-        if path == "/" or path.endswith("/index.html"):
-            response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-            response.headers['Pragma'] = 'no-cache'
-            response.headers['Expires'] = '0'
-        else:
-            # Cache static assets longer and mark immutable for better performance
-            if path.endswith(('.js', '.css', '.png', '.ico', '.svg', '.jpg', '.jpeg', '.webp')):
-                response.headers.setdefault('Cache-Control', 'public, max-age=604800, immutable')  # 7 days
-        # Light hardening
-        response.headers.setdefault('X-Content-Type-Options', 'nosniff')
-    except Exception:
-        # Never fail the request on header addition
-        pass
+    response.headers.update(_HEADER_POLICY.get(request.endpoint, _DEFAULT_HEADERS))
     return response
 
 
 @app.route('/')
 def index():
     """Serve the main UI."""
-    return send_from_directory('../web', 'index.html')
+    # Fallback only; WhiteNoise normally answers "/" with index.html
+    return send_from_directory(WEB_DIR, 'index.html')
 
 
 @app.route('/api/commands', methods=['GET'])
 @handle_errors
 def get_commands():
     """Get all commands."""
-    manager = get_command_manager()
-    commands = manager.get_all_commands()
-    return success_response({"commands": commands})
+    etag = version_etag("cmds", command_manager.tools_version)
+    cached = not_modified_response(etag)
+    if cached:
+        return cached
+    commands = command_manager.get_all_commands()
+    response, _ = success_response({"commands": commands})
+    return with_etag(response, etag)
 
 
 @app.route('/api/commands', methods=['POST'])
@@ -168,17 +439,24 @@ def get_commands():
 def create_command():
     """Create a new command."""
     data = request.json
-    manager = get_command_manager()
-    command = manager.add_command(data)
+    command = command_manager.add_command(data)
     return success_response({"command": command}, HTTP_CREATED)
 
 
-@app.route('/api/commands/<command_id>', methods=['GET'])
+@app.route('/api/commands/<command_id>', methods=['GET', 'PUT', 'DELETE'])
 @handle_errors
+def command_detail(command_id):
+    """Get, update or delete a command (one rule for all three methods)."""
+    if request.method == 'GET':
+        return get_command(command_id)
+    if request.method == 'PUT':
+        return update_command(command_id)
+    return delete_command(command_id)
+
+
 def get_command(command_id):
     """Get a specific command."""
-    manager = get_command_manager()
-    command = manager.get_command(command_id)
+    command = command_manager.get_command(command_id)
     
     if not command:
         return error_response("Command not found", HTTP_NOT_FOUND)
@@ -186,13 +464,10 @@ def get_command(command_id):
     return success_response({"command": command})
 
 
-@app.route('/api/commands/<command_id>', methods=['PUT'])
-@handle_errors
 def update_command(command_id):
     """Update a command."""
     data = request.json
-    manager = get_command_manager()
-    command = manager.update_command(command_id, data)
+    command = command_manager.update_command(command_id, data)
     
     if not command:
         return error_response("Command not found", HTTP_NOT_FOUND)
@@ -200,12 +475,9 @@ def update_command(command_id):
     return success_response({"command": command})
 
 
-@app.route('/api/commands/<command_id>', methods=['DELETE'])
-@handle_errors
 def delete_command(command_id):
     """Delete a command."""
-    manager = get_command_manager()
-    success = manager.delete_command(command_id)
+    success = command_manager.delete_command(command_id)
     
     if not success:
         return error_response("Command not found", HTTP_NOT_FOUND)
@@ -216,16 +488,19 @@ def delete_command(command_id):
 @app.route('/api/mcp/servers', methods=['GET'])
 @handle_errors
 def list_mcp_servers():
-    manager = get_mcp_manager()
-    return success_response({"servers": manager.list_servers()})
+    etag = version_etag("servers", mcp_manager.servers_version)
+    cached = not_modified_response(etag)
+    if cached:
+        return cached
+    response, _ = success_response({"servers": mcp_manager.list_servers()})
+    return with_etag(response, etag)
 
 
 @app.route('/api/mcp/servers', methods=['POST'])
 @handle_errors
 def upsert_mcp_server():
     data = request.json or {}
-    manager = get_mcp_manager()
-    server = manager.upsert_server(data)
+    server = mcp_manager.upsert_server(data)
     status = HTTP_CREATED if not data.get('id') else HTTP_OK
     return success_response({"server": server}, status)
 
@@ -233,8 +508,7 @@ def upsert_mcp_server():
 @app.route('/api/mcp/servers/<server_id>', methods=['DELETE'])
 @handle_errors
 def delete_mcp_server(server_id):
-    manager = get_mcp_manager()
-    removed = manager.delete_server(server_id)
+    removed = mcp_manager.delete_server(server_id)
     if not removed:
         return error_response("Server not found", HTTP_NOT_FOUND)
     return success_response({"message": "Server deleted"})
@@ -246,16 +520,14 @@ def update_mcp_secrets(server_id):
     data = request.json or {}
     if not isinstance(data, dict):
         raise ValueError("Secrets payload must be an object")
-    manager = get_mcp_manager()
-    flags = manager.update_secrets(server_id, data)
+    flags = mcp_manager.update_secrets(server_id, data)
     return success_response({"secretsSet": flags})
 
 
 @app.route('/api/mcp/servers/<server_id>/test', methods=['POST'])
 @handle_errors
 def test_mcp_server(server_id):
-    manager = get_mcp_manager()
-    tools = manager.list_tools(server_id, force_refresh=True)
+    tools = mcp_manager.list_tools(server_id, force_refresh=True)
     return success_response({
         "toolsCount": len(tools),
         "message": f"Connected successfully. {len(tools)} tool(s) available."
@@ -265,46 +537,44 @@ def test_mcp_server(server_id):
 @app.route('/api/mcp/servers/<server_id>/tools', methods=['GET'])
 @handle_errors
 def list_mcp_server_tools(server_id):
-    manager = get_mcp_manager()
-    force_refresh = request.args.get('refresh', 'false').lower() == 'true'
-    tools = manager.list_tools(server_id, force_refresh=force_refresh)
+    force_refresh = request.args.get('refresh', default=False, type=parse_bool_arg)
+    tools = mcp_manager.list_tools(server_id, force_refresh=force_refresh)
     return success_response({"tools": tools})
 
 
 @app.route('/api/mcp/tools', methods=['GET'])
 @handle_errors
 def list_all_mcp_tools():
-    manager = get_mcp_manager()
-    force_refresh = request.args.get('refresh', 'false').lower() == 'true'
-    tools = manager.list_tools(force_refresh=force_refresh)
-    return success_response({"tools": tools})
+    force_refresh = request.args.get('refresh', default=False, type=parse_bool_arg)
+    tools = mcp_manager.list_tools(force_refresh=force_refresh)
+    response, _ = success_response({"tools": tools})
+    # Tool lists are refreshed on a TTL, so tag by content rather than version
+    return with_etag(response)
 
 
 @app.route('/api/mcp/catalog', methods=['GET'])
 @handle_errors
 def list_mcp_catalog():
-    catalog = get_catalog_service()
     query = request.args.get('search')
     tag = request.args.get('tag')
-    force_refresh = request.args.get('refresh', 'false').lower() == 'true'
+    force_refresh = request.args.get('refresh', default=False, type=parse_bool_arg)
     limit = request.args.get('limit', 25, type=int)
     offset = request.args.get('offset', 0, type=int)
-    result = catalog.search_entries(
+    result = catalog_service.search_entries(
         query=query,
         tag=tag,
         limit=limit,
         offset=offset,
         force_refresh=force_refresh,
     )
-    return success_response(result)
+    return with_etag(fast_success_response(result))
 
 
 @app.route('/api/mcp/catalog/<path:entry_id>', methods=['GET'])
 @handle_errors
 def get_mcp_catalog_entry(entry_id):
-    catalog = get_catalog_service()
-    force_refresh = request.args.get('refresh', 'false').lower() == 'true'
-    entry = catalog.get_entry(entry_id, force_refresh=force_refresh)
+    force_refresh = request.args.get('refresh', default=False, type=parse_bool_arg)
+    entry = catalog_service.get_entry(entry_id, force_refresh=force_refresh)
     if not entry:
         return error_response("Catalog entry not found", HTTP_NOT_FOUND)
     return success_response({"entry": entry})
@@ -313,9 +583,8 @@ def get_mcp_catalog_entry(entry_id):
 @app.route('/api/mcp/catalog/<path:entry_id>/configure', methods=['POST'])
 @handle_errors
 def configure_mcp_from_catalog(entry_id):
-    configurator = get_catalog_configurator()
     payload = request.json or {}
-    server = configurator.install_from_catalog(entry_id, payload)
+    server = catalog_configurator.install_from_catalog(entry_id, payload)
     return success_response({"server": server}, HTTP_CREATED)
 
 
@@ -323,8 +592,7 @@ def configure_mcp_from_catalog(entry_id):
 @handle_errors
 def toggle_command(command_id):
     """Toggle command enabled status."""
-    manager = get_command_manager()
-    new_status = manager.toggle_command(command_id)
+    new_status = command_manager.toggle_command(command_id)
     
     if new_status is None:
         return error_response("Command not found", HTTP_NOT_FOUND)
@@ -351,35 +619,57 @@ def test_command():
 @handle_errors
 def execute_command():
     """Execute a command with given parameters."""
-    data = request.json
-    command_id = data.get('command_id')
-    parameters = data.get('parameters', {})
-    timeout = data.get('timeout')  # Optional timeout in seconds
-    original_transcript = data.get('original_transcript')  # Original user command for read-aloud
+    body = decode_body(ExecuteCommandRequest)
+    command_id = body.command_id
+    parameters = body.parameters or {}
+    timeout = body.timeout
+    original_transcript = body.original_transcript
     
     if not command_id:
         return error_response("No command_id provided", HTTP_BAD_REQUEST)
     
-    manager = get_command_manager()
-    command = manager.get_command(command_id)
+    command = command_manager.get_command(command_id)
     
-    result, log_id, _ = execute_with_logging(
+    if body.sync:
+        result, log_id, _ = execute_with_logging(
+            command_id,
+            parameters,
+            command=command,
+            timeout=timeout,
+            confirm_mode=False,
+            original_transcript=original_transcript,
+        )
+        return success_response({"result": result.to_dict(), "log_id": log_id})
+    
+    # Run in the background so a slow command doesn't hold a server thread;
+    # the caller polls /api/logs/<log_id> for the result
+    command_name = command['name'] if command else 'Unknown Command'
+    log_id = start_execution_log(command_id, command_name, parameters)
+    _EXECUTE_POOL.submit(
+        _execute_in_background,
+        log_id,
         command_id,
         parameters,
         command=command,
         timeout=timeout,
-        confirm_mode=False,
         original_transcript=original_transcript,
     )
-    
-    return success_response({"result": result.to_dict(), "log_id": log_id})
+    return success_response({"log_id": log_id, "status": "running"}, HTTP_ACCEPTED)
+
+
+def _execute_in_background(log_id: int, command_id: str, parameters: Dict, **kwargs) -> None:
+    """Run execute_with_logging for an already-created log entry, recording crashes."""
+    try:
+        execute_with_logging(command_id, parameters, confirm_mode=False, log_id=log_id, **kwargs)
+    except Exception as e:
+        app.logger.exception("Background execution of %s failed", command_id)
+        update_execution_log(log_id, {"success": False, "error": str(e)})
 
 
 @app.route('/api/monitor/status', methods=['GET'])
 @handle_errors
 def monitor_status():
     """Get monitor status."""
-    monitor = get_monitor()
     status = monitor.get_status()
     return success_response({"status": status})
 
@@ -388,7 +678,6 @@ def monitor_status():
 @handle_errors
 def monitor_start():
     """Start the monitor."""
-    monitor = get_monitor()
     
     if monitor.is_running:
         return error_response("Monitor is already running", HTTP_BAD_REQUEST)
@@ -401,7 +690,6 @@ def monitor_start():
 @handle_errors
 def monitor_stop():
     """Stop the monitor."""
-    monitor = get_monitor()
     
     if not monitor.is_running:
         return error_response("Monitor is not running", HTTP_BAD_REQUEST)
@@ -420,13 +708,23 @@ def get_logs():
     logs = get_execution_logs(limit=limit, offset=offset)
     total_count = get_execution_count()
     
-    return success_response({
+    return fast_success_response({
         "logs": logs,
         "total": total_count,
         "has_more": (offset + len(logs)) < total_count
     })
 
 
+@app.route('/api/logs/<int:log_id>', methods=['GET'])
+@handle_errors
+def get_log(log_id):
+    """Get a single execution log (used to poll background executions)."""
+    log = get_execution_log_by_id(log_id)
+    if not log:
+        return error_response("Log not found", HTTP_NOT_FOUND)
+    return success_response({"log": log})
+
+
 # ===== Path Validation Utilities =====
 
 PATH_TYPE_MESSAGES = {
@@ -437,14 +735,14 @@ PATH_TYPE_MESSAGES = {
 }
 
 
-def resolve_validation_path(path: str, key: str, working_dir: Optional[str]) -> Optional[str]:
+def resolve_validation_path(path: str, key: str, expanded_working_dir: Optional[str]) -> Optional[str]:
     """
     Resolve and validate a path.
     
     Args:
         path: Path to resolve
         key: Path type key
-        working_dir: Optional working directory for relative paths
+        expanded_working_dir: Optional working directory for relative paths, already user-expanded
         
     Returns:
         Resolved path or None if cannot be validated
@@ -454,8 +752,8 @@ def resolve_validation_path(path: str, key: str, working_dir: Optional[str]) ->
     
     # For relative paths (except working_directory), we need a working directory
     if is_relative and key != 'working_directory':
-        if working_dir:
-            return os.path.join(os.path.expanduser(working_dir), expanded_path)
+        if expanded_working_dir:
+            return os.path.join(expanded_working_dir, expanded_path)
         else:
             return None  # Cannot validate without working directory
     
@@ -480,14 +778,33 @@ def create_validation_result(valid: bool, message: str, resolved_path: Optional[
     return result
 
 
-def validate_single_path(key: str, path: str, working_dir: Optional[str]) -> Dict:
+def check_paths_exist(paths: Iterable[str]) -> Dict[str, bool]:
+    """
+    Check which paths exist, stat-ing each distinct path once.
+    
+    os.path.exists asks the filesystem itself, so it honours macOS's
+    case- and normalization-insensitive lookups (a config naming
+    `Script.py` finds `script.py`), which matching names against a
+    directory listing would not.
+    
+    Args:
+        paths: Resolved paths to check
+        
+    Returns:
+        Dictionary mapping each path to whether it exists
+    """
+    return {path: os.path.exists(path) for path in set(paths)}
+
+
+def validate_single_path(key: str, path: str, full_path: Optional[str], exists: bool) -> Dict:
     """
-    Validate a single path.
+    Build the validation result for a single path.
     
     Args:
         key: Path type key
-        path: Path to validate
-        working_dir: Optional working directory for relative paths
+        path: Path as entered
+        full_path: Path resolved by resolve_validation_path (None if it cannot be resolved)
+        exists: Whether full_path exists
         
     Returns:
         Validation result dictionary
@@ -496,9 +813,6 @@ def validate_single_path(key: str, path: str, working_dir: Optional[str]) -> Dic
     if not path:
         return create_validation_result(True, "")
     
-    # Resolve path
-    full_path = resolve_validation_path(path, key, working_dir)
-    
     if full_path is None:
         return create_validation_result(
             False, 
@@ -506,7 +820,7 @@ def validate_single_path(key: str, path: str, working_dir: Optional[str]) -> Dic
         )
     
     # Check if path exists
-    if os.path.exists(full_path):
+    if exists:
         return create_validation_result(True, "✓ Path exists", full_path)
     
     # Generate error message based on path type
@@ -518,15 +832,25 @@ def validate_single_path(key: str, path: str, working_dir: Optional[str]) -> Dic
 @handle_errors
 def validate_paths():
     """Validate that file paths exist."""
-    data = request.json
-    paths = data.get('paths', {})
+    paths = decode_body(ValidatePathsRequest).paths or {}
     
-    # Get working directory for resolving relative paths
+    # Get working directory for resolving relative paths (expanded once for all paths)
     working_dir = paths.get('working_directory', '')
+    expanded_working_dir = os.path.expanduser(working_dir) if working_dir else ''
+    
+    # Resolve all paths first so existence checks can be batched per directory
+    resolved = {
+        key: resolve_validation_path(path, key, expanded_working_dir)
+        for key, path in paths.items()
+        if path
+    }
+    existing = check_paths_exist(full_path for full_path in resolved.values() if full_path)
     
     # Validate each path
     validation_results = {
-        key: validate_single_path(key, path, working_dir)
+        key: validate_single_path(
+            key, path, resolved.get(key), existing.get(resolved.get(key), False)
+        )
         for key, path in paths.items()
     }
     
@@ -541,6 +865,12 @@ def validate_paths():
 
 # ===== Composio OAuth Integration Endpoints =====
 
+@lru_cache(maxsize=4)
+def _get_composio_client(api_key: str) -> ComposioClient:
+    """Return a shared ComposioClient per API key, so its HTTP session is reused."""
+    return ComposioClient(api_key)
+
+
 @app.route('/api/composio/settings', methods=['GET'])
 @handle_errors
 def get_composio_settings():
@@ -561,7 +891,7 @@ def update_composio_settings():
     
     # Validate API key by attempting to create a client
     try:
-        client = ComposioClient(api_key)
+        client = _get_composio_client(api_key)
         if not client.validate_api_key():
             return error_response("Invalid Composio API key", HTTP_BAD_REQUEST)
     except ComposioError as exc:
@@ -569,6 +899,8 @@ def update_composio_settings():
     
     # Store API key
     set_composio_api_key(api_key)
+    mcp_manager.clear_composio_cache()
+    _get_composio_client.cache_clear()
     
     return success_response({"message": "Composio API key saved successfully"})
 
@@ -578,6 +910,8 @@ def update_composio_settings():
 def delete_composio_settings():
     """Delete stored Composio API key."""
     delete_composio_api_key()
+    mcp_manager.clear_composio_cache()
+    _get_composio_client.cache_clear()
     return success_response({"message": "Composio API key deleted"})
 
 
@@ -590,7 +924,7 @@ def list_composio_apps():
         return error_response("Composio API key not configured", HTTP_BAD_REQUEST)
     
     try:
-        client = ComposioClient(api_key)
+        client = _get_composio_client(api_key)
         apps = client.list_apps()
         return success_response({"apps": apps})
     except ComposioError as exc:
@@ -601,13 +935,9 @@ def list_composio_apps():
 @handle_errors
 def initiate_oauth():
     """Initiate OAuth flow for a Composio app."""
-    data = request.json or {}
-    app_name = data.get('appName')
-    entity_id = data.get('entityId', 'default')
-    auth_config = data.get('authConfig') or {}
-    connection_name = data.get('connectionName')
+    body = decode_body(OAuthInitiateRequest)
     
-    if not app_name:
+    if not body.app_name:
         return error_response("App name is required", HTTP_BAD_REQUEST)
     
     api_key = get_composio_api_key()
@@ -615,12 +945,12 @@ def initiate_oauth():
         return error_response("Composio API key not configured", HTTP_BAD_REQUEST)
     
     try:
-        client = ComposioClient(api_key)
+        client = _get_composio_client(api_key)
         result = client.initiate_connection(
-            app_name,
-            entity_id=entity_id,
-            auth_config=auth_config,
-            connection_name=connection_name,
+            body.app_name,
+            entity_id=body.entity_id or 'default',
+            auth_config=body.auth_config or {},
+            connection_name=body.connection_name,
         )
         return success_response(result)
     except ComposioError as exc:
@@ -636,7 +966,7 @@ def check_oauth_status(connection_id):
         return error_response("Composio API key not configured", HTTP_BAD_REQUEST)
     
     try:
-        client = ComposioClient(api_key)
+        client = _get_composio_client(api_key)
         connection = client.get_connection(connection_id)
         return success_response(connection)
     except ComposioError as exc:
@@ -652,7 +982,7 @@ def revoke_oauth(connection_id):
         return error_response("Composio API key not configured", HTTP_BAD_REQUEST)
     
     try:
-        client = ComposioClient(api_key)
+        client = _get_composio_client(api_key)
         success = client.delete_connection(connection_id)
         
         if not success:
@@ -679,9 +1009,18 @@ Server running at: http://localhost:{port}
 Open this URL in your browser to configure commands
 
 """)
-    app.run(host='0.0.0.0', port=port, debug=debug, use_reloader=False)
+    if debug:
+        app.run(host='0.0.0.0', port=port, debug=debug, use_reloader=False)
+        return
+    
+    # Production WSGI server. It must stay in this process (the monitor, MCP
+    # sessions and caches are in-process singletons), so scale with threads
+    # rather than worker processes.
+    from waitress import serve
+    serve(app, host='0.0.0.0', port=port, threads=WEB_SERVER_THREADS, ident='wispr-action')
 
 
 if __name__ == '__main__':
+    setup_logging(os.getenv('LOG_LEVEL', 'INFO'))
     run_server()
 
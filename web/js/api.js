@@ -68,12 +68,15 @@ function scheduleConnectionErrorCheck() {
 
 /**
  * Generic API call wrapper with error handling
+ * 
+ * Pass `silent: true` to leave error display to the caller.
  */
 export async function apiCall(endpoint, options = {}) {
     try {
         const {
             cache,
             headers,
+            silent,
             ...rest
         } = options;
 
@@ -112,7 +115,7 @@ export async function apiCall(endpoint, options = {}) {
         }
         
         // For execution endpoint, let the caller handle the error display
-        if (!endpoint.includes('/api/commands/execute')) {
+        if (!silent && !endpoint.includes('/api/commands/execute')) {
             if (isConnectionError) {
                 scheduleConnectionErrorCheck();
             } else {
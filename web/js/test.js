@@ -7,6 +7,10 @@ import { showModal, showConfirm, showToast, escapeHtml } from './ui.js';
 import { focusHistorySection, loadExecutionHistory } from './history.js';
 import { renderParameters } from './components.js';
 
+const EXECUTION_POLL_INTERVAL = 500; // ms
+const EXECUTION_WAIT_DEFAULT = 5 * 60 * 1000; // ms, for commands without a timeout
+const EXECUTION_WAIT_GRACE = 10 * 1000; // ms on top of the command's own timeout
+
 /**
  * Test parse a phrase
  */
@@ -66,6 +70,30 @@ function displayTestResult(result) {
     }
 }
 
+/**
+ * Poll an execution log until the command has returned its result
+ * 
+ * Scripts keep their log 'running' after launch, so wait for `success` to be
+ * filled in rather than for the status to change.
+ * 
+ * Polling errors are thrown to the caller rather than shown by apiCall.
+ * 
+ * @param {number} logId - Log id returned by /api/commands/execute
+ * @param {number} maxWait - Give up after this many ms
+ * @returns {Promise<object>} The log's result (success, output, error, ...)
+ */
+async function waitForExecution(logId, maxWait = EXECUTION_WAIT_DEFAULT) {
+    const deadline = Date.now() + maxWait;
+    while (Date.now() < deadline) {
+        const data = await apiCall(`/api/logs/${logId}`, { silent: true });
+        if (data.log.result.success !== null) {
+            return data.log.result;
+        }
+        await new Promise(resolve => setTimeout(resolve, EXECUTION_POLL_INTERVAL));
+    }
+    throw new Error('Timed out waiting for the command to finish. Check the History tab for its result.');
+}
+
 /**
  * Execute the tested command
  */
@@ -106,6 +134,7 @@ export async function testExecute() {
             requestBody.original_transcript = testPhrase;
         }
         
+        // The backend runs the command in the background and returns its log id
         const data = await apiCall('/api/commands/execute', {
             method: 'POST',
             body: JSON.stringify(requestBody)
@@ -114,7 +143,12 @@ export async function testExecute() {
         // Check if this is an async script command
         const isAsyncScript = command && command.action && command.action.type === 'script';
         
-        if (data.result.success) {
+        const maxWait = commandTimeout && commandTimeout > 0
+            ? commandTimeout * 1000 + EXECUTION_WAIT_GRACE
+            : EXECUTION_WAIT_DEFAULT;
+        const result = await waitForExecution(data.log_id, maxWait);
+        
+        if (result.success) {
             if (isAsyncScript) {
                 // For async scripts, show a toast and switch to history view
                 showToast('Command launched! Check History tab for status', 'success', 4000);
@@ -122,7 +156,7 @@ export async function testExecute() {
             } else {
                 // For sync commands (HTTP), show modal with result
                 showModal(
-                    data.result.output || 'No output',
+                    result.output || 'No output',
                     'Execution Successful',
                     'success'
                 );
@@ -130,7 +164,7 @@ export async function testExecute() {
             loadExecutionHistory(0);
         } else {
             showModal(
-                data.result.error || 'Command execution failed',
+                result.error || 'Command execution failed',
                 'Execution Failed',
                 'error'
             );